@@ -1,12 +1,18 @@
-def solve_part1(input_filename='day01-input.txt'):
-    """Count times the dial lands on 0 after a rotation."""
-    import os
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    with open(input_file, 'r') as f:
-        instructions = [line.strip() for line in f.readlines()]
+from parse_cache import cached_parse
+from puzzle_input import open_input
+
+
+@cached_parse
+def parse_input(input_filename):
+    """Parse the input file into a list of rotations like 'L68'."""
+    with open_input(input_filename) as data:
+        instructions = [line.decode() for line in data.lines()]
     
+    return instructions
+
+
+def count_zero_landings(instructions):
+    """Count times the dial lands on 0 after a rotation."""
     position = 50
     zero_count = 0
     
@@ -25,15 +31,8 @@ def solve_part1(input_filename='day01-input.txt'):
     return zero_count
 
 
-def solve_part2(input_filename='day01-input.txt'):
+def count_zero_passes(instructions):
     """Count all times the dial points at 0, including during rotations."""
-    import os
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    with open(input_file, 'r') as f:
-        instructions = [line.strip() for line in f.readlines()]
-    
     position = 50
     zero_count = 0
     
@@ -63,6 +62,22 @@ def solve_part2(input_filename='day01-input.txt'):
     return zero_count
 
 
+def solve_part1(input_filename='day01-input.txt'):
+    """Count times the dial lands on 0 after a rotation."""
+    return count_zero_landings(parse_input(input_filename))
+
+
+def solve_part2(input_filename='day01-input.txt'):
+    """Count all times the dial points at 0, including during rotations."""
+    return count_zero_passes(parse_input(input_filename))
+
+
+def solve_both(input_filename='day01-input.txt'):
+    """Solve both parts from a single parse of the input."""
+    instructions = parse_input(input_filename)
+    return count_zero_landings(instructions), count_zero_passes(instructions)
+
+
 def solve(input_filename='day01-input.txt'):
     return solve_part1(input_filename)
 
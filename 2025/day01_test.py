@@ -1,8 +1,13 @@
 import unittest
-from day01 import solve_part1, solve_part2
+from day01 import solve_part1, solve_part2, solve_both
 
 
 class TestDay01(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day01-input.txt')
+    
     def test_part1_with_test_input(self):
         """Test that the test input returns 3 zero crossings for part 1"""
         result = solve_part1('day01-test.txt')
@@ -13,15 +18,19 @@ class TestDay01(unittest.TestCase):
         result = solve_part2('day01-test.txt')
         self.assertEqual(result, 6, f"Expected 6 zero crossings (including during rotations), got {result}")
     
+    def test_solve_both_with_test_input(self):
+        """solve_both gives both test answers from a single parse."""
+        self.assertEqual(solve_both('day01-test.txt'), (3, 6))
+    
     def test_part1_with_main_input(self):
         """Test part 1 with the main puzzle input"""
-        result = solve_part1('day01-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: The dial lands on 0 a total of {result} times")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Test part 2 with the main puzzle input"""
-        result = solve_part2('day01-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: The dial points at 0 a total of {result} times")
         self.assertGreater(result, 0)
 
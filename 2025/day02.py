@@ -1,4 +1,5 @@
-import os
+from parse_cache import cached_parse
+from puzzle_input import open_input
 
 
 def is_invalid_id_part1(n):
@@ -37,45 +38,40 @@ def find_invalid_ids_in_range(start, end, checker=is_invalid_id_part1):
     return invalid_ids
 
 
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file and return list of (start, end) ranges."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    ranges = []
-    with open(input_file, 'r') as f:
-        content = f.read().replace('\n', '')
-        for part in content.split(','):
-            part = part.strip()
-            if not part:
-                continue
-            start, end = part.split('-')
-            ranges.append((int(start), int(end)))
-    return ranges
+    with open_input(input_filename) as data:
+        bounds = data.ints(signed=False)
+        return list(zip(bounds, bounds))
 
 
-def solve_part1(input_filename='day02-input.txt'):
-    """Sum all invalid IDs (repeated twice) in the given ranges."""
-    ranges = parse_input(input_filename)
-    
+def sum_invalid_ids(ranges, checker):
+    """Sum the IDs in all ranges that the checker flags as invalid."""
     total = 0
     for start, end in ranges:
-        invalid_ids = find_invalid_ids_in_range(start, end, is_invalid_id_part1)
+        invalid_ids = find_invalid_ids_in_range(start, end, checker)
         total += sum(invalid_ids)
     
     return total
 
 
+def solve_part1(input_filename='day02-input.txt'):
+    """Sum all invalid IDs (repeated twice) in the given ranges."""
+    ranges = parse_input(input_filename)
+    return sum_invalid_ids(ranges, is_invalid_id_part1)
+
+
 def solve_part2(input_filename='day02-input.txt'):
     """Sum all invalid IDs (repeated at least twice) in the given ranges."""
     ranges = parse_input(input_filename)
-    
-    total = 0
-    for start, end in ranges:
-        invalid_ids = find_invalid_ids_in_range(start, end, is_invalid_id_part2)
-        total += sum(invalid_ids)
-    
-    return total
+    return sum_invalid_ids(ranges, is_invalid_id_part2)
+
+
+def solve_both(input_filename='day02-input.txt'):
+    """Solve both parts from a single parse of the input."""
+    ranges = parse_input(input_filename)
+    return sum_invalid_ids(ranges, is_invalid_id_part1), sum_invalid_ids(ranges, is_invalid_id_part2)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,13 @@
 import unittest
-from day02 import is_invalid_id_part1, is_invalid_id_part2, find_invalid_ids_in_range, solve_part1, solve_part2
+from day02 import is_invalid_id_part1, is_invalid_id_part2, find_invalid_ids_in_range, solve_part1, solve_part2, solve_both
 
 
 class TestDay02(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day02-input.txt')
+    
     def test_is_invalid_id_part1(self):
         """Test the part 1 invalid ID checker (exactly twice)."""
         self.assertTrue(is_invalid_id_part1(55))
@@ -73,15 +78,19 @@ class TestDay02(unittest.TestCase):
         result = solve_part2('day02-test.txt')
         self.assertEqual(result, 4174379265)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both gives both test answers from a single parse."""
+        self.assertEqual(solve_both('day02-test.txt'), (1227775554, 4174379265))
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day02-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day02-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
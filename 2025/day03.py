@@ -1,13 +1,12 @@
-import os
+from parse_cache import cached_parse
+from puzzle_input import open_input
 
 
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    with open(input_file, 'r') as f:
-        lines = [line.strip() for line in f.readlines() if line.strip()]
+    with open_input(input_filename) as data:
+        lines = [line.decode() for line in data.lines()]
     
     return lines
 
@@ -50,10 +49,8 @@ def max_joltage_n(bank, n):
     return int(''.join(result))
 
 
-def solve_part1(input_filename='day03-input.txt'):
-    """Solve part 1."""
-    banks = parse_input(input_filename)
-    
+def total_joltage(banks):
+    """Sum the best two-battery joltage of every bank."""
     total = 0
     for bank in banks:
         total += max_joltage(bank)
@@ -61,17 +58,33 @@ def solve_part1(input_filename='day03-input.txt'):
     return total
 
 
-def solve_part2(input_filename='day03-input.txt'):
-    """Solve part 2."""
-    banks = parse_input(input_filename)
-    
+def total_joltage_n(banks, n=12):
+    """Sum the best n-battery joltage of every bank."""
     total = 0
     for bank in banks:
-        total += max_joltage_n(bank, 12)
+        total += max_joltage_n(bank, n)
     
     return total
 
 
+def solve_part1(input_filename='day03-input.txt'):
+    """Solve part 1."""
+    banks = parse_input(input_filename)
+    return total_joltage(banks)
+
+
+def solve_part2(input_filename='day03-input.txt'):
+    """Solve part 2."""
+    banks = parse_input(input_filename)
+    return total_joltage_n(banks, 12)
+
+
+def solve_both(input_filename='day03-input.txt'):
+    """Solve both parts from a single parse of the input."""
+    banks = parse_input(input_filename)
+    return total_joltage(banks), total_joltage_n(banks, 12)
+
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
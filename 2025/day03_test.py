@@ -1,8 +1,13 @@
 import unittest
-from day03 import solve_part1, solve_part2, max_joltage, max_joltage_n
+from day03 import solve_part1, solve_part2, max_joltage, max_joltage_n, solve_both
 
 
 class TestDay03(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day03-input.txt')
+    
     def test_max_joltage_examples(self):
         """Test individual bank examples."""
         self.assertEqual(max_joltage("987654321111111"), 98)
@@ -27,15 +32,19 @@ class TestDay03(unittest.TestCase):
         result = solve_part2('day03-test.txt')
         self.assertEqual(result, 3121910778619)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both gives both test answers from a single parse."""
+        self.assertEqual(solve_both('day03-test.txt'), (357, 3121910778619))
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day03-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day03-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
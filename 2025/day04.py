@@ -1,75 +1,69 @@
-import os
+from grid import Grid
+from parse_cache import cached_parse
+from puzzle_input import open_input
 
 
+@cached_parse
 def parse_input(input_filename):
-    """Parse the input file."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    with open(input_file, 'r') as f:
-        lines = [line.strip() for line in f.readlines() if line.strip()]
-    
-    return lines
+    """Parse the input file into a Grid."""
+    with open_input(input_filename) as data:
+        return Grid.from_lines(list(data.lines()))
 
 
-def count_adjacent_rolls(grid, row, col):
-    """Count the number of rolls (@) in the 8 adjacent positions."""
-    count = 0
-    rows = len(grid)
-    cols = len(grid[0])
-    
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
-                continue
-            nr, nc = row + dr, col + dc
-            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == '@':
-                count += 1
-    
-    return count
+def count_adjacent_rolls(grid):
+    """Count the number of rolls (@) in the 8 adjacent positions of every cell."""
+    return grid.neighbor_count('@')
 
 
-def solve_part1(input_filename='day04-input.txt'):
-    """Solve part 1 - count rolls accessible by forklift (fewer than 4 adjacent rolls)."""
-    grid = parse_input(input_filename)
-    
-    accessible = 0
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == '@':
-                if count_adjacent_rolls(grid, row, col) < 4:
-                    accessible += 1
-    
-    return accessible
+def find_accessible(grid):
+    """Mask of rolls the forklift can reach (fewer than 4 adjacent rolls)."""
+    return grid.mask('@') & (count_adjacent_rolls(grid) < 4)
 
 
-def solve_part2(input_filename='day04-input.txt'):
-    """Solve part 2 - keep removing accessible rolls until none remain accessible."""
-    lines = parse_input(input_filename)
-    # Convert to mutable grid
-    grid = [list(line) for line in lines]
+def remove_accessible_rolls(grid):
+    """Keep removing accessible rolls until none remain accessible.
+    
+    Returns (removed in the first round, removed in total); the first
+    round is exactly the part 1 answer.
+    """
+    grid = grid.copy()
     
+    first_round = None
     total_removed = 0
     
     while True:
         # Find all currently accessible rolls
-        accessible = []
-        for row in range(len(grid)):
-            for col in range(len(grid[0])):
-                if grid[row][col] == '@':
-                    if count_adjacent_rolls(grid, row, col) < 4:
-                        accessible.append((row, col))
+        accessible = find_accessible(grid)
+        removed = int(accessible.sum())
+        if first_round is None:
+            first_round = removed
         
-        if not accessible:
+        if not removed:
             break
         
         # Remove all accessible rolls
-        for row, col in accessible:
-            grid[row][col] = '.'
-        
-        total_removed += len(accessible)
+        grid.set_where(accessible, '.')
+        total_removed += removed
     
-    return total_removed
+    return first_round, total_removed
+
+
+def solve_part1(input_filename='day04-input.txt'):
+    """Solve part 1 - count rolls accessible by forklift (fewer than 4 adjacent rolls)."""
+    grid = parse_input(input_filename)
+    return int(find_accessible(grid).sum())
+
+
+def solve_part2(input_filename='day04-input.txt'):
+    """Solve part 2 - keep removing accessible rolls until none remain accessible."""
+    grid = parse_input(input_filename)
+    return remove_accessible_rolls(grid)[1]
+
+
+def solve_both(input_filename='day04-input.txt'):
+    """Solve both parts; part 1 is the first round of part 2's removals."""
+    grid = parse_input(input_filename)
+    return remove_accessible_rolls(grid)
 
 
 if __name__ == "__main__":
@@ -1,58 +1,32 @@
-import os
+from bisect import bisect_right
 
+from parse_cache import cached_parse
+from puzzle_input import open_input
 
+
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    with open(input_file, 'r') as f:
-        content = f.read().strip()
-    
     # Split by blank line - first section is ranges, second is ingredient IDs
-    sections = content.split('\n\n')
+    with open_input(input_filename) as data:
+        range_lines, id_lines = data.sections()
     
     # Parse ranges (e.g., "3-5" -> (3, 5))
     ranges = []
-    for line in sections[0].split('\n'):
-        if line.strip():
-            start, end = line.strip().split('-')
-            ranges.append((int(start), int(end)))
+    for line in range_lines:
+        start, end = line.split(b'-')
+        ranges.append((int(start), int(end)))
     
     # Parse ingredient IDs
-    ingredient_ids = []
-    for line in sections[1].split('\n'):
-        if line.strip():
-            ingredient_ids.append(int(line.strip()))
+    ingredient_ids = [int(line) for line in id_lines]
     
     return ranges, ingredient_ids
 
 
-def is_fresh(ingredient_id, ranges):
-    """Check if an ingredient ID falls within any fresh range."""
-    for start, end in ranges:
-        if start <= ingredient_id <= end:
-            return True
-    return False
-
-
-def solve_part1(input_filename='day05-input.txt'):
-    """Solve part 1."""
-    ranges, ingredient_ids = parse_input(input_filename)
-    
-    # Count how many ingredient IDs are fresh
-    fresh_count = 0
-    for ingredient_id in ingredient_ids:
-        if is_fresh(ingredient_id, ranges):
-            fresh_count += 1
-    
-    return fresh_count
-
-
-def merge_ranges(ranges):
-    """Merge overlapping ranges and return the total count of unique IDs."""
+def merge_overlapping(ranges):
+    """Merge overlapping or adjacent ranges into a sorted list of disjoint ranges."""
     if not ranges:
-        return 0
+        return []
     
     # Sort ranges by start position
     sorted_ranges = sorted(ranges)
@@ -71,7 +45,11 @@ def merge_ranges(ranges):
             # No overlap, add as a new range
             merged.append((current_start, current_end))
     
-    # Count total IDs in all merged ranges
+    return merged
+
+
+def count_covered(merged):
+    """Count total IDs in disjoint merged ranges."""
     total = 0
     for start, end in merged:
         total += (end - start + 1)  # +1 because ranges are inclusive
@@ -79,6 +57,31 @@ def merge_ranges(ranges):
     return total
 
 
+def merge_ranges(ranges):
+    """Merge overlapping ranges and return the total count of unique IDs."""
+    return count_covered(merge_overlapping(ranges))
+
+
+def count_fresh(ingredient_ids, merged):
+    """Count ingredient IDs inside the merged ranges using binary search."""
+    starts = [start for start, _ in merged]
+    fresh_count = 0
+    for ingredient_id in ingredient_ids:
+        idx = bisect_right(starts, ingredient_id) - 1
+        if idx >= 0 and ingredient_id <= merged[idx][1]:
+            fresh_count += 1
+    
+    return fresh_count
+
+
+def solve_part1(input_filename='day05-input.txt'):
+    """Solve part 1."""
+    ranges, ingredient_ids = parse_input(input_filename)
+    
+    # Count how many ingredient IDs are fresh
+    return count_fresh(ingredient_ids, merge_overlapping(ranges))
+
+
 def solve_part2(input_filename='day05-input.txt'):
     """Solve part 2."""
     ranges, ingredient_ids = parse_input(input_filename)
@@ -89,6 +92,13 @@ def solve_part2(input_filename='day05-input.txt'):
     return result
 
 
+def solve_both(input_filename='day05-input.txt'):
+    """Solve both parts from one parse and one merge of the ranges."""
+    ranges, ingredient_ids = parse_input(input_filename)
+    merged = merge_overlapping(ranges)
+    return count_fresh(ingredient_ids, merged), count_covered(merged)
+
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
@@ -1,14 +1,13 @@
-import os
+from parse_cache import cached_parse
+from puzzle_input import open_input
 
 
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    with open(input_file, 'r') as f:
+    with open_input(input_filename) as data:
         # Don't strip - we need to preserve spacing
-        lines = [line.rstrip('\n') for line in f.readlines()]
+        lines = [line.decode() for line in data.lines(strip=False, keep_blank=True)]
     
     return lines
 
@@ -89,9 +88,8 @@ def solve_problem(problem_lines):
     return result
 
 
-def solve_part1(input_filename='day06-input.txt'):
-    """Solve part 1."""
-    lines = parse_input(input_filename)
+def sum_answers(lines):
+    """Sum the answers to every problem read the usual way."""
     problems = parse_worksheet(lines)
     
     grand_total = 0
@@ -102,6 +100,12 @@ def solve_part1(input_filename='day06-input.txt'):
     return grand_total
 
 
+def solve_part1(input_filename='day06-input.txt'):
+    """Solve part 1."""
+    lines = parse_input(input_filename)
+    return sum_answers(lines)
+
+
 def parse_worksheet_cephalopod(lines):
     """Parse the worksheet reading right-to-left in cephalopod math style.
     
@@ -191,9 +195,8 @@ def solve_problem_cephalopod(operator, numbers):
     return 0
 
 
-def solve_part2(input_filename='day06-input.txt'):
-    """Solve part 2."""
-    lines = parse_input(input_filename)
+def sum_answers_cephalopod(lines):
+    """Sum the answers to every problem read in cephalopod math style."""
     problems = parse_worksheet_cephalopod(lines)
     
     grand_total = 0
@@ -204,6 +207,18 @@ def solve_part2(input_filename='day06-input.txt'):
     return grand_total
 
 
+def solve_part2(input_filename='day06-input.txt'):
+    """Solve part 2."""
+    lines = parse_input(input_filename)
+    return sum_answers_cephalopod(lines)
+
+
+def solve_both(input_filename='day06-input.txt'):
+    """Solve both parts from a single parse of the input."""
+    lines = parse_input(input_filename)
+    return sum_answers(lines), sum_answers_cephalopod(lines)
+
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
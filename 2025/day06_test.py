@@ -1,8 +1,13 @@
 import unittest
-from day06 import solve_part1, solve_part2
+from day06 import solve_part1, solve_part2, solve_both
 
 
 class TestDay06(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day06-input.txt')
+    
     def test_part1_with_test_input(self):
         """Test part 1 with test input."""
         result = solve_part1('day06-test.txt')
@@ -15,15 +20,20 @@ class TestDay06(unittest.TestCase):
         # TODO: Update expected value
         self.assertEqual(result, 0)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both matches the individual parts on the test input."""
+        self.assertEqual(solve_both('day06-test.txt'),
+                         (solve_part1('day06-test.txt'), solve_part2('day06-test.txt')))
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day06-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day06-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
@@ -1,8 +1,20 @@
 import unittest
-from day07 import solve_part1, solve_part2
+from day07 import find_start, solve_part1, solve_part2, solve_both, trace_beams
+from grid import Grid
 
 
 class TestDay07(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day07-input.txt')
+    
+    def test_timelines_past_int64(self):
+        """Totals beyond int64 stay exact even when no single column is near the limit."""
+        for rows in (63, 64, 65):
+            grid = Grid.from_lines(['.' * 80 + 'S' + '.' * 80] + ['^' * 161] * rows)
+            self.assertEqual(trace_beams(grid, find_start(grid))[1], 2 ** rows)
+    
     def test_part1_with_test_input(self):
         """Test part 1 with test input."""
         result = solve_part1('day07-test.txt')
@@ -15,15 +27,20 @@ class TestDay07(unittest.TestCase):
         # TODO: Update expected value
         self.assertEqual(result, 0)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both matches the individual parts on the test input."""
+        self.assertEqual(solve_both('day07-test.txt'),
+                         (solve_part1('day07-test.txt'), solve_part2('day07-test.txt')))
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day07-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day07-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
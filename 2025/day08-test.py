@@ -1,8 +1,15 @@
+import random
 import unittest
-from day08 import solve_part1, solve_part2
+from day08 import (OnlineCircuits, closest_pairs, connect_all, connect_closest, parse_input, solve_part1, solve_part2, solve_both, solve_exhaustive,
+                   solve_sweep, spanning_tree_edges)
 
 
 class TestDay08(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day08-input.txt')
+    
     def test_part1_with_test_input(self):
         """Test part 1 with test input - 10 connections should give 40."""
         result = solve_part1('day08-test.txt', num_connections=10)
@@ -14,15 +21,56 @@ class TestDay08(unittest.TestCase):
         # Product of X coordinates: 216 * 117 = 25272
         self.assertEqual(result, 25272)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both gives both test answers from one parse."""
+        self.assertEqual(solve_both('day08-test.txt', num_connections=10), (40, 25272))
+    
+    def test_solve_exhaustive_with_test_input(self):
+        """Measuring every pair in small tiles gives the same answers."""
+        self.assertEqual(solve_exhaustive('day08-test.txt', num_connections=10, tile=4, batch=16), (40, 25272))
+    
+    def test_solve_sweep_with_test_input(self):
+        """One sweep reports every threshold, matching part 1 run at each."""
+        snapshots = solve_sweep('day08-test.txt', [1, 10, 5, 1000])
+        self.assertEqual(sorted(snapshots), [1, 5, 10, 1000])
+        for threshold, (product, circuits, largest) in snapshots.items():
+            self.assertEqual(product, solve_part1('day08-test.txt', num_connections=threshold))
+        self.assertEqual(snapshots[1], (2, 19, 2))
+        self.assertEqual(snapshots[1000], (20, 1, 20))
+    
+    def test_online_circuits_with_test_input(self):
+        """Inserting boxes one at a time keeps both answers current."""
+        coords = parse_input('day08-test.txt')
+        online = OnlineCircuits(coords[:10])
+        self.assertEqual(online.last_connection(), connect_all(coords[:10], spanning_tree_edges(coords[:10])))
+        for point in coords[10:]:
+            online.insert(point)
+        self.assertEqual(online.last_connection(), 25272)
+        self.assertEqual(online.connections(10), 40)
+    
+    def test_online_connections_stay_current(self):
+        """Tracked connection counts match a fresh solve after every insert."""
+        rng = random.Random(16)
+        # A small cube, so plenty of pairs tie on distance
+        coords = [tuple(rng.randrange(12) for _ in range(3)) for _ in range(80)]
+        online = OnlineCircuits(coords[:2])
+        for num_connections in (0, 1, 10, 60):
+            online.connections(num_connections)
+        for n in range(3, len(coords) + 1):
+            online.insert(coords[n - 1])
+            for num_connections in (0, 1, 10, 60):
+                expected = connect_closest(n, closest_pairs(coords[:n], num_connections), num_connections)
+                self.assertEqual(online.connections(num_connections), expected)
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day08-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day08-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
@@ -1,129 +1,285 @@
-import os
-import math
-from collections import defaultdict
+import heapq
 
+from link_cut import LinkCutTree
+from parse_cache import cached_parse
+from puzzle_input import open_input
+from spatial import PointGrid, as_points, k_closest_pairs, spanning_tree, tiled_k_closest, tiled_pairs
+from union_find import UnionFind
 
+
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file into list of (x, y, z) coordinates."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    coords = []
-    with open(input_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                x, y, z = map(int, line.split(','))
-                coords.append((x, y, z))
-    
-    return coords
-
-
-def distance(p1, p2):
-    """Calculate Euclidean distance between two 3D points."""
-    return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2 + (p1[2] - p2[2])**2)
-
-
-class UnionFind:
-    """Union-Find data structure for tracking circuits."""
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.size = [1] * n
-    
-    def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-    
-    def union(self, x, y):
-        """Union two sets. Returns True if they were in different sets."""
-        px, py = self.find(x), self.find(y)
-        if px == py:
-            return False
-        
-        if self.rank[px] < self.rank[py]:
-            px, py = py, px
-        self.parent[py] = px
-        self.size[px] += self.size[py]
-        if self.rank[px] == self.rank[py]:
-            self.rank[px] += 1
-        return True
-    
-    def get_circuit_sizes(self):
-        """Get sizes of all circuits."""
-        sizes = defaultdict(int)
-        for i in range(len(self.parent)):
-            root = self.find(i)
-            sizes[root] = self.size[root]
-        return list(sizes.values())
+    with open_input(input_filename) as data:
+        values = data.ints()
+        return list(zip(values, values, values))
 
 
-def solve_part1(input_filename='day08-input.txt', num_connections=1000):
-    """Connect the closest pairs and return product of 3 largest circuit sizes."""
-    coords = parse_input(input_filename)
-    n = len(coords)
-    
-    # Calculate all pairwise distances
-    distances = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = distance(coords[i], coords[j])
-            distances.append((dist, i, j))
+def closest_pairs(coords, num_connections):
+    """Return the num_connections closest pairs as (squared distance, i, j) arrays, closest first.
     
-    # Sort by distance
-    distances.sort()
-    
-    # Use Union-Find to connect pairs
-    uf = UnionFind(n)
-    
-    # Process the first num_connections pairs (whether they connect or not)
-    for idx in range(min(num_connections, len(distances))):
-        dist, i, j = distances[idx]
-        uf.union(i, j)  # May or may not actually connect
-    
-    # Get the 3 largest circuit sizes and multiply
-    sizes = sorted(uf.get_circuit_sizes(), reverse=True)
+    Uses a spatial hash, so only pairs near the cutoff are ever measured.
+    """
+    return k_closest_pairs(as_points(coords), num_connections)
+
+
+def spanning_tree_edges(coords):
+    """Return the minimum spanning tree edges as (squared distance, i, j) in Kruskal order."""
+    distances, i, j = spanning_tree(as_points(coords))
+    return list(zip(distances.tolist(), i.tolist(), j.tolist()))
+
+
+def largest_three_product(uf):
+    """Product of the 3 largest circuit sizes."""
+    sizes = uf.top_sizes(3)
     # Pad with 1s if we have fewer than 3 circuits
     while len(sizes) < 3:
         sizes.append(1)
     return sizes[0] * sizes[1] * sizes[2]
 
 
-def solve_part2(input_filename='day08-input.txt'):
-    """Connect all junction boxes into one circuit, return product of X coords of last pair."""
-    coords = parse_input(input_filename)
-    n = len(coords)
+def connect_closest(n, pairs, num_connections):
+    """Connect the closest pairs and return product of 3 largest circuit sizes."""
+    # Join the first num_connections pairs (whether they connect or not) in one batch
+    distances, first, second = pairs
+    uf = UnionFind(n)
+    uf.union_many(first[:num_connections], second[:num_connections])
+    return largest_three_product(uf)
+
+
+def sweep_connections(coords, thresholds):
+    """Connect the closest pairs once, taking a snapshot at each threshold.
     
-    # Calculate all pairwise distances
-    distances = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = distance(coords[i], coords[j])
-            distances.append((dist, i, j))
+    Returns {threshold: (product of 3 largest circuits, circuit count,
+    largest circuit)} after the first threshold pairs are connected. The
+    pairs are found and joined once, up to the largest threshold.
+    """
+    checkpoints = sorted(set(thresholds))
+    if not checkpoints:
+        return {}
     
-    # Sort by distance
-    distances.sort()
+    distances, first, second = closest_pairs(coords, checkpoints[-1])
+    uf = UnionFind(len(coords))
+    joined = 0
+    snapshots = {}
+    for threshold in checkpoints:
+        uf.union_many(first[joined:threshold], second[joined:threshold])
+        joined = threshold
+        snapshots[threshold] = (largest_three_product(uf), uf.components, uf.largest())
+    return snapshots
+
+
+def connect_all(coords, distances):
+    """Connect pairs until everything is one circuit, return product of X coords of last pair."""
+    n = len(coords)
     
     # Use Union-Find to connect pairs until all are in one circuit
     uf = UnionFind(n)
-    num_circuits = n  # Start with n separate circuits
     last_i, last_j = 0, 0
     
     for dist, i, j in distances:
         if uf.union(i, j):
             # Successfully connected two different circuits
-            num_circuits -= 1
             last_i, last_j = i, j
             
             # All connected when we have just one circuit
-            if num_circuits == 1:
+            if uf.components == 1:
                 break
     
     # Return product of X coordinates of last connected pair
     return coords[last_i][0] * coords[last_j][0]
 
 
+class ClosestCircuits:
+    """The circuits the k closest pairs of an OnlineCircuits make, kept as boxes arrive.
+    
+    The kept pairs are a max-heap, weighed (squared distance, i, j), and
+    their circuits a UnionFind. A new box brings in its pairs lighter than
+    the heaviest kept one, each pushing that one out, and new pairs are
+    unioned in place. The kept pairs are every pair up to some weight, so
+    their circuits are those of the spanning tree's edges up to it: a
+    pushed-out pair only splits a circuit if its tree path has an edge
+    heavier than the pairs left. Only then is the UnionFind rebuilt, from
+    the kept pairs, on the next query.
+    """
+    __slots__ = ('k', 'pairs', 'circuits', 'stale')
+    
+    def __init__(self, k, coords):
+        self.k = k
+        self.pairs = []
+        self.circuits = UnionFind(len(coords))
+        self.stale = False
+        if len(coords) > 1:
+            distances, first, second = closest_pairs(coords, k)
+            self.pairs = [(-d, -i, -j) for d, i, j in zip(distances.tolist(), first.tolist(), second.tolist())]
+            heapq.heapify(self.pairs)
+            self.circuits.union_many(first, second)
+    
+    def add_box(self, online, index):
+        """Take in the pairs of box index, already inserted into online."""
+        self.circuits.add()
+        point = online.coords[index]
+        if len(self.pairs) < self.k:
+            # Every pair is kept so far
+            candidates = [(sum((a - b) ** 2 for a, b in zip(point, online.coords[other])), other)
+                          for other in range(index)]
+        elif self.pairs:
+            candidates = [(distance, other) for distance, other in online.grid.within(point, -self.pairs[0][0])
+                          if other != index]
+        else:
+            return
+        
+        evicted = []
+        for distance, other in sorted(candidates):
+            if len(self.pairs) == self.k:
+                heaviest = tuple(-x for x in self.pairs[0])
+                if (distance, other, index) >= heaviest:
+                    break  # the rest are heavier still
+                heapq.heappop(self.pairs)
+                evicted.append(heaviest)
+            heapq.heappush(self.pairs, (-distance, -other, -index))
+            self.circuits.union(other, index)
+        
+        if evicted and not self.stale:
+            limit = tuple(-x for x in self.pairs[0])
+            tree, vertices = online.tree, online.vertices
+            self.stale = any(tree.weight[tree.heaviest_edge(vertices[i], vertices[j])] > limit
+                             for _, i, j in evicted)
+    
+    def product(self):
+        """Product of the 3 largest circuits."""
+        if self.stale:
+            self.circuits = UnionFind(len(self.circuits))
+            self.circuits.union_many([-i for _, i, _ in self.pairs], [-j for _, _, j in self.pairs])
+            self.stale = False
+        return largest_three_product(self.circuits)
+
+
+class OnlineCircuits:
+    """Junction boxes arriving one at a time, with both answers kept current.
+    
+    The minimum spanning tree of every box so far lives in a link-cut
+    tree. A new box can only join the tree through its nearest box or
+    through boxes no further away than the current longest tree edge:
+    any other edge is the heaviest on a cycle. Those few candidates come
+    from a spatial hash, and each replaces the heaviest edge on its tree
+    path if it is lighter. Edges are weighed (squared distance, i, j), as
+    everywhere else in this day, so the tree matches Kruskal's exactly.
+    """
+    
+    def __init__(self, coords=()):
+        self.coords = []
+        self.grid = PointGrid()
+        self.tree = LinkCutTree()
+        self.vertices = []  # tree node of each box; edges are tree nodes too
+        self.longest = []  # max-heap of tree edges as (negated weight, edge id); cut edges linger
+        self.closest = {}  # ClosestCircuits for each num_connections asked about
+        for point in coords:
+            self.insert(point)
+    
+    def __len__(self):
+        return len(self.coords)
+    
+    def _link(self, weight):
+        distance, i, j = weight
+        edge = self.tree.link(self.vertices[i], self.vertices[j], weight)
+        heapq.heappush(self.longest, ((-distance, -i, -j), edge))
+    
+    def longest_edge(self):
+        """The heaviest tree edge as (squared distance, i, j), or None with fewer than 2 boxes."""
+        while self.longest and self.longest[0][1] not in self.tree.ends:
+            heapq.heappop(self.longest)
+        if not self.longest:
+            return None
+        return self.tree.weight[self.longest[0][1]]
+    
+    def insert(self, point):
+        """Add a junction box and return its index."""
+        point = tuple(point)
+        index = len(self.coords)
+        
+        candidates = set()
+        nearest = self.grid.nearest(point)
+        if nearest is not None:
+            candidates.add(nearest)
+            longest = self.longest_edge()
+            if longest is not None:
+                candidates.update(self.grid.within(point, longest[0]))
+        
+        self.coords.append(point)
+        self.grid.add(point)
+        self.vertices.append(self.tree.add_vertex())
+        
+        joined = False
+        for distance, other in sorted(candidates):
+            weight = (distance, other, index)
+            if not joined:
+                self._link(weight)
+                joined = True
+                continue
+            heaviest = self.tree.heaviest_edge(self.vertices[other], self.vertices[index])
+            if weight < self.tree.weight[heaviest]:
+                self.tree.cut(heaviest)
+                self._link(weight)
+        
+        for circuits in self.closest.values():
+            circuits.add_box(self, index)
+        return index
+    
+    def last_connection(self):
+        """Product of X coords of the pair that joins everything into one circuit (part 2)."""
+        longest = self.longest_edge()
+        last_i, last_j = longest[1:] if longest else (0, 0)
+        return self.coords[last_i][0] * self.coords[last_j][0]
+    
+    def connections(self, num_connections):
+        """Product of the 3 largest circuits after the closest num_connections pairs (part 1).
+        
+        The first query for a num_connections finds its pairs; from then on
+        each insert keeps them and their circuits current.
+        """
+        if num_connections not in self.closest:
+            self.closest[num_connections] = ClosestCircuits(num_connections, self.coords)
+        return self.closest[num_connections].product()
+
+
+def solve_part1(input_filename='day08-input.txt', num_connections=1000):
+    """Connect the closest pairs and return product of 3 largest circuit sizes."""
+    coords = parse_input(input_filename)
+    return connect_closest(len(coords), closest_pairs(coords, num_connections), num_connections)
+
+
+def solve_part2(input_filename='day08-input.txt'):
+    """Connect all junction boxes into one circuit, return product of X coords of last pair."""
+    coords = parse_input(input_filename)
+    return connect_all(coords, spanning_tree_edges(coords))
+
+
+def solve_both(input_filename='day08-input.txt', num_connections=1000):
+    """Solve both parts from one parse."""
+    coords = parse_input(input_filename)
+    part1 = connect_closest(len(coords), closest_pairs(coords, num_connections), num_connections)
+    return part1, connect_all(coords, spanning_tree_edges(coords))
+
+
+def solve_sweep(input_filename='day08-input.txt', thresholds=(10, 100, 1000, 10000)):
+    """Snapshot the circuits after each number of connections in thresholds."""
+    return sweep_connections(parse_input(input_filename), thresholds)
+
+
+def solve_exhaustive(input_filename='day08-input.txt', num_connections=1000, tile=1024, batch=65536):
+    """Solve both parts by measuring every pair, in tiles of bounded memory.
+    
+    A cross-check for solve_both that trusts neither the spatial hash nor
+    the spanning tree: part 1 keeps a running top num_connections over
+    tiles, part 2 runs Kruskal over pairs streamed in exact order.
+    """
+    coords = parse_input(input_filename)
+    points = as_points(coords)
+    part1 = connect_closest(len(coords), tiled_k_closest(points, num_connections, tile), num_connections)
+    return part1, connect_all(coords, tiled_pairs(points, batch, tile))
+
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
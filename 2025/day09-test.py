@@ -1,7 +1,13 @@
 import unittest
-from day09 import solve_part1, solve_part2
+from day09 import (PolygonIndex, largest_contained_rectangle, largest_rectangle, parse_input,
+                   solve_part1, solve_part2, solve_both, solve_search)
 
 class TestDay09(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day09-input.txt')
+    
     def test_part1_with_test_input(self):
         """Test part 1 with test input - largest rectangle area is 50."""
         result = solve_part1('day09-test.txt')
@@ -12,15 +18,54 @@ class TestDay09(unittest.TestCase):
         result = solve_part2('day09-test.txt')
         self.assertEqual(result, 24)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both gives both test answers from a single parse."""
+        self.assertEqual(solve_both('day09-test.txt'), (50, 24))
+    
+    def test_largest_rectangle_matches_every_pair(self):
+        """Pruning to the Pareto fronts finds the same best pair as trying them all."""
+        tiles = [(3, 0), (0, 4), (7, 7), (2, 2), (5, 1), (1, 6), (6, 3), (4, 4), (7, 0), (0, 0)]
+        best = max((abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
+                   for x1, y1 in tiles for x2, y2 in tiles if x1 != x2 and y1 != y2)
+        self.assertEqual(largest_rectangle(tiles), best)
+        self.assertEqual(largest_rectangle([(i, -i) for i in range(200)]), 200 * 200)
+        self.assertEqual(largest_rectangle([(1, 1), (1, 5), (4, 1)]), 20)
+    
+    def test_polygon_index_with_test_input(self):
+        """Rectangles are inside only if no tile of them falls outside the loop."""
+        index = PolygonIndex(parse_input('day09-test.txt'))
+        self.assertTrue(index.contains(9, 5, 2, 3))
+        self.assertTrue(index.contains(7, 3, 11, 1))
+        self.assertFalse(index.contains(2, 5, 11, 1))
+        self.assertFalse(index.contains(7, 1, 11, 7))
+    
+    def test_polygon_index_reach_with_test_input(self):
+        """Reach runs along a tile's row and column until the loop ends."""
+        index = PolygonIndex(parse_input('day09-test.txt'))
+        self.assertEqual(index.reach(7, 1), (7, 11, 1, 5))
+        self.assertEqual(index.reach(9, 5), (2, 11, 1, 7))
+    
+    def test_search_with_test_input(self):
+        """Best-first search stops at the first contained pair."""
+        self.assertEqual(solve_search('day09-test.txt'), (24, 1))
+    
+    def test_search_matches_exhaustive_with_main_input(self):
+        """Search and the every-pair scan agree on the main input."""
+        red_tiles = parse_input('day09-input.txt')
+        index = PolygonIndex(red_tiles)
+        area, examined = solve_search('day09-input.txt')
+        self.assertEqual(area, largest_contained_rectangle(red_tiles, index))
+        self.assertLess(examined, len(red_tiles))
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day09-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day09-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
@@ -1,132 +1,243 @@
-import os
+import heapq
 
+from lazy_import import lazy_import
+from parse_cache import cached_parse
+from puzzle_input import open_input
+
+np = lazy_import('numpy')
+
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file into list of (x, y) coordinates of red tiles."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    coords = []
-    with open(input_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                x, y = map(int, line.split(','))
-                coords.append((x, y))
-    return coords
+    with open_input(input_filename) as data:
+        values = data.ints()
+        return list(zip(values, values))
 
-def solve_part1(input_filename='day09-input.txt'):
-    """Find largest rectangle using two red tiles as opposite corners."""
-    coords = parse_input(input_filename)
+def lower_left_front(xs, ys):
+    """Indices of the points no other point is both left of and below (or level with).
+    
+    Sorting by x, then y, a point is on the front exactly when its y is
+    below every y before it.
+    """
+    order = np.lexsort((ys, xs))
+    sorted_ys = ys[order]
+    lowest_before = np.minimum.accumulate(np.concatenate(([sorted_ys[0] + 1], sorted_ys[:-1])))
+    return order[sorted_ys < lowest_before]
+
+
+def largest_rectangle(coords, block=1 << 22):
+    """Find largest rectangle using two red tiles as opposite corners.
     
-    # For each pair of red tiles, calculate the rectangle area
+    A corner pair spanning from lower left to upper right can always swap
+    its lower-left tile for one further down and left without shrinking,
+    so only the lower-left and upper-right Pareto fronts can hold the best
+    pair; the same goes for upper left and lower right. Only pairs across
+    those fronts are measured, block pairs at a time.
+    """
     # Rectangle area includes boundaries: (|x2 - x1| + 1) * (|y2 - y1| + 1)
     # We need the tiles to be opposite corners (not same row/column)
+    if len(coords) < 2:
+        return 0
+    tiles = np.array(coords, dtype=np.int64)
+    xs, ys = tiles[:, 0], tiles[:, 1]
     max_area = 0
-    n = len(coords)
     
-    for i in range(n):
-        for j in range(i + 1, n):
-            x1, y1 = coords[i]
-            x2, y2 = coords[j]
-            
-            # Opposite corners means different x AND different y
-            if x1 != x2 and y1 != y2:
-                area = (abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
-                max_area = max(max_area, area)
+    for flip in (1, -1):
+        # flip = 1 pairs lower left with upper right, -1 upper left with lower right
+        first = tiles[lower_left_front(xs, flip * ys)]
+        second = tiles[lower_left_front(-xs, -flip * ys)]
+        rows = max(1, block // len(second))
+        for start in range(0, len(first), rows):
+            x1, y1 = first[start:start + rows, 0, None], first[start:start + rows, 1, None]
+            x2, y2 = second[None, :, 0], second[None, :, 1]
+            areas = (np.abs(x2 - x1) + 1) * (np.abs(y2 - y1) + 1)
+            areas[(x1 == x2) | (y1 == y2)] = 0
+            max_area = max(max_area, int(areas.max()))
     
     return max_area
 
-def solve_part2(input_filename='day09-input.txt'):
-    """Find largest rectangle using only red and green tiles."""
-    red_tiles = parse_input(input_filename)
+def build_edges(red_tiles):
+    """Build the polygon edges between consecutive red tiles."""
     n = len(red_tiles)
-    
-    # Build edges between consecutive red tiles
     edges = []
     for i in range(n):
         p1 = red_tiles[i]
         p2 = red_tiles[(i + 1) % n]
         edges.append((p1, p2))
+    return edges
+
+class PolygonIndex:
+    """Answer "is this rectangle all red or green?" in O(1) for a rectilinear polygon.
+    
+    The red tiles' x and y coordinates split the plane into a compressed
+    grid: one column per distinct x, one for the run of tiles between each
+    pair of neighbouring xs, and the same for rows. Every tile in one
+    compressed cell is on the same side of the boundary, so each cell is
+    classified once, and a 2D prefix sum of the cells outside the polygon
+    counts the bad cells in any rectangle with four lookups.
     
-    # Collect all unique x and y coordinates from red tiles
-    # These define the grid lines we care about
-    x_coords = sorted(set(p[0] for p in red_tiles))
-    y_coords = sorted(set(p[1] for p in red_tiles))
-    
-    def point_in_polygon(x, y):
-        """Check if point is inside or on the polygon using ray casting."""
-        # First check if on an edge
-        for (x1, y1), (x2, y2) in edges:
-            if x1 == x2:  # Vertical edge
-                if x == x1 and min(y1, y2) <= y <= max(y1, y2):
-                    return True
-            else:  # Horizontal edge  
-                if y == y1 and min(x1, x2) <= x <= max(x1, x2):
-                    return True
+    Building it is O(n^2) time and memory for n red tiles.
+    """
+    
+    def __init__(self, red_tiles):
+        self.xs = np.unique([x for x, _ in red_tiles])
+        self.ys = np.unique([y for _, y in red_tiles])
+        columns = 2 * len(self.xs) - 1
+        rows = 2 * len(self.ys) - 1
         
-        # Ray casting to the right
-        crossings = 0
-        for (x1, y1), (x2, y2) in edges:
-            if x1 == x2 and x1 > x:  # Vertical edge to the right
-                y_min, y_max = min(y1, y2), max(y1, y2)
-                if y_min <= y < y_max:
-                    crossings += 1
-        return crossings % 2 == 1
-    
-    def rectangle_in_polygon(rx1, ry1, rx2, ry2):
-        """Check if entire rectangle is inside the polygon.
+        # Ray casting: a vertical edge flips inside/outside for everything to
+        # its right, on the rows it spans (half-open, so corners count once)
+        flips = np.zeros((rows + 1, columns + 1), dtype=np.uint8)
+        boundary = np.zeros((rows, columns), dtype=bool)
+        for (x1, y1), (x2, y2) in build_edges(red_tiles):
+            c1, c2 = sorted(self.column(np.array([x1, x2])).tolist())
+            r1, r2 = sorted(self.row(np.array([y1, y2])).tolist())
+            boundary[r1:r2 + 1, c1:c2 + 1] = True
+            if c1 == c2:
+                flips[r1, c1 + 1] ^= 1
+                flips[r2, c1 + 1] ^= 1
+        inside = np.bitwise_xor.accumulate(np.bitwise_xor.accumulate(flips, axis=0), axis=1)
         
-        For a rectilinear polygon made of axis-aligned edges,
-        a rectangle is fully inside if:
-        1. All 4 corners are inside/on the polygon
-        2. No polygon edge crosses through the rectangle interior
-        """
-        # Check all 4 corners
-        corners = [(rx1, ry1), (rx1, ry2), (rx2, ry1), (rx2, ry2)]
-        for cx, cy in corners:
-            if not point_in_polygon(cx, cy):
-                return False
+        outside = ~(inside[:rows, :columns].astype(bool) | boundary)
+        # Gaps between neighbouring coordinates hold no tiles at all
+        outside[:, 1::2][:, np.diff(self.xs) == 1] = False
+        outside[1::2, :][np.diff(self.ys) == 1, :] = False
         
-        # Check if any polygon edge crosses through the rectangle
-        for (x1, y1), (x2, y2) in edges:
-            if x1 == x2:  # Vertical edge
-                # Does this vertical edge cross through rectangle horizontally?
-                if rx1 < x1 < rx2:  # Edge x is strictly inside rectangle x range
-                    edge_y_min, edge_y_max = min(y1, y2), max(y1, y2)
-                    # Check if edge overlaps with rectangle y range
-                    if edge_y_min < ry2 and edge_y_max > ry1:
-                        return False
-            else:  # Horizontal edge
-                # Does this horizontal edge cross through rectangle vertically?
-                if ry1 < y1 < ry2:  # Edge y is strictly inside rectangle y range
-                    edge_x_min, edge_x_max = min(x1, x2), max(x1, x2)
-                    # Check if edge overlaps with rectangle x range
-                    if edge_x_min < rx2 and edge_x_max > rx1:
-                        return False
+        self.outside = np.zeros((rows + 1, columns + 1), dtype=np.int32)
+        self.outside[1:, 1:] = outside.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+    
+    def column(self, x):
+        """Compressed column of red x coordinates."""
+        return 2 * np.searchsorted(self.xs, x)
+    
+    def row(self, y):
+        """Compressed row of red y coordinates."""
+        return 2 * np.searchsorted(self.ys, y)
+    
+    def reach(self, x, y):
+        """How far the red tile at (x, y) sees along its row and column.
         
-        return True
+        Returns (left, right, down, up): the furthest red x and y
+        coordinates reachable from it without leaving the polygon. Any
+        contained rectangle with this corner fits inside those limits.
+        """
+        c, r = int(self.column(x)), int(self.row(y))
+        # Differencing the 2D prefix sums gives 1D ones along a row or column
+        along_row = self.outside[r + 1] - self.outside[r]
+        along_column = self.outside[:, c + 1] - self.outside[:, c]
+        first = np.searchsorted(along_row, along_row[c + 1])
+        last = np.searchsorted(along_row, along_row[c], side='right') - 2
+        bottom = np.searchsorted(along_column, along_column[r + 1])
+        top = np.searchsorted(along_column, along_column[r], side='right') - 2
+        return (int(self.xs[(first + 1) // 2]), int(self.xs[last // 2]),
+                int(self.ys[(bottom + 1) // 2]), int(self.ys[top // 2]))
     
-    # For each pair of red tiles as opposite corners, check if rectangle is valid
+    def contains(self, x1, y1, x2, y2):
+        """Whether every tile of the rectangle with corners (x1, y1), (x2, y2) is red or green.
+        
+        Corners must be red tile coordinates. Takes scalars or arrays.
+        """
+        c1, c2 = self.column(np.minimum(x1, x2)), self.column(np.maximum(x1, x2)) + 1
+        r1, r2 = self.row(np.minimum(y1, y2)), self.row(np.maximum(y1, y2)) + 1
+        outside = self.outside
+        return outside[r2, c2] - outside[r1, c2] - outside[r2, c1] + outside[r1, c1] == 0
+
+
+def largest_contained_rectangle(red_tiles, index):
+    """Find largest rectangle with red corners that lies entirely inside the polygon."""
+    # For each red tile, check it against every later one in one vectorised step
+    tiles = np.array(red_tiles, dtype=np.int64)
     max_area = 0
-    
-    for i in range(n):
-        for j in range(i + 1, n):
-            x1, y1 = red_tiles[i]
-            x2, y2 = red_tiles[j]
-            
-            # Must be opposite corners
-            if x1 == x2 or y1 == y2:
-                continue
-            
-            rx1, rx2 = min(x1, x2), max(x1, x2)
-            ry1, ry2 = min(y1, y2), max(y1, y2)
-            
-            if rectangle_in_polygon(rx1, ry1, rx2, ry2):
-                area = (rx2 - rx1 + 1) * (ry2 - ry1 + 1)
-                max_area = max(max_area, area)
+    for i in range(len(tiles) - 1):
+        x1, y1 = tiles[i]
+        x2, y2 = tiles[i + 1:, 0], tiles[i + 1:, 1]
+        
+        # Must be opposite corners
+        valid = (x1 != x2) & (y1 != y2)
+        valid &= index.contains(x1, y1, x2, y2)
+        if valid.any():
+            areas = (np.abs(x2 - x1) + 1) * (np.abs(y2 - y1) + 1)
+            max_area = max(max_area, int(areas[valid].max()))
     
     return max_area
 
+def search_contained_rectangle(red_tiles, index):
+    """Find the largest contained rectangle by trying pairs in decreasing area order.
+    
+    Returns (area, examined), where examined counts the pairs whose
+    containment was checked. Each red tile starts in a heap keyed by an
+    upper bound on any rectangle it can be a corner of, from how far it
+    reaches along its row and column. Its partners, the tiles each can
+    reach, are only measured and sorted once that bound reaches the top;
+    after that the tile is keyed by its next unchecked partner, so the
+    first pair popped that is contained is the answer.
+    """
+    tiles = np.array(red_tiles, dtype=np.int64)
+    if len(tiles) < 2:
+        return 0, 0
+    xs, ys = tiles[:, 0], tiles[:, 1]
+    left, right, down, up = np.array([index.reach(x, y) for x, y in red_tiles], dtype=np.int64).T
+    widths = np.maximum(xs - left, right - xs) + 1
+    heights = np.maximum(ys - down, up - ys) + 1
+    heap = [(-bound, i, None) for i, bound in enumerate((widths * heights).tolist())]
+    heapq.heapify(heap)
+    partners = {}
+    examined = 0
+    # Scalar lookups straight into the prefix sums; NumPy per call costs more
+    columns = index.column(xs).tolist()
+    rows = index.row(ys).tolist()
+    outside = index.outside.item
+    
+    while heap:
+        negative_area, i, position = heapq.heappop(heap)
+        if position is None:
+            # Measure tile i against every later tile the two can reach, largest first
+            x1, y1 = xs[i], ys[i]
+            later = np.arange(i + 1, len(tiles))
+            later = later[(xs[later] != x1) & (ys[later] != y1)
+                          & (left[i] <= xs[later]) & (xs[later] <= right[i])
+                          & (down[i] <= ys[later]) & (ys[later] <= up[i])
+                          & (left[later] <= x1) & (x1 <= right[later])
+                          & (down[later] <= y1) & (y1 <= up[later])]
+            areas = (np.abs(xs[later] - x1) + 1) * (np.abs(ys[later] - y1) + 1)
+            order = np.argsort(-areas, kind='stable')
+            partners[i] = (later[order].tolist(), areas[order].tolist())
+        else:
+            examined += 1
+            j = partners[i][0][position]
+            c1, c2 = sorted((columns[i], columns[j]))
+            r1, r2 = sorted((rows[i], rows[j]))
+            if outside(r2 + 1, c2 + 1) - outside(r1, c2 + 1) - outside(r2 + 1, c1) + outside(r1, c1) == 0:
+                return -negative_area, examined
+        
+        position = 0 if position is None else position + 1
+        if position < len(partners[i][0]):
+            heapq.heappush(heap, (-partners[i][1][position], i, position))
+        else:
+            del partners[i]
+    
+    return 0, examined
+
+def solve_part1(input_filename='day09-input.txt'):
+    """Find largest rectangle using two red tiles as opposite corners."""
+    coords = parse_input(input_filename)
+    return largest_rectangle(coords)
+
+def solve_part2(input_filename='day09-input.txt'):
+    """Find largest rectangle using only red and green tiles."""
+    red_tiles = parse_input(input_filename)
+    return search_contained_rectangle(red_tiles, PolygonIndex(red_tiles))[0]
+
+def solve_search(input_filename='day09-input.txt'):
+    """Part 2 by best-first search; returns (area, candidate pairs examined)."""
+    red_tiles = parse_input(input_filename)
+    return search_contained_rectangle(red_tiles, PolygonIndex(red_tiles))
+
+def solve_both(input_filename='day09-input.txt'):
+    """Solve both parts from a single parse."""
+    red_tiles = parse_input(input_filename)
+    return largest_rectangle(red_tiles), search_contained_rectangle(red_tiles, PolygonIndex(red_tiles))[0]
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
@@ -1,7 +1,13 @@
 import unittest
-from day10 import solve_part1, solve_part2
+from day10 import (fewest_presses, lp_minimum, reduce_joltage, reduce_lights, search_joltage, solve_joltage,
+                   solve_machine, solve_part1, solve_part2, solve_both, solve_parallel, xor_subsets)
 
 class TestDay10(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day10-input.txt')
+    
     def test_part1_with_test_input(self):
         """Test part 1 with test input - total is 2+3+2=7."""
         result = solve_part1('day10-test.txt')
@@ -12,15 +18,83 @@ class TestDay10(unittest.TestCase):
         result = solve_part2('day10-test.txt')
         self.assertEqual(result, 33)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both gives both test answers from a single parse."""
+        self.assertEqual(solve_both('day10-test.txt'), (7, 33))
+    
+    def test_reduce_lights(self):
+        """Reduction packs each free button's effect on the pivots into an int."""
+        # Buttons 0 and 1 pivot; button 2 toggles both lights, so it flips both pivots
+        self.assertEqual(reduce_lights([1, 0], [[0], [1], [0, 1]]), (0b01, [2], [0b11]))
+        self.assertIsNone(reduce_lights([1, 0], [[0, 1], [0, 1]]))
+    
+    def test_solve_machine_with_many_free_buttons(self):
+        """Sixteen redundant buttons still find the single best press."""
+        buttons = [[0, 1, 2]] * 16 + [[0], [1], [2]]
+        self.assertEqual(solve_machine([1, 1, 1], buttons), 1)
+        self.assertEqual(solve_machine([1, 1, 0], buttons), 2)
+    
+    def test_fewest_presses_matches_enumeration(self):
+        """Meeting in the middle finds the same minimum as walking every free assignment."""
+        buttons = [[i % 5, (3 * i + 1) % 5] for i in range(14)] + [[0, 1, 2, 3, 4]]
+        for target in ([1, 0, 1, 1, 0], [1, 1, 1, 1, 1], [0, 0, 0, 0, 0]):
+            pivots, free_buttons, columns = reduce_lights(target, buttons)
+            rank = len(buttons) - len(free_buttons)
+            walked = min(syndrome.bit_count() + weight for syndrome, weight in xor_subsets(columns, pivots))
+            self.assertEqual(fewest_presses(pivots, columns, rank), walked)
+    
+    def test_solve_machine_with_thirty_free_buttons(self):
+        """Thirty free buttons take about 2^15 steps rather than 2^30."""
+        buttons = [[0, 1, 2, 3, 4, 5]] * 30 + [[i] for i in range(6)]
+        self.assertEqual(solve_machine([1, 1, 1, 1, 1, 0], buttons), 2)
+    
+    def test_reduce_joltage(self):
+        """Pivot presses are written in terms of the free ones, scaled to integers."""
+        # x0 + x2 == 3 and x1 + x2 == 5, with x2 free
+        self.assertEqual(reduce_joltage([3, 5], [[0], [1], [0, 1]]), ([(1, 3, [1]), (1, 5, [1])], [0, 1], [2]))
+        self.assertIsNone(reduce_joltage([3, 5], [[0, 1]]))
+    
+    def test_solve_joltage(self):
+        """The native search matches the test machines and handles awkward ones."""
+        self.assertEqual(solve_joltage([3, 5, 4, 7], [[3], [1, 3], [2], [2, 3], [0, 2], [0, 1]]), 10)
+        self.assertEqual(solve_joltage([3, 5], [[0], [1], [0, 1]]), 5)
+        # Duplicate buttons, and a target only reachable with fractional presses
+        self.assertEqual(solve_joltage([4, 4], [[0, 1]] * 5), 4)
+        self.assertIsNone(solve_joltage([1, 1, 1], [[0, 1], [1, 2], [0, 2]]))
+    
+    def test_lp_minimum(self):
+        """The LP relaxation finds fractional optima and reports infeasibility."""
+        # min -x - y with x + 2y <= 4, 3x + y <= 6: optimum at (1.6, 1.2)
+        self.assertAlmostEqual(lp_minimum([-1, -1], [[1, 2], [3, 1]], [4, 6]), -2.8)
+        # x + y >= 3 written as -x - y <= -3, with x, y <= 1
+        self.assertIsNone(lp_minimum([1, 1], [[-1, -1], [1, 0], [0, 1]], [-3, 1, 1]))
+        self.assertAlmostEqual(lp_minimum([1, 2], [[-1, -1], [1, 0]], [-3, 2]), 4)
+    
+    def test_solve_joltage_on_a_tight_machine(self):
+        """LP bounds keep a machine with five free buttons and tight counters quick."""
+        buttons = [[0, 3, 4], [1, 4], [4], [3], [2], [0, 2], [2, 4], [1], [1, 2], [2, 3, 4]]
+        presses, nodes = search_joltage([41, 44, 49, 41, 40], buttons)
+        self.assertEqual(presses, 88)
+        # About 3,000 states; without the LP bound it takes over 200,000
+        self.assertLess(nodes, 10000)
+    
+    def test_solve_parallel_with_test_input(self):
+        """Machines come back in input order whether solved in one process or a pool."""
+        for jobs in (1, 2):
+            total1, total2, results = solve_parallel('day10-test.txt', jobs=jobs, chunk_size=2)
+            self.assertEqual((total1, total2), (7, 33))
+            self.assertEqual([result[:2] for result in results], [(2, 10), (3, 12), (2, 11)])
+            self.assertTrue(all(seconds >= 0 for result in results for seconds in result[2:]))
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day10-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day10-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
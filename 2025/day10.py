@@ -1,18 +1,23 @@
+import math
 import os
-import re
-from itertools import product
+import time
 
+from lazy_import import lazy_import
+from parse_cache import cached_parse
+from puzzle_input import open_input
+
+np = lazy_import('numpy')
+optimize = lazy_import('scipy.optimize')
+futures = lazy_import('concurrent.futures')
+
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file into list of (target, buttons, joltage) tuples."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
+    import re
     machines = []
-    with open(input_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    with open_input(input_filename) as data:
+        for line in data.lines():
+            line = line.decode()
             
             # Extract indicator light pattern [...]
             pattern_match = re.search(r'\[([.#]+)\]', line)
@@ -33,81 +38,115 @@ def parse_input(input_filename):
     
     return machines
 
-def solve_machine(target, buttons):
-    """Find minimum button presses to reach target state from all-off.
+def reduce_lights(target, buttons):
+    """Row-reduce the light system over GF(2), with rows packed into ints.
     
-    Uses Gaussian elimination over GF(2) to find solutions,
-    then finds the one with minimum number of presses.
+    Bit j of a row is set if button j toggles that light, and the bit
+    past the last button holds the target. Returns (base, free_buttons,
+    columns), or None if the target can't be reached: pressing exactly the
+    free buttons in a set F turns on pivot buttons base ^ columns[f] for
+    each f in F, where bit i of each mask stands for the i-th pivot button.
     """
-    n_lights = len(target)
     n_buttons = len(buttons)
-    
-    # Build the button matrix: each column is a button's effect
-    # matrix[i][j] = 1 if button j toggles light i
-    matrix = [[0] * n_buttons for _ in range(n_lights)]
+    rows = [0] * len(target)
     for j, btn in enumerate(buttons):
         for light_idx in btn:
-            if light_idx < n_lights:
-                matrix[light_idx][j] = 1
-    
-    # Augmented matrix [A | b] for Ax = b over GF(2)
-    aug = [row[:] + [target[i]] for i, row in enumerate(matrix)]
+            if light_idx < len(target):
+                rows[light_idx] |= 1 << j
+    for i, lit in enumerate(target):
+        rows[i] |= lit << n_buttons
     
-    # Gaussian elimination over GF(2)
     pivot_cols = []
-    row = 0
     for col in range(n_buttons):
-        # Find pivot
-        pivot_row = None
-        for r in range(row, n_lights):
-            if aug[r][col] == 1:
-                pivot_row = r
-                break
-        
+        bit = 1 << col
+        pivot_row = next((r for r in range(len(pivot_cols), len(rows)) if rows[r] & bit), None)
         if pivot_row is None:
             continue
         
-        # Swap rows
-        aug[row], aug[pivot_row] = aug[pivot_row], aug[row]
+        row = len(pivot_cols)
+        rows[row], rows[pivot_row] = rows[pivot_row], rows[row]
+        pivot = rows[row]
+        # Whole-row XOR clears the column everywhere else
+        for r in range(len(rows)):
+            if r != row and rows[r] & bit:
+                rows[r] ^= pivot
         pivot_cols.append(col)
-        
-        # Eliminate
-        for r in range(n_lights):
-            if r != row and aug[r][col] == 1:
-                for c in range(n_buttons + 1):
-                    aug[r][c] ^= aug[row][c]
-        
-        row += 1
     
-    # Check for inconsistency (row of form [0 0 ... 0 | 1])
-    for r in range(row, n_lights):
-        if aug[r][n_buttons] == 1:
-            return None  # No solution
+    # Leftover rows are all zero on the buttons; a set target bit is 0 = 1
+    if any(rows[r] for r in range(len(pivot_cols), len(rows))):
+        return None
     
-    # Find free variables (columns not pivot columns)
-    free_cols = [c for c in range(n_buttons) if c not in pivot_cols]
+    free_buttons = [c for c in range(n_buttons) if c not in pivot_cols]
+    base = 0
+    columns = [0] * len(free_buttons)
+    for i in range(len(pivot_cols)):
+        base |= (rows[i] >> n_buttons & 1) << i
+        for k, col in enumerate(free_buttons):
+            columns[k] |= (rows[i] >> col & 1) << i
+    return base, free_buttons, columns
+
+def xor_subsets(columns, start=0):
+    """Yield (start ^ XOR of the subset, subset size) for every subset of columns.
     
-    # Try all combinations of free variables to find minimum solution
-    min_presses = float('inf')
+    Subsets come in Gray-code order, so each one differs from the last by
+    a single column and costs one XOR.
+    """
+    syndrome, weight, chosen = start, 0, 0
+    yield syndrome, weight
+    for step in range(1, 1 << len(columns)):
+        # The Gray code flips the lowest set bit of the step number
+        k = (step & -step).bit_length() - 1
+        syndrome ^= columns[k]
+        chosen ^= 1 << k
+        weight += 1 if chosen >> k & 1 else -1
+        yield syndrome, weight
+
+def fewest_presses(pivots, columns, rank):
+    """Fewest presses for a reduced light system, meeting in the middle.
     
-    for free_vals in product([0, 1], repeat=len(free_cols)):
-        # Build solution
-        solution = [0] * n_buttons
-        for i, col in enumerate(free_cols):
-            solution[col] = free_vals[i]
-        
-        # Back-substitute for pivot variables
-        for i in range(len(pivot_cols) - 1, -1, -1):
-            pivot_col = pivot_cols[i]
-            val = aug[i][n_buttons]
-            for c in range(pivot_col + 1, n_buttons):
-                val ^= aug[i][c] * solution[c]
-            solution[pivot_col] = val
-        
-        presses = sum(solution)
-        min_presses = min(min_presses, presses)
+    pivots and columns are as returned by reduce_lights, for rank pivot
+    buttons. The free columns are split in two. Every syndrome of the
+    first half's subsets goes in a table with its smallest subset, and
+    relaxing that table over the 2^rank pivot patterns one bit at a time
+    gives, for every pattern, the cheapest first-half subset plus the
+    pivot presses that cancel what is left. Each subset of the second half
+    then needs one lookup, so this takes about 2^(f/2) steps for f free
+    buttons, plus rank * 2^rank vectorised ones.
+    """
+    half = len(columns) // 2
+    size = 1 << rank
+    cheapest = [len(columns) + rank + 1] * size
+    for syndrome, weight in xor_subsets(columns[:half]):
+        if weight < cheapest[syndrome]:
+            cheapest[syndrome] = weight
+    cheapest = np.array(cheapest, dtype=np.int64)
+    for bit in range(rank):
+        # Pair each pattern with the one differing in this bit
+        pairs = cheapest.reshape(-1, 2, 1 << bit)
+        cheapest = np.minimum(pairs, pairs[:, ::-1] + 1).reshape(size)
+    
+    cheapest = cheapest.tolist()
+    return min(cheapest[syndrome] + weight for syndrome, weight in xor_subsets(columns[half:], pivots))
+
+def solve_machine(target, buttons):
+    """Find minimum button presses to reach target state from all-off.
+    
+    Uses Gaussian elimination over GF(2) to find solutions. With f free
+    buttons and r pivot buttons, walking the 2^f free assignments in
+    Gray-code order flips one precomputed column per step, 2^f of them;
+    fewest_presses takes over once its 2^(f/2) + 2^r is far less.
+    """
+    reduced = reduce_lights(target, buttons)
+    if reduced is None:
+        return None  # No solution
     
-    return min_presses
+    pivots, free_buttons, columns = reduced
+    rank = len(buttons) - len(free_buttons)
+    f = len(columns)
+    if 1 << f > 4 * ((1 << (f + 1) // 2) + (1 << rank)):
+        return fewest_presses(pivots, columns, rank)
+    
+    return min(syndrome.bit_count() + weight for syndrome, weight in xor_subsets(columns, pivots))
 
 def solve_part1(input_filename='day10-input.txt'):
     """Find minimum total button presses to configure all machines."""
@@ -121,14 +160,236 @@ def solve_part1(input_filename='day10-input.txt'):
     
     return total
 
-def solve_joltage(joltage, buttons):
+def reduce_joltage(joltage, buttons):
+    """Row-reduce presses @ incidence == joltage exactly, over the rationals.
+    
+    Returns (rows, pivot_buttons, free_buttons), or None if no real
+    solution exists. Row i is (scale, target, coefficients), scaled to
+    integers with scale > 0, and says
+        scale * presses[pivot_buttons[i]] + sum(c * presses[f]) == target
+    over the free buttons f, in free_buttons order.
+    """
+    from fractions import Fraction
+    n_counters = len(joltage)
+    rows = [[Fraction(int(counter in btn)) for btn in buttons] + [Fraction(joltage[counter])]
+            for counter in range(n_counters)]
+    
+    pivot_buttons = []
+    for col in range(len(buttons)):
+        row = len(pivot_buttons)
+        pivot_row = next((r for r in range(row, n_counters) if rows[r][col]), None)
+        if pivot_row is None:
+            continue
+        rows[row], rows[pivot_row] = rows[pivot_row], rows[row]
+        pivot = rows[row][col]
+        rows[row] = [value / pivot for value in rows[row]]
+        for r in range(n_counters):
+            if r != row and rows[r][col]:
+                factor = rows[r][col]
+                rows[r] = [value - factor * top for value, top in zip(rows[r], rows[row])]
+        pivot_buttons.append(col)
+    
+    if any(rows[r][-1] for r in range(len(pivot_buttons), n_counters)):
+        return None
+    
+    free_buttons = [c for c in range(len(buttons)) if c not in pivot_buttons]
+    reduced = []
+    for row in rows[:len(pivot_buttons)]:
+        scale = math.lcm(*(value.denominator for value in row))
+        reduced.append((scale, int(row[-1] * scale), [int(row[f] * scale) for f in free_buttons]))
+    return reduced, pivot_buttons, free_buttons
+
+def _pivot(tableau, objective, basis, row, col):
+    """Make col basic in row, eliminating it from every other row and the objective."""
+    pivot_row = tableau[row]
+    factor = pivot_row[col]
+    pivot_row[:] = [value / factor for value in pivot_row]
+    for other in tableau + [objective]:
+        if other is not pivot_row and other[col]:
+            scale = other[col]
+            other[:] = [value - scale * top for value, top in zip(other, pivot_row)]
+    basis[row] = col
+
+def _simplex(tableau, objective, basis, columns, eps=1e-9):
+    """Pivot until no reduced cost among the first columns is negative (Bland's rule)."""
+    while True:
+        col = next((j for j in range(columns) if objective[j] < -eps), None)
+        if col is None:
+            return
+        ratios = [(row[-1] / row[col], basis[i], i) for i, row in enumerate(tableau) if row[col] > eps]
+        if not ratios:
+            return  # unbounded; can't happen with every variable bounded
+        _pivot(tableau, objective, basis, min(ratios)[2], col)
+
+def lp_minimum(costs, matrix, bounds, eps=1e-9):
+    """Minimum of costs @ x subject to matrix @ x <= bounds and x >= 0, or None if infeasible.
+    
+    A dense two-phase simplex in floats, for the handful of variables a
+    joltage search node has left; callers should allow for rounding.
+    """
+    n, m = len(costs), len(matrix)
+    tableau = []
+    basis = []
+    artificial = []
+    for i, (row, bound) in enumerate(zip(matrix, bounds)):
+        slack = [0.0] * m
+        slack[i] = 1.0
+        if bound >= 0:
+            tableau.append([float(a) for a in row] + slack + [float(bound)])
+            basis.append(n + i)
+        else:
+            # Negate so the right-hand side is non-negative; an artificial starts basic
+            tableau.append([-float(a) for a in row] + [-value for value in slack] + [-float(bound)])
+            basis.append(None)
+            artificial.append(i)
+    width = n + m + len(artificial)
+    for i, row in enumerate(tableau):
+        row[-1:-1] = [1.0 if artificial[k] == i else 0.0 for k in range(len(artificial))]
+    for k, i in enumerate(artificial):
+        basis[i] = n + m + k
+    
+    if artificial:
+        # Phase I: drive the artificials to zero
+        objective = [0.0] * (width + 1)
+        for i in artificial:
+            objective = [value - top for value, top in zip(objective, tableau[i])]
+        for k in range(len(artificial)):
+            objective[n + m + k] = 0.0
+        _simplex(tableau, objective, basis, width, eps)
+        if -objective[-1] > eps:
+            return None
+        for i in range(len(tableau)):
+            if basis[i] >= n + m:
+                col = next((j for j in range(n + m) if abs(tableau[i][j]) > eps), None)
+                if col is not None:
+                    _pivot(tableau, objective, basis, i, col)
+    
+    objective = [float(c) for c in costs] + [0.0] * (width - n) + [0.0]
+    for i, row in enumerate(tableau):
+        if basis[i] < n and costs[basis[i]]:
+            c = costs[basis[i]]
+            objective = [value - c * top for value, top in zip(objective, row)]
+    _simplex(tableau, objective, basis, n + m, eps)
+    return -objective[-1]
+
+def search_joltage(joltage, buttons):
     """Find minimum button presses to reach joltage targets from all-zero.
     
-    Uses direct Integer Linear Programming for optimal solution.
+    No button can be pressed more often than the smallest counter it
+    raises, which bounds every press count. After reduce_joltage only the
+    free buttons are searched, depth first. At each level every pivot
+    press must still be able to land in its bounds given the ranges left
+    to the unassigned buttons. While two or more remain, their LP
+    relaxation must also be feasible and cheaper than the best found.
+    
+    Returns (presses, nodes): presses is None if the targets can't be
+    met, and nodes counts the search states visited.
     """
-    from scipy.optimize import milp, Bounds, LinearConstraint
-    import numpy as np
+    n_counters = len(joltage)
+    # Identical buttons are interchangeable, so one copy of each will do
+    buttons = [list(btn) for btn in dict.fromkeys(
+        tuple(sorted({i for i in btn if i < n_counters})) for btn in buttons)]
+    if not buttons:
+        # No buttons - check if all joltages are already 0
+        return (0 if all(j == 0 for j in joltage) else None), 0
+    
+    limits = [min((joltage[i] for i in btn), default=0) for btn in buttons]
+    reduced = reduce_joltage(joltage, buttons)
+    if reduced is None:
+        return None, 0
+    rows, pivot_buttons, free_buttons = reduced
+    
+    # Narrowest ranges first, so the early levels branch least
+    order = sorted(range(len(free_buttons)), key=lambda k: limits[free_buttons[k]])
+    free_limits = [limits[free_buttons[k]] for k in order]
+    coefficients = [[row[2][k] for k in order] for row in rows]
+    pivot_limits = [scale * limits[p] for (scale, _, _), p in zip(rows, pivot_buttons)]
+    
+    # Total presses times the scales' lcm is linear in the free presses
+    common = math.lcm(*(scale for scale, _, _ in rows)) if rows else 1
+    weights = [common - sum(common // scale * row[k] for (scale, _, _), row in zip(rows, coefficients))
+               for k in range(len(order))]
+    
+    # What the unassigned free buttons from level k on can still add, per row
+    depth = len(order)
+    low = [[0] * len(rows) for _ in range(depth + 1)]
+    high = [[0] * len(rows) for _ in range(depth + 1)]
+    cheapest = [0] * (depth + 1)
+    for k in range(depth - 1, -1, -1):
+        for r, row in enumerate(coefficients):
+            extreme = row[k] * free_limits[k]
+            low[k][r] = low[k + 1][r] + min(0, extreme)
+            high[k][r] = high[k + 1][r] + max(0, extreme)
+        cheapest[k] = cheapest[k + 1] + min(0, weights[k] * free_limits[k])
+    
+    best = [None]
+    nodes = [0]
     
+    def search(k, remaining, cost, presses):
+        nodes[0] += 1
+        # remaining[r]: row r's target less the assigned free buttons' share
+        for r, value in enumerate(remaining):
+            if value - high[k][r] > pivot_limits[r] or value - low[k][r] < 0:
+                return
+        if best[0] is not None and cost + cheapest[k] >= best[0] * common:
+            return
+        if depth - k >= 2:
+            # The LP relaxation of what's left: infeasible, or a floor on its cost
+            left = range(k, depth)
+            matrix = ([[row[j] for j in left] for row in coefficients]
+                      + [[-row[j] for j in left] for row in coefficients]
+                      + [[int(i == j) for j in left] for i in left])
+            bounds = (remaining + [limit - value for limit, value in zip(pivot_limits, remaining)]
+                      + [free_limits[j] for j in left])
+            floor = lp_minimum([weights[j] for j in left], matrix, bounds)
+            # A better total scales to at most (best - 1) * common
+            if floor is None or (best[0] is not None and cost + floor > (best[0] - 1) * common + 1e-6):
+                return
+        
+        if k == depth:
+            total = presses
+            for (scale, _, _), value in zip(rows, remaining):
+                if value % scale:
+                    return
+                total += value // scale
+            best[0] = total
+            return
+        
+        # Narrow this button's range to values that leave every row feasible
+        first, last = 0, free_limits[k]
+        for r, value in enumerate(remaining):
+            c = coefficients[r][k]
+            if c:
+                # 0 <= value - c * press - (the rest) <= pivot_limits[r]
+                most, least = value - low[k + 1][r], value - high[k + 1][r] - pivot_limits[r]
+                if c > 0:
+                    first, last = max(first, -(-least // c)), min(last, most // c)
+                else:
+                    first, last = max(first, -(-most // c)), min(last, least // c)
+        
+        weight = weights[k]
+        values = range(first, last + 1) if weight >= 0 else range(last, first - 1, -1)
+        for value in values:
+            if best[0] is not None and cost + weight * value + cheapest[k + 1] >= best[0] * common:
+                break  # only gets dearer from here
+            search(k + 1, [left - row[k] * value for left, row in zip(remaining, coefficients)],
+                   cost + weight * value, presses + value)
+    
+    base = sum(common // scale * target for scale, target, _ in rows)
+    search(0, [target for _, target, _ in rows], base, 0)
+    return best[0], nodes[0]
+
+
+def solve_joltage(joltage, buttons):
+    """Find minimum button presses to reach joltage targets, or None; see search_joltage."""
+    return search_joltage(joltage, buttons)[0]
+
+def solve_joltage_milp(joltage, buttons):
+    """Find minimum button presses to reach joltage targets from all-zero.
+    
+    Uses scipy's general Integer Linear Programming solver; solve_joltage
+    gets the same answers without scipy.
+    """
     n_counters = len(joltage)
     n_buttons = len(buttons)
     
@@ -149,17 +410,17 @@ def solve_joltage(joltage, buttons):
     c = np.ones(n_buttons)
     
     # Equality constraints: A @ x == b
-    constraints = LinearConstraint(A, b, b)
+    constraints = optimize.LinearConstraint(A, b, b)
     
     # Bounds: x >= 0, with reasonable upper bound
     max_jolt = max(joltage) if joltage else 1
     large_bound = max_jolt * 100
-    bounds = Bounds(lb=np.zeros(n_buttons), ub=np.full(n_buttons, large_bound))
+    bounds = optimize.Bounds(lb=np.zeros(n_buttons), ub=np.full(n_buttons, large_bound))
     
     # All variables must be integers
     integrality = np.ones(n_buttons, dtype=int)
     
-    result = milp(c, integrality=integrality, bounds=bounds, constraints=constraints)
+    result = optimize.milp(c, integrality=integrality, bounds=bounds, constraints=constraints)
     
     if result.success:
         solution = [int(round(v)) for v in result.x]
@@ -186,6 +447,56 @@ def solve_part2(input_filename='day10-input.txt'):
     
     return total
 
+def solve_both(input_filename='day10-input.txt'):
+    """Solve both parts from a single parse of the input."""
+    machines = parse_input(input_filename)
+    
+    total1 = 0
+    total2 = 0
+    for target, buttons, joltage in machines:
+        presses = solve_machine(target, buttons)
+        if presses is not None:
+            total1 += presses
+        presses = solve_joltage(joltage, buttons)
+        if presses is not None:
+            total2 += presses
+    
+    return total1, total2
+
+def _solve_chunk(chunk):
+    """Solve both parts for each (target, buttons, joltage) in chunk, timing each one."""
+    results = []
+    for target, buttons, joltage in chunk:
+        start = time.perf_counter()
+        presses1 = solve_machine(target, buttons)
+        middle = time.perf_counter()
+        presses2 = solve_joltage(joltage, buttons)
+        results.append((presses1, presses2, middle - start, time.perf_counter() - middle))
+    return results
+
+def solve_machines(machines, jobs=None, chunk_size=8):
+    """Solve every machine across a process pool, in chunks of chunk_size.
+    
+    Returns one (lights presses, joltage presses, lights seconds, joltage
+    seconds) tuple per machine, in input order whatever order the chunks
+    finish in. jobs=1 solves them in this process.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    chunks = [machines[i:i + chunk_size] for i in range(0, len(machines), chunk_size)]
+    
+    if jobs == 1:
+        return [result for chunk in chunks for result in _solve_chunk(chunk)]
+    
+    with futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        return [result for results in pool.map(_solve_chunk, chunks) for result in results]
+
+def solve_parallel(input_filename='day10-input.txt', jobs=None, chunk_size=8):
+    """Solve both parts across a process pool; returns (part 1, part 2, per-machine results)."""
+    results = solve_machines(parse_input(input_filename), jobs, chunk_size)
+    total1 = sum(presses for presses, _, _, _ in results if presses is not None)
+    total2 = sum(presses for _, presses, _, _ in results if presses is not None)
+    return total1, total2, results
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
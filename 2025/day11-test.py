@@ -1,19 +1,72 @@
 """Tests for Advent of Code 2025 - Day 11"""
 
 import unittest
-from day11 import solve_part1, solve_part2
+from day11 import CompiledGraph, CycleError, count_paths, solve_part1, solve_part2, solve_both
 
 
 class TestDay11(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day11-input.txt')
+    
     def test_part1_with_test_input(self):
         """Test Part 1 with test input."""
         result = solve_part1('day11-test.txt')
         self.assertEqual(result, 5)  # 5 paths from you to out
     
+    def test_solve_both_with_test_input(self):
+        """solve_both matches the individual parts on the test input."""
+        self.assertEqual(solve_both('day11-test.txt'),
+                         (solve_part1('day11-test.txt'), solve_part2('day11-test.txt')))
+    
+    def test_compiled_graph_interns_names(self):
+        """Nodes get ids in input order and successors come from the CSR arrays."""
+        graph = CompiledGraph({'a': ['b', 'c'], 'b': ['c'], 'c': []})
+        self.assertEqual(graph.names, ['a', 'b', 'c'])
+        self.assertEqual(list(graph.successors(0)), [1, 2])
+        self.assertEqual(graph.components(), [[2], [1], [0]])
+    
+    def test_count_paths_with_required_nodes(self):
+        """Required nodes filter paths, in any order along them."""
+        graph = {'s': ['a', 'b'], 'a': ['b', 'e'], 'b': ['e'], 'e': []}
+        self.assertEqual(count_paths(graph, 's', 'e'), 3)
+        self.assertEqual(count_paths(graph, 's', 'e', {'a'}), 2)
+        self.assertEqual(count_paths(graph, 's', 'e', {'a', 'b'}), 1)
+        self.assertEqual(count_paths(graph, 's', 'e', {'missing'}), 0)
+    
+    def test_cycles_off_the_route_are_ignored(self):
+        """A loop the start can reach but that never leads to the end doesn't count."""
+        graph = {'s': ['a', 'x'], 'a': ['e'], 'x': ['y'], 'y': ['x'], 'e': []}
+        self.assertEqual(CompiledGraph(graph).cycles_on_route('s', 'e'), [])
+        self.assertEqual(count_paths(graph, 's', 'e'), 1)
+    
+    def test_cycles_on_the_route_are_reported(self):
+        """A loop between start and end raises with the loop's nodes, or gives infinity."""
+        graph = {'s': ['a'], 'a': ['b', 'e'], 'b': ['a'], 'e': []}
+        self.assertEqual(CompiledGraph(graph).cycles_on_route('s', 'e'), [['a', 'b']])
+        with self.assertRaises(CycleError) as caught:
+            count_paths(graph, 's', 'e')
+        self.assertEqual(caught.exception.cycles, [['a', 'b']])
+        self.assertEqual(count_paths(graph, 's', 'e', on_cycle='inf'), float('inf'))
+        self.assertEqual(count_paths({'s': ['s', 'e'], 'e': []}, 's', 'e', on_cycle='inf'), float('inf'))
+    
+    def test_cycles_through_the_end_are_not_routes(self):
+        """A path stops at the end, so loops leaving it don't make the count infinite."""
+        self.assertEqual(count_paths({'you': ['a'], 'a': ['out'], 'out': ['a']}, 'you', 'out'), 1)
+        self.assertEqual(count_paths({'you': ['out'], 'out': ['out']}, 'you', 'out'), 1)
+        self.assertEqual(CompiledGraph({'you': ['out'], 'out': ['out']}).cycles_on_route('you', 'out'), [])
+    
+    def test_count_paths_on_a_long_chain(self):
+        """A chain far deeper than the recursion limit is swept iteratively."""
+        graph = {f"n{i}": [f"n{i + 1}"] for i in range(50000)}
+        graph['n50000'] = []
+        self.assertEqual(count_paths(graph, 'n0', 'n50000', ['n10', 'n49999']), 1)
+    
     def test_part1_with_main_input(self):
         """Test Part 1 with main input."""
-        result = solve_part1('day11-input.txt')
+        result = self.main_answers[0]
         self.assertEqual(result, 607)
     
     def test_part2_with_test_input(self):
@@ -23,7 +76,7 @@ class TestDay11(unittest.TestCase):
     
     def test_part2_with_main_input(self):
         """Test Part 2 with main input."""
-        result = solve_part2('day11-input.txt')
+        result = self.main_answers[1]
         self.assertEqual(result, 506264456238938)
 
 
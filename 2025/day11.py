@@ -1,10 +1,16 @@
 """Advent of Code 2025 - Day 11"""
 
+import math
 
+from parse_cache import cached_parse
+from puzzle_input import open_input
+
+
+@cached_parse
 def parse_input(filename='day11-input.txt'):
     """Parse the input file into a directed graph."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\n')
+    with open_input(filename) as data:
+        lines = [line.decode() for line in data.lines()]
     
     # Build adjacency list (directed graph)
     graph = {}
@@ -23,44 +29,200 @@ def parse_input(filename='day11-input.txt'):
     return graph
 
 
-def count_paths(graph, start, end, required_nodes=None):
-    """Count all paths from start to end using DFS with cycle detection.
+class CycleError(ValueError):
+    """Raised when a cycle lies on a route, so there are infinitely many paths."""
     
-    If required_nodes is provided, only count paths that visit all required nodes.
+    def __init__(self, start, end, cycles):
+        self.cycles = cycles
+        shown = '; '.join(' '.join(cycle) for cycle in cycles[:3])
+        more = f" and {len(cycles) - 3} more" if len(cycles) > 3 else ''
+        super().__init__(f"{len(cycles)} cycle(s) between {start!r} and {end!r}: {shown}{more}")
+
+
+class CompiledGraph:
+    """A directed graph with nodes interned to ints and edges in CSR arrays.
+    
+    The successors of node v are targets[offsets[v]:offsets[v + 1]].
     """
-    if required_nodes is None:
-        required_nodes = frozenset()
-    else:
-        required_nodes = frozenset(required_nodes)
-    
-    # Memoization cache: (node, visited_required) -> count
-    cache = {}
-    
-    def dfs(node, visited_required, path):
-        # Update visited required nodes
-        if node in required_nodes:
-            visited_required = visited_required | frozenset({node})
+    __slots__ = ('names', 'ids', 'offsets', 'targets')
+    
+    def __init__(self, graph):
+        from array import array  # array pulls in collections, so not at import time
+        self.names = list(graph)
+        self.ids = {name: v for v, name in enumerate(self.names)}
+        self.offsets = array('q', [0])
+        self.targets = array('q')
+        for name in self.names:
+            self.targets.extend(self.ids[dest] for dest in graph[name])
+            self.offsets.append(len(self.targets))
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def successors(self, v):
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+    
+    def components(self, stop=None):
+        """Strongly connected components, by an iterative Tarjan's algorithm.
         
-        if node == end:
-            # Only count if all required nodes were visited
-            return 1 if visited_required == required_nodes else 0
+        Returns a list of components, each a list of node ids, with every
+        component after all the components it has edges into. Edges out of
+        node id stop are ignored.
+        """
+        offsets, targets = self.offsets, self.targets
+        index = [-1] * len(self.names)
+        low = [0] * len(self.names)
+        on_stack = bytearray(len(self.names))
+        stack = []
+        components = []
+        counter = 0
         
-        # Check cache
-        cache_key = (node, visited_required)
-        if cache_key in cache:
-            return cache[cache_key]
+        for root in range(len(self.names)):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, offsets[root])]
+            while work:
+                v, edge = work[-1]
+                if edge < offsets[v + 1] and v != stop:
+                    work[-1] = (v, edge + 1)
+                    w = targets[edge]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append((w, offsets[w]))
+                    elif on_stack[w]:
+                        low[v] = min(low[v], index[w])
+                    continue
+                
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == index[v]:
+                    # v is the first node of its component on the stack
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+        
+        return components
+    
+    def is_cyclic(self, component, stop=None):
+        """Whether a component from components(stop) contains a cycle."""
+        return len(component) > 1 or (component[0] != stop and component[0] in self.successors(component[0]))
+    
+    def reachable(self, start, stop=None):
+        """Mark every node reachable from node id start without leaving node id stop."""
+        seen = bytearray(len(self.names))
+        seen[start] = 1
+        stack = [start]
+        while stack:
+            v = stack.pop()
+            if v == stop:
+                continue
+            for w in self.successors(v):
+                if not seen[w]:
+                    seen[w] = 1
+                    stack.append(w)
+        return seen
+    
+    def routes(self, start, end):
+        """The components on some route from node id start to node id end.
         
-        total = 0
-        for neighbor in graph.get(node, []):
-            if neighbor not in path:  # Avoid cycles
-                total += dfs(neighbor, visited_required, path | {neighbor})
+        They come in the same order as components(), successors first.
+        A path stops on reaching end, so edges out of end are ignored and
+        a cycle back through end is not on a route.
+        """
+        reached = self.reachable(start, end)
+        reaches_end = bytearray(len(self.names))
+        routes = []
+        for component in self.components(end):
+            if not reached[component[0]]:
+                continue
+            # Successor components come first, so their marks are final
+            if end in component or any(reaches_end[w] for v in component for w in self.successors(v)):
+                for v in component:
+                    reaches_end[v] = 1
+                routes.append(component)
+        return routes
+    
+    def cycles_on_route(self, start, end):
+        """The cycles, as sorted lists of names, between named nodes start and end.
         
-        cache[cache_key] = total
-        return total
+        Each is a strongly connected component with a cycle that lies on
+        some route from start to end.
+        """
+        if start not in self.ids or end not in self.ids:
+            return []
+        end = self.ids[end]
+        return self._named_cycles(self.routes(self.ids[start], end), end)
     
-    return dfs(start, frozenset(), {start})
+    def _named_cycles(self, components, stop):
+        return [sorted(self.names[v] for v in component)
+                for component in components if self.is_cyclic(component, stop)]
+    
+    def count_paths(self, start, end, required_nodes=(), on_cycle='raise'):
+        """Count paths from start to end that visit every required node.
+        
+        The graph is condensed to its strongly connected components first.
+        If any on a route from start to end has a cycle there are infinitely
+        many paths, so a CycleError naming the cycles is raised, or
+        math.inf returned with on_cycle='inf'; cycles off every route don't
+        matter. Otherwise one sweep over the route fills
+        ways[v * masks + m], the number of paths from v to end that visit
+        exactly the required nodes in bitmask m, so the work is
+        O((V + E) * 2^k) for k required nodes.
+        """
+        required_nodes = list(dict.fromkeys(required_nodes))
+        if start not in self.ids or end not in self.ids or any(r not in self.ids for r in required_nodes):
+            return 0
+        routes = self.routes(self.ids[start], self.ids[end])
+        cycles = self._named_cycles(routes, self.ids[end])
+        if cycles:
+            if on_cycle == 'inf':
+                return math.inf
+            raise CycleError(start, end, cycles)
+        
+        start, end = self.ids[start], self.ids[end]
+        bits = {self.ids[name]: 1 << k for k, name in enumerate(required_nodes)}
+        masks = 1 << len(required_nodes)
+        
+        offsets, targets = self.offsets, self.targets
+        ways = [0] * (len(self.names) * masks)
+        # With no cycles on the route, each of its components is one node
+        for (v,) in routes:
+            base = v * masks
+            bit = bits.get(v, 0)
+            if v == end:
+                ways[base + bit] = 1
+                continue
+            for edge in range(offsets[v], offsets[v + 1]):
+                other = targets[edge] * masks
+                for m in range(masks):
+                    if ways[other + m]:
+                        ways[base + (m | bit)] += ways[other + m]
+        
+        return ways[start * masks + masks - 1]
 
 
+def count_paths(graph, start, end, required_nodes=None, on_cycle='raise'):
+    """Count all paths from start to end.
+    
+    If required_nodes is provided, only count paths that visit all required nodes.
+    See CompiledGraph.count_paths for on_cycle.
+    """
+    return CompiledGraph(graph).count_paths(start, end, required_nodes or (), on_cycle)
+
 def solve_part1(input_filename='day11-input.txt'):
     """Solve Part 1 - count all paths from 'you' to 'out'."""
     graph = parse_input(input_filename)
@@ -74,6 +236,12 @@ def solve_part2(input_filename='day11-input.txt'):
     return count_paths(graph, 'svr', 'out', required_nodes=required)
 
 
+def solve_both(input_filename='day11-input.txt'):
+    """Solve both parts from a single parse of the graph."""
+    graph = CompiledGraph(parse_input(input_filename))
+    return graph.count_paths('you', 'out'), graph.count_paths('svr', 'out', ('dac', 'fft'))
+
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
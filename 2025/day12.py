@@ -1,13 +1,20 @@
-import os
+from grid import Grid, placements
+from lazy_import import lazy_import
+from parse_cache import cached_parse
+from puzzle_input import open_input
 
 
+np = lazy_import('numpy')
+
+EMPTY = ord('.')
+PLACED = ord('#')
+
+
+@cached_parse
 def parse_input(input_filename):
     """Parse the input file."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, input_filename)
-    
-    with open(input_file, 'r') as f:
-        lines = [line.rstrip('\n') for line in f.readlines()]
+    with open_input(input_filename) as data:
+        lines = [line.decode() for line in data.lines(strip=False, keep_blank=True)]
     
     # Parse shapes and regions
     shapes = {}
@@ -89,47 +96,14 @@ def get_all_orientations(shape_lines):
     return list(orientations)
 
 
-def can_place(grid, cells, row, col):
-    """Check if a shape can be placed at a given position."""
-    # Early exit if empty
-    if not cells:
-        return False
-    
-    height = len(grid)
-    width = len(grid[0])
-    
-    # Quick bounds check on extent
-    max_dr = max(dr for dr, dc in cells)
-    max_dc = max(dc for dr, dc in cells)
-    if row + max_dr >= height or col + max_dc >= width:
-        return False
-    
-    for dr, dc in cells:
-        r, c = row + dr, col + dc
-        if r < 0 or r >= height or c < 0 or c >= width:
-            return False
-        if grid[r][c] != '.':
-            return False
-    return True
-
-
-def place_shape(grid, cells, row, col, mark):
-    """Place a shape on the grid."""
-    for dr, dc in cells:
-        r, c = row + dr, col + dc
-        grid[r][c] = mark
-
-
-def remove_shape(grid, cells, row, col):
-    """Remove a shape from the grid."""
-    for dr, dc in cells:
-        r, c = row + dr, col + dc
-        grid[r][c] = '.'
-
-
 def try_fit_presents(width, height, presents_list, shape_orientations):
-    """Try to fit all presents into a region using backtracking."""
-    grid = [['.' for _ in range(width)] for _ in range(height)]
+    """Try to fit all presents into a region using backtracking.
+    
+    Rather than testing every position one by one, each step finds every
+    position an orientation fits with one vectorised pass over the free
+    cells, then tries those in the same row-major order.
+    """
+    grid = Grid.blank(height, width)
     
     # Sort presents by size (larger first) for better pruning
     presents_with_sizes = []
@@ -140,46 +114,43 @@ def try_fit_presents(width, height, presents_list, shape_orientations):
     presents_with_sizes.sort(reverse=True)
     sorted_presents = [shape_idx for _, shape_idx in presents_with_sizes]
     
-    # For each shape, precompute valid positions for each orientation
-    valid_positions = {}
+    # Index arrays for each orientation, so placing a shape is one assignment
+    orientation_cells = {}
     for shape_idx in set(sorted_presents):
-        valid_positions[shape_idx] = []
-        for orientation in shape_orientations[shape_idx]:
-            positions = []
-            # Only check positions where the shape could actually fit
-            max_dr = max(dr for dr, dc in orientation) if orientation else 0
-            max_dc = max(dc for dr, dc in orientation) if orientation else 0
-            for row in range(height - max_dr):
-                for col in range(width - max_dc):
-                    positions.append((orientation, row, col))
-            valid_positions[shape_idx].append(positions)
+        orientation_cells[shape_idx] = [(orientation,
+                                         np.array([dr for dr, _ in orientation]),
+                                         np.array([dc for _, dc in orientation]))
+                                        for orientation in shape_orientations[shape_idx] if orientation]
     
     def backtrack(present_idx):
         if present_idx >= len(sorted_presents):
             return True  # All presents placed successfully
         
         shape_idx = sorted_presents[present_idx]
+        free = grid.cells == EMPTY
         
-        # Try each orientation with its valid positions
-        for positions in valid_positions[shape_idx]:
-            for orientation, row, col in positions:
-                if can_place(grid, orientation, row, col):
-                    place_shape(grid, orientation, row, col, str(present_idx))
-                    
-                    if backtrack(present_idx + 1):
-                        return True
-                    
-                    remove_shape(grid, orientation, row, col)
+        # Try each orientation at every position it fits
+        for orientation, rows, cols in orientation_cells[shape_idx]:
+            fits = placements(free, orientation)
+            if not fits.size:
+                continue
+            fit_width = fits.shape[1]
+            for anchor in np.flatnonzero(fits):
+                row, col = divmod(int(anchor), fit_width)
+                grid.cells[rows + row, cols + col] = PLACED
+                
+                if backtrack(present_idx + 1):
+                    return True
+                
+                grid.cells[rows + row, cols + col] = EMPTY
         
         return False
     
     return backtrack(0)
 
 
-def solve_part1(input_filename='day12-input.txt'):
-    """Solve part 1."""
-    shapes, regions = parse_input(input_filename)
-    
+def count_fitting_regions(shapes, regions):
+    """Count the regions that can fit all of their presents."""
     # Precompute all orientations for each shape
     shape_orientations = {}
     for idx, shape_lines in shapes.items():
@@ -209,6 +180,17 @@ def solve_part1(input_filename='day12-input.txt'):
     return count
 
 
+def solve_part1(input_filename='day12-input.txt'):
+    """Solve part 1."""
+    shapes, regions = parse_input(input_filename)
+    return count_fitting_regions(shapes, regions)
+
+
+def solve_both(input_filename='day12-input.txt'):
+    """Solve both parts; day 12 only has a first part, so the second is None."""
+    return solve_part1(input_filename), None
+
+
 if __name__ == "__main__":
     result1 = solve_part1()
     print(f"Part 1: {result1}")
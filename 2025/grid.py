@@ -0,0 +1,133 @@
+"""Compact character grid backed by a uint8 NumPy array.
+
+Each cell holds the byte value of its character, so a 140x140 puzzle is a
+single 20 KB contiguous array instead of a list of strings, and whole-grid
+questions (which cells are '@', how many neighbours each has, where could
+this shape go) are answered with a handful of vectorised operations
+instead of a Python loop per cell.
+"""
+from lazy_import import lazy_import
+
+
+np = lazy_import('numpy')
+
+# Padding for ragged rows; never a real puzzle character
+ABSENT = 0
+
+NEIGHBORS_8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+NEIGHBORS_4 = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+
+def shift(mask, dr, dc, fill=0):
+    """Shift an array so result[r, c] == mask[r + dr, c + dc], filling what falls off the edge."""
+    rows, cols = mask.shape
+    result = np.full_like(mask, fill)
+    if abs(dr) >= rows or abs(dc) >= cols:
+        return result
+    src_rows = slice(max(dr, 0), rows + min(dr, 0))
+    dst_rows = slice(max(-dr, 0), rows + min(-dr, 0))
+    src_cols = slice(max(dc, 0), cols + min(dc, 0))
+    dst_cols = slice(max(-dc, 0), cols + min(-dc, 0))
+    result[dst_rows, dst_cols] = mask[src_rows, src_cols]
+    return result
+
+
+def neighbor_count(mask, diagonal=True):
+    """Count, for every cell, how many of its neighbours are set in mask."""
+    padded = np.pad(mask.astype(np.uint8), 1)
+    rows, cols = mask.shape
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for dr, dc in NEIGHBORS_8 if diagonal else NEIGHBORS_4:
+        counts += padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+    return counts
+
+
+def placements(free, offsets):
+    """Find every anchor where a shape fits entirely on free cells.
+
+    offsets are (dr, dc) pairs with non-negative components, relative to
+    the anchor. Returns a bool array over anchors (row, col) whose shape
+    stays inside the grid; result[r, c] is True when every free[r + dr, c + dc] is.
+    """
+    rows, cols = free.shape
+    max_dr = max(dr for dr, _ in offsets)
+    max_dc = max(dc for _, dc in offsets)
+    if max_dr >= rows or max_dc >= cols:
+        return np.zeros((0, 0), dtype=bool)
+    fits = np.ones((rows - max_dr, cols - max_dc), dtype=bool)
+    for dr, dc in offsets:
+        fits &= free[dr:rows - max_dr + dr, dc:cols - max_dc + dc]
+    return fits
+
+
+class Grid:
+    """A rectangular grid of single-byte characters."""
+    __slots__ = ('cells',)
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Build a grid from str or bytes lines, padding short lines with ABSENT."""
+        height = len(lines)
+        width = max((len(line) for line in lines), default=0)
+        cells = np.full((height, width), ABSENT, dtype=np.uint8)
+        for row, line in enumerate(lines):
+            if line:
+                if isinstance(line, str):
+                    line = line.encode('latin-1')
+                cells[row, :len(line)] = np.frombuffer(line, dtype=np.uint8)
+        return cls(cells)
+
+    @classmethod
+    def blank(cls, height, width, fill='.'):
+        """A height x width grid filled with one character."""
+        return cls(np.full((height, width), ord(fill), dtype=np.uint8))
+
+    @property
+    def height(self):
+        return self.cells.shape[0]
+
+    @property
+    def width(self):
+        return self.cells.shape[1]
+
+    def __len__(self):
+        return self.height
+
+    def char_at(self, row, col):
+        return chr(self.cells[row, col])
+
+    def mask(self, char):
+        """Bool array of the cells holding char."""
+        return self.cells == ord(char)
+
+    def present(self):
+        """Bool array of the cells that came from the input rather than padding."""
+        return self.cells != ABSENT
+
+    def find(self, char):
+        """Return (row, col) of the first char in reading order, or None."""
+        hits = np.flatnonzero(self.mask(char))
+        if hits.size == 0:
+            return None
+        return divmod(int(hits[0]), self.width)
+
+    def count(self, char):
+        return int(np.count_nonzero(self.mask(char)))
+
+    def set_where(self, mask, char):
+        """Set every cell selected by mask to char."""
+        self.cells[mask] = ord(char)
+
+    def neighbor_count(self, char, diagonal=True):
+        """Count, for every cell, how many neighbours hold char."""
+        return neighbor_count(self.mask(char), diagonal)
+
+    def to_lines(self):
+        """The grid as text lines, without padding."""
+        return [bytes(row[row != ABSENT]).decode('latin-1') for row in self.cells]
+
+    def copy(self):
+        return Grid(self.cells.copy())
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from grid import Grid, shift, neighbor_count, placements
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_lines(['..@', '@@.', '.@@'])
+    
+    def test_from_lines_round_trip(self):
+        """Lines go in and come back out unchanged, ragged ones included."""
+        self.assertEqual(self.grid.to_lines(), ['..@', '@@.', '.@@'])
+        ragged = Grid.from_lines(['S..', '.', '...'])
+        self.assertEqual(ragged.to_lines(), ['S..', '.', '...'])
+        self.assertFalse(ragged.present()[1, 2])
+    
+    def test_find_and_count(self):
+        self.assertEqual(self.grid.find('@'), (0, 2))
+        self.assertIsNone(self.grid.find('S'))
+        self.assertEqual(self.grid.count('@'), 5)
+        self.assertEqual(self.grid.char_at(1, 0), '@')
+    
+    def test_neighbor_count(self):
+        """Neighbour counts match a direct count for every cell."""
+        counts = self.grid.neighbor_count('@')
+        lines = self.grid.to_lines()
+        for r in range(3):
+            for c in range(3):
+                expected = sum(lines[r + dr][c + dc] == '@'
+                               for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                               if (dr or dc) and 0 <= r + dr < 3 and 0 <= c + dc < 3)
+                self.assertEqual(counts[r, c], expected)
+        self.assertEqual(neighbor_count(self.grid.mask('@'), diagonal=False)[1, 1], 2)
+    
+    def test_shift(self):
+        """shift(mask, dr, dc)[r, c] is mask[r + dr, c + dc], zero off the edge."""
+        a = np.arange(9).reshape(3, 3)
+        self.assertEqual(shift(a, 0, 1).tolist(), [[1, 2, 0], [4, 5, 0], [7, 8, 0]])
+        self.assertEqual(shift(a, -1, 0).tolist(), [[0, 0, 0], [0, 1, 2], [3, 4, 5]])
+        self.assertEqual(shift(a, 5, 0).tolist(), [[0] * 3] * 3)
+    
+    def test_set_where(self):
+        """Masked updates change exactly the selected cells."""
+        self.grid.set_where(self.grid.mask('@') & (self.grid.neighbor_count('@') >= 3), 'x')
+        self.assertEqual(self.grid.to_lines(), ['..@', '@x.', '.x@'])
+    
+    def test_placements(self):
+        """A shape fits at an anchor only when all its cells are free."""
+        free = Grid.from_lines(['...', '.#.', '...']).mask('.')
+        domino = [(0, 0), (0, 1)]
+        self.assertEqual(placements(free, domino).tolist(),
+                         [[True, True], [False, False], [True, True]])
+        self.assertEqual(placements(free, [(0, 0), (3, 0)]).size, 0)
+    
+    def test_copy_is_independent(self):
+        copy = self.grid.copy()
+        copy.set_where(copy.mask('@'), '.')
+        self.assertEqual(self.grid.count('@'), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Defer heavy imports until a module attribute is first used.
+
+    np = lazy_import('numpy')
+
+binds a placeholder at import time; the real import happens on the first
+np.<attribute> access, once per process. Test collection, the runner's
+parent process and days that never touch the dependency don't pay for it.
+"""
+import sys
+
+
+class LazyModule(type(sys)):
+    """Placeholder that imports the named module on first attribute access.
+
+    It derives from type(sys), the module type, so that importing this
+    module costs no more than the placeholders it saves.
+    """
+
+    def __getattr__(self, attribute):
+        __import__(self.__name__)
+        module = sys.modules[self.__name__]
+        # Copy the real namespace in, so later lookups never reach __getattr__
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name):
+    """Return name's module if already imported, else a LazyModule for it."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def is_loaded(module):
+    """Whether a module returned by lazy_import has been imported yet."""
+    return not isinstance(module, LazyModule) or module.__name__ in sys.modules
@@ -0,0 +1,25 @@
+import sys
+import unittest
+from lazy_import import LazyModule, is_loaded, lazy_import
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_loaded_module_is_returned_directly(self):
+        """Modules that are already imported are not wrapped."""
+        self.assertIs(lazy_import('sys'), sys)
+        self.assertTrue(is_loaded(lazy_import('sys')))
+    
+    def test_import_on_first_attribute(self):
+        """The real module is imported on first use and its namespace copied in."""
+        name = 'colorsys'
+        sys.modules.pop(name, None)
+        module = lazy_import(name)
+        self.assertIsInstance(module, LazyModule)
+        self.assertFalse(is_loaded(module))
+        self.assertEqual(module.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertTrue(is_loaded(module))
+        self.assertIn('hsv_to_rgb', vars(module))
+
+
+if __name__ == '__main__':
+    unittest.main()
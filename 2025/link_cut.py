@@ -0,0 +1,174 @@
+"""Link-cut trees: a forest that supports link, cut and path-maximum queries.
+
+Each operation takes amortised O(log n) time (Sleator and Tarjan), which is
+what keeps a minimum spanning tree current under insertions: a new edge
+(u, v) belongs in the tree exactly when it is lighter than the heaviest
+edge on the tree path from u to v, and that edge is the one it replaces.
+
+Edges carry the weights, so each edge is its own node sitting between its
+two endpoints; vertex nodes have no weight.
+"""
+
+
+class LinkCutTree:
+    """A forest of vertices and weighted edges.
+
+    Weights can be anything comparable; ties should be broken by the
+    caller (day08 weighs by (squared distance, i, j)).
+    """
+    __slots__ = ('left', 'right', 'parent', 'flipped', 'weight', 'heaviest', 'ends')
+
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flipped = []
+        self.weight = []    # None for vertices
+        self.heaviest = []  # heaviest edge node in each splay subtree, or -1
+        self.ends = {}      # edge node -> (u, v)
+
+    def _new_node(self, weight):
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flipped.append(False)
+        self.weight.append(weight)
+        self.heaviest.append(-1 if weight is None else len(self.weight) - 1)
+        return len(self.weight) - 1
+
+    def add_vertex(self):
+        """Add an isolated vertex and return its node id."""
+        return self._new_node(None)
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        if self.flipped[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left != -1:
+                self.flipped[left] = not self.flipped[left]
+            if right != -1:
+                self.flipped[right] = not self.flipped[right]
+            self.flipped[x] = False
+
+    def _heavier(self, a, b):
+        if a == -1:
+            return b
+        if b == -1:
+            return a
+        return a if self.weight[a] > self.weight[b] else b
+
+    def _update(self, x):
+        best = -1 if self.weight[x] is None else x
+        if self.left[x] != -1:
+            best = self._heavier(best, self.heaviest[self.left[x]])
+        if self.right[x] != -1:
+            best = self._heavier(best, self.heaviest[self.right[x]])
+        self.heaviest[x] = best
+
+    def _rotate(self, x):
+        p = self.parent[x]
+        g = self.parent[p]
+        if not self._is_splay_root(p):
+            if self.left[g] == p:
+                self.left[g] = x
+            else:
+                self.right[g] = x
+        self.parent[x] = g
+
+        if self.left[p] == x:
+            child = self.right[x]
+            self.left[p] = child
+            self.right[x] = p
+        else:
+            child = self.left[x]
+            self.right[p] = child
+            self.left[x] = p
+        if child != -1:
+            self.parent[child] = p
+        self.parent[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x):
+        # Push pending flips down from the splay root before rotating
+        path = [x]
+        while not self._is_splay_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for node in reversed(path):
+            self._push(node)
+
+        while not self._is_splay_root(x):
+            p = self.parent[x]
+            if not self._is_splay_root(p):
+                g = self.parent[p]
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x):
+        """Make the path from x to its tree root preferred; x ends up the splay root."""
+        last = -1
+        node = x
+        while node != -1:
+            self._splay(node)
+            self.right[node] = last
+            self._update(node)
+            last = node
+            node = self.parent[node]
+        self._splay(x)
+
+    def _make_root(self, x):
+        self._access(x)
+        self.flipped[x] = not self.flipped[x]
+        self._push(x)
+
+    def _link_nodes(self, x, y):
+        self._make_root(x)
+        self.parent[x] = y
+
+    def _cut_nodes(self, x, y):
+        self._make_root(x)
+        self._access(y)
+        # x is now y's left child with nothing between them
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._update(y)
+
+    def connected(self, u, v):
+        if u == v:
+            return True
+        self._make_root(u)
+        self._access(v)
+        # v reaches u's tree only if u is on its root path
+        node = v
+        while self.left[node] != -1:
+            node = self.left[node]
+            self._push(node)
+        self._splay(node)
+        return node == u
+
+    def link(self, u, v, weight):
+        """Join vertices u and v, in different trees, by an edge; returns the edge's id."""
+        edge = self._new_node(weight)
+        self.ends[edge] = (u, v)
+        self._link_nodes(u, edge)
+        self._link_nodes(edge, v)
+        return edge
+
+    def cut(self, edge):
+        """Remove an edge added by link()."""
+        u, v = self.ends.pop(edge)
+        self._cut_nodes(u, edge)
+        self._cut_nodes(edge, v)
+
+    def heaviest_edge(self, u, v):
+        """The heaviest edge on the path between connected vertices u and v, or -1 if u == v."""
+        self._make_root(u)
+        self._access(v)
+        return self.heaviest[v]
@@ -0,0 +1,36 @@
+import unittest
+from link_cut import LinkCutTree
+
+
+class TestLinkCutTree(unittest.TestCase):
+    def setUp(self):
+        # A path 0 - 1 - 2 - 3 plus 1 - 4, weighed by the number on each edge
+        self.tree = LinkCutTree()
+        self.v = [self.tree.add_vertex() for _ in range(5)]
+        self.edges = {
+            (0, 1): self.tree.link(self.v[0], self.v[1], 5),
+            (1, 2): self.tree.link(self.v[1], self.v[2], 9),
+            (2, 3): self.tree.link(self.v[2], self.v[3], 2),
+            (1, 4): self.tree.link(self.v[1], self.v[4], 7),
+        }
+    
+    def test_heaviest_edge_on_path(self):
+        """Path maxima are found between any two vertices."""
+        self.assertEqual(self.tree.heaviest_edge(self.v[0], self.v[3]), self.edges[(1, 2)])
+        self.assertEqual(self.tree.heaviest_edge(self.v[4], self.v[0]), self.edges[(1, 4)])
+        self.assertEqual(self.tree.heaviest_edge(self.v[3], self.v[2]), self.edges[(2, 3)])
+        self.assertEqual(self.tree.heaviest_edge(self.v[2], self.v[2]), -1)
+    
+    def test_cut_and_relink(self):
+        """Replacing the heaviest edge on a cycle keeps the forest consistent."""
+        self.tree.cut(self.edges[(1, 2)])
+        self.assertFalse(self.tree.connected(self.v[0], self.v[3]))
+        self.assertTrue(self.tree.connected(self.v[2], self.v[3]))
+        replacement = self.tree.link(self.v[4], self.v[3], 6)
+        self.assertTrue(self.tree.connected(self.v[0], self.v[3]))
+        self.assertEqual(self.tree.heaviest_edge(self.v[0], self.v[2]), self.edges[(1, 4)])
+        self.assertEqual(self.tree.heaviest_edge(self.v[3], self.v[4]), replacement)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+"""On-disk cache of parsed puzzle inputs.
+
+Decorate a day's parse_input with @cached_parse and the parsed structure is
+pickled under .cache/, keyed on the input file's content hash, the
+parser's compiled code and the source of its module and the helper modules
+it uses (puzzle_input, grid, ...). Re-running a day (tests, benchmarks) then
+skips text parsing entirely, and editing the input, the parser or a helper
+invalidates the entry. An entry that fails to load for any reason is
+treated as a miss. Set AOC_PARSE_CACHE=0 to turn caching off.
+"""
+import os
+import sys
+
+
+CACHE_DIR = os.environ.get(
+    'AOC_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+
+
+def cache_enabled():
+    """Caching is on unless AOC_PARSE_CACHE=0."""
+    return os.environ.get('AOC_PARSE_CACHE', '1') != '0'
+
+
+def _digest(data):
+    import hashlib
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def parser_name(func):
+    """Identify a parser by its module file and qualified name."""
+    module = os.path.splitext(os.path.basename(func.__code__.co_filename))[0]
+    return f"{module}.{func.__qualname__}"
+
+
+def _binder(func):
+    """Return a function mapping (args, kwargs) to func's parameter values, defaults applied.
+
+    Parsers only take plain positional-or-keyword parameters, so this reads
+    the code object directly rather than importing inspect at startup.
+    """
+    code = func.__code__
+    names = code.co_varnames[:code.co_argcount]
+    defaults = func.__defaults__ or ()
+    default_values = dict(zip(names[len(names) - len(defaults):], defaults))
+
+    def bind(args, kwargs):
+        values = dict(default_values)
+        values.update(zip(names, args))
+        values.update(kwargs)
+        return [values[name] for name in names]
+
+    return bind
+
+
+def _entry_prefix(name, input_file):
+    """Entries for one parser reading one file share this prefix."""
+    return f"{name}-{_digest(os.path.abspath(input_file).encode())}-"
+
+
+def _module_file(value):
+    """The source file of a module, or of the module defining value, if known."""
+    if not isinstance(value, type(sys)):
+        value = sys.modules.get(getattr(value, '__module__', None) or '')
+    # Read __dict__ directly: getattr would make a lazy module import itself
+    return value.__dict__.get('__file__') if value is not None else None
+
+
+def _source_digest(func, module_dir):
+    """Hash the source of func's module and every module beside it that it reaches.
+    
+    Helpers are followed through module globals, so a change to
+    puzzle_input or grid invalidates the parsers that use them.
+    """
+    files = set()
+    pending = [func.__code__.co_filename]
+    while pending:
+        path = os.path.abspath(pending.pop())
+        if path in files or os.path.dirname(path) != module_dir or not path.endswith('.py'):
+            continue
+        files.add(path)
+        module = next((m for m in list(sys.modules.values())
+                       if isinstance(m, type(sys)) and m.__dict__.get('__file__')
+                       and os.path.abspath(m.__dict__['__file__']) == path), None)
+        if module is not None:
+            pending.extend(filter(None, map(_module_file, list(module.__dict__.values()))))
+    
+    sources = []
+    for path in sorted(files):
+        with open(path, 'rb') as f:
+            sources.append(f.read())
+    return _digest(b'\0'.join(sources)).encode()
+
+
+def _load(path):
+    """Return (found, value); an entry that can't be unpickled is deleted and missed."""
+    import pickle
+    try:
+        with open(path, 'rb') as f:
+            return True, pickle.load(f)
+    except OSError:
+        return False, None
+    except Exception:
+        # Truncated files, or classes since renamed or moved
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return False, None
+
+
+def _store(path, prefix, value):
+    """Write an entry atomically and drop stale entries for the same parser and file."""
+    import pickle
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+    current = os.path.basename(path)
+    for entry in os.listdir(os.path.dirname(path)):
+        if entry.startswith(prefix) and entry != current and entry.endswith('.pickle'):
+            try:
+                os.remove(os.path.join(os.path.dirname(path), entry))
+            except OSError:
+                pass
+
+
+def cached_parse(func):
+    """Cache func(input_filename) on disk, keyed on the file's contents.
+
+    input_filename is resolved relative to the parser's module, the same
+    way the parse_input functions open it. Everything but the binder is
+    worked out on the first call, so decorating a parser costs an import
+    nothing.
+    """
+    module_dir = os.path.dirname(os.path.abspath(func.__code__.co_filename))
+    bind = _binder(func)
+    name = parser_name(func)
+    parser_key = []  # filled on first call, once the module's imports have run
+
+    def wrapper(*args, **kwargs):
+        if not cache_enabled():
+            return func(*args, **kwargs)
+
+        arguments = bind(args, kwargs)
+        input_file = os.path.join(module_dir, arguments[0])
+
+        try:
+            with open(input_file, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return func(*args, **kwargs)
+
+        if not parser_key:
+            import marshal
+            # The compiled code stands in for the source: any edit to the parser changes it
+            parser_key.append(marshal.dumps(func.__code__) + _source_digest(func, module_dir))
+        key = _digest(content + parser_key[0] + repr(arguments[1:]).encode())
+        prefix = _entry_prefix(name, input_file)
+        path = os.path.join(CACHE_DIR, f"{prefix}{key}.pickle")
+
+        found, value = _load(path)
+        if found:
+            return value
+
+        value = func(*args, **kwargs)
+        try:
+            _store(path, prefix, value)
+        except OSError:
+            pass  # a read-only checkout still parses, just without caching
+        return value
+
+    # What functools.wraps would copy, without importing functools
+    for attribute in ('__module__', '__name__', '__qualname__', '__doc__'):
+        setattr(wrapper, attribute, getattr(func, attribute))
+    wrapper.__dict__.update(func.__dict__)
+    wrapper.__wrapped__ = func
+    wrapper.uncached = func
+    return wrapper
+
+
+def clear_cache():
+    """Remove every cached entry."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for entry in os.listdir(CACHE_DIR):
+        if entry.endswith('.pickle'):
+            os.remove(os.path.join(CACHE_DIR, entry))
@@ -0,0 +1,121 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+import parse_cache
+from parse_cache import cached_parse, clear_cache
+
+
+calls = []
+
+
+@cached_parse
+def parse_numbers(input_filename):
+    """Parse one integer per line, recording each real parse."""
+    calls.append(input_filename)
+    with open(input_filename, 'r') as f:
+        return [int(line) for line in f if line.strip()]
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input_file = os.path.join(self.tmp.name, 'input.txt')
+        self.write('1\n2\n3\n')
+        patcher = mock.patch.object(parse_cache, 'CACHE_DIR', os.path.join(self.tmp.name, 'cache'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        calls.clear()
+    
+    def write(self, text):
+        with open(self.input_file, 'w') as f:
+            f.write(text)
+    
+    def cache_entries(self):
+        return os.listdir(parse_cache.CACHE_DIR)
+    
+    def test_second_call_skips_parsing(self):
+        """Unchanged input is parsed once and then served from the cache."""
+        self.assertEqual(parse_numbers(self.input_file), [1, 2, 3])
+        self.assertEqual(parse_numbers(self.input_file), [1, 2, 3])
+        self.assertEqual(len(calls), 1)
+    
+    def test_cached_value_is_a_fresh_copy(self):
+        """Callers can mutate what they get back without corrupting the cache."""
+        parse_numbers(self.input_file).append(99)
+        self.assertEqual(parse_numbers(self.input_file), [1, 2, 3])
+    
+    def test_changed_content_reparses_and_evicts(self):
+        """Editing the input invalidates its entry and removes the stale one."""
+        parse_numbers(self.input_file)
+        self.write('4\n5\n')
+        self.assertEqual(parse_numbers(self.input_file), [4, 5])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(self.cache_entries()), 1)
+    
+    def test_disabled(self):
+        """AOC_PARSE_CACHE=0 always parses and writes nothing."""
+        with mock.patch.dict(os.environ, {'AOC_PARSE_CACHE': '0'}):
+            parse_numbers(self.input_file)
+            parse_numbers(self.input_file)
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(os.path.exists(parse_cache.CACHE_DIR))
+    
+    def test_corrupt_entry_is_reparsed(self):
+        """A damaged cache file falls back to parsing."""
+        parse_numbers(self.input_file)
+        for entry in self.cache_entries():
+            with open(os.path.join(parse_cache.CACHE_DIR, entry), 'wb') as f:
+                f.write(b'not a pickle')
+        self.assertEqual(parse_numbers(self.input_file), [1, 2, 3])
+        self.assertEqual(len(calls), 2)
+    
+    def test_unloadable_entry_is_reparsed_and_replaced(self):
+        """An entry naming a class that no longer exists is a miss, not a crash."""
+        parse_numbers(self.input_file)
+        # A pickle of a global from a module that has since gone away
+        for entry in self.cache_entries():
+            with open(os.path.join(parse_cache.CACHE_DIR, entry), 'wb') as f:
+                f.write(b'\x80\x04cno_such_module\nThing\n.')
+        self.assertEqual(parse_numbers(self.input_file), [1, 2, 3])
+        self.assertEqual(parse_numbers(self.input_file), [1, 2, 3])
+        self.assertEqual(len(calls), 2)
+    
+    def test_source_digest_follows_helpers(self):
+        """Editing a helper module the parser's module imports changes the key."""
+        def write(name, text):
+            with open(os.path.join(self.tmp.name, name), 'w') as f:
+                f.write(text)
+        
+        write('cache_helper.py', 'def split(line):\n    return line.split()\n')
+        write('cache_day.py', 'from cache_helper import split\n\ndef parse(name):\n    return split(name)\n')
+        sys.path.insert(0, self.tmp.name)
+        self.addCleanup(sys.path.remove, self.tmp.name)
+        self.addCleanup(sys.modules.pop, 'cache_day', None)
+        self.addCleanup(sys.modules.pop, 'cache_helper', None)
+        
+        parse = importlib.import_module('cache_day').parse
+        before = parse_cache._source_digest(parse, self.tmp.name)
+        write('cache_helper.py', 'def split(line):\n    return line.split(",")\n')
+        self.assertNotEqual(parse_cache._source_digest(parse, self.tmp.name), before)
+    
+    def test_clear_cache(self):
+        """clear_cache removes every entry."""
+        parse_numbers(self.input_file)
+        clear_cache()
+        self.assertEqual(self.cache_entries(), [])
+    
+    def test_day_parsers_match_uncached(self):
+        """The cached day parsers return exactly what the raw parsers do."""
+        from day05 import parse_input as parse_day05
+        from day08 import parse_input as parse_day08
+        for parse, filename in ((parse_day05, 'day05-test.txt'), (parse_day08, 'day08-test.txt')):
+            self.assertEqual(parse(filename), parse.uncached(filename))
+            self.assertEqual(parse(filename), parse.uncached(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
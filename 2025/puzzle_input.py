@@ -0,0 +1,110 @@
+"""Memory-mapped puzzle input.
+
+open_input() maps an input file read-only and hands the parsers bytes
+straight out of the mapping: lines, blank-line separated sections, or
+integer tokens. No list of str is built for the whole file first, and
+int() takes bytes directly, so most parsers never decode at all.
+
+Filenames are resolved relative to the module that calls open_input(),
+so `python 2025/day11.py` works from any directory.
+
+    with open_input('day08-input.txt') as data:
+        coords = list(zip(*[data.ints()] * 3))
+"""
+import os
+import sys
+
+
+INT_PATTERN = rb'-?\d+'
+UNSIGNED_PATTERN = rb'\d+'
+
+
+def input_path(filename, depth=0):
+    """Resolve filename against the directory of the calling module (depth frames further up)."""
+    if os.path.isabs(filename):
+        return filename
+    caller_file = sys._getframe(depth + 1).f_globals.get('__file__')
+    if caller_file is None:
+        return os.path.abspath(filename)  # interactive session
+    return os.path.join(os.path.dirname(os.path.abspath(caller_file)), filename)
+
+
+class PuzzleInput:
+    """A read-only mapping of an input file with bytes-level iterators."""
+
+    def __init__(self, path):
+        self.path = path
+        import mmap  # not needed until a file is opened
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Empty files can't be mapped
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def __len__(self):
+        return len(self.data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if not isinstance(self.data, bytes):
+            self.data.close()
+
+    @property
+    def view(self):
+        """A memoryview over the whole file; release it before close()."""
+        return memoryview(self.data)
+
+    def lines(self, strip=True, keep_blank=False):
+        """Yield each line as bytes.
+
+        With strip, surrounding whitespace is removed; otherwise only the
+        line ending is, which keeps column alignment. Blank lines are
+        skipped unless keep_blank is set.
+        """
+        data = self.data
+        start, end = 0, len(data)
+        while start < end:
+            stop = data.find(b'\n', start)
+            if stop < 0:
+                stop = end
+            line = data[start:stop]
+            start = stop + 1
+            line = line.strip() if strip else line.rstrip(b'\r')
+            if line or keep_blank:
+                yield line
+
+    def sections(self, strip=True):
+        """Yield each blank-line separated block as a list of lines."""
+        section = []
+        for line in self.lines(strip, keep_blank=True):
+            if line.strip():
+                section.append(line)
+            elif section:
+                yield section
+                section = []
+        if section:
+            yield section
+
+    def ints(self, signed=True):
+        """Yield every integer in the file in order.
+
+        With signed=False a '-' is never part of a number, so ranges like
+        '11-22' read as 11, 22.
+        """
+        import re
+        pattern = INT_PATTERN if signed else UNSIGNED_PATTERN
+        for match in re.finditer(pattern, self.data):
+            yield int(match.group())
+
+    def text(self):
+        """The whole file decoded as a str."""
+        return self.data[:].decode()
+
+
+def open_input(filename):
+    """Map filename, resolved relative to the calling module."""
+    return PuzzleInput(input_path(filename, depth=1))
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from puzzle_input import PuzzleInput, input_path, open_input
+
+
+class TestPuzzleInput(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def load(self, content):
+        path = os.path.join(self.tmp.name, 'input.txt')
+        with open(path, 'wb') as f:
+            f.write(content)
+        data = PuzzleInput(path)
+        self.addCleanup(data.close)
+        return data
+
+    def test_lines_strip_and_skip_blanks(self):
+        """Lines come back as stripped bytes, without blank lines or CRs."""
+        data = self.load(b'  a1 \r\n\nb2\nc3')
+        self.assertEqual(list(data.lines()), [b'a1', b'b2', b'c3'])
+
+    def test_lines_keep_alignment(self):
+        """Unstripped lines keep leading and trailing spaces."""
+        data = self.load(b' 1  \n\n22 \n')
+        self.assertEqual(list(data.lines(strip=False, keep_blank=True)), [b' 1  ', b'', b'22 '])
+
+    def test_sections(self):
+        """Blank lines split the file into sections."""
+        data = self.load(b'3-5\n10-14\n\n\n1\n5\n')
+        self.assertEqual(list(data.sections()), [[b'3-5', b'10-14'], [b'1', b'5']])
+
+    def test_ints(self):
+        """Integer tokens are found anywhere, with or without signs."""
+        data = self.load(b'11-22,-5 x7\n')
+        self.assertEqual(list(data.ints()), [11, -22, -5, 7])
+        self.assertEqual(list(data.ints(signed=False)), [11, 22, 5, 7])
+
+    def test_empty_file(self):
+        """An empty file can't be mapped but still reads as empty."""
+        data = self.load(b'')
+        self.assertEqual(len(data), 0)
+        self.assertEqual(list(data.lines()), [])
+        self.assertEqual(data.text(), '')
+
+    def test_view_is_zero_copy(self):
+        """The memoryview reads straight from the mapping."""
+        data = self.load(b'abc\n')
+        view = data.view
+        self.assertEqual(bytes(view[:3]), b'abc')
+        view.release()
+
+    def test_paths_resolve_relative_to_caller(self):
+        """Relative names resolve against this module, not the working directory."""
+        here = os.path.dirname(os.path.abspath(__file__))
+        self.assertEqual(input_path('day01-test.txt'), os.path.join(here, 'day01-test.txt'))
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            with open_input('day11-test.txt') as data:
+                self.assertTrue(next(data.lines()).startswith(b'aaa:'))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    unittest.main()
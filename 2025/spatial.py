@@ -0,0 +1,384 @@
+"""Closest-pair search over integer points with a uniform spatial hash.
+
+Points are bucketed into cubic cells whose side is the search radius, so
+every pair within that radius lies in the same cell or in one of the
+neighbouring cells. Only those cell pairs are expanded, so finding the k
+closest pairs costs about O(n log n + k) instead of the O(n^2) of
+measuring every pair.
+
+Distances are squared and exact (int64), and pairs come out in increasing
+(squared distance, i, j) order with i < j: the same order as sorting every
+pair by Euclidean distance and then by index.
+
+spanning_tree() covers the other end: when every point must end up
+connected, Prim's algorithm over the implicit complete graph gives the
+same tree as running Kruskal over the full sorted pair list.
+
+tiled_k_closest() and tiled_pairs() measure every pair exhaustively, for
+audits and for data the spatial hash suits badly, in tiles of bounded size.
+
+PointGrid is the incremental counterpart of the hash, for points that
+arrive one at a time.
+"""
+from itertools import product
+from math import isqrt
+
+from lazy_import import lazy_import
+
+
+np = lazy_import('numpy')
+
+
+def as_points(coords):
+    """Coordinates as an (n, dims) int64 array."""
+    points = np.asarray(coords, dtype=np.int64)
+    return points.reshape(len(points), -1)
+
+
+def squared_span(points):
+    """Squared length of the bounding box diagonal: no pair is further apart."""
+    extent = points.max(axis=0) - points.min(axis=0)
+    return int((extent * extent).sum())
+
+
+def estimate_radius(points, pairs):
+    """Radius expected to enclose about pairs pairs if points are spread uniformly."""
+    n, dims = points.shape
+    extent = points.max(axis=0) - points.min(axis=0) + 1
+    volume = float(np.prod(extent.astype(float)))
+    # pairs ~ n^2 / 2 * (2r)^dims / volume, taking a cube for the ball
+    radius = (2 * pairs * volume / (n * n)) ** (1 / dims) / 2
+    return max(1, int(radius) + 1)
+
+
+def _half_offsets(dims):
+    """Neighbour cell offsets with the first non-zero component positive, plus zero."""
+    return [offset for offset in product((-1, 0, 1), repeat=dims)
+            if not any(offset) or next(c for c in offset if c) > 0]
+
+
+def _expand(starts_a, counts_a, starts_b, counts_b):
+    """Every (position in a, position in b) pair between matched cells."""
+    sizes = counts_a * counts_b
+    owner = np.repeat(np.arange(len(sizes)), sizes)
+    rank = np.arange(int(sizes.sum())) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    width = counts_b[owner]
+    return starts_a[owner] + rank // width, starts_b[owner] + rank % width
+
+
+def pairs_within(points, radius):
+    """All pairs closer than or at radius, as (squared distance, i, j) arrays with i < j.
+
+    The arrays are in no particular order.
+    """
+    n, dims = points.shape
+    empty = np.zeros(0, dtype=np.int64)
+    if n < 2:
+        return empty, empty, empty
+
+    # Cell coordinates padded by one, so neighbour offsets never wrap around
+    cells = (points - points.min(axis=0)) // radius + 1
+    shape = cells.max(axis=0) + 2
+    strides = np.cumprod(np.concatenate(([1], shape[:0:-1])))[::-1]
+    keys = cells @ strides
+
+    order = np.argsort(keys, kind='stable')
+    cell_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+    first, second = [], []
+    for offset in _half_offsets(dims):
+        target = cell_keys + int(np.dot(offset, strides))
+        match = np.searchsorted(cell_keys, target)
+        match[match == len(cell_keys)] = 0
+        found = np.flatnonzero(cell_keys[match] == target)
+        a, b = _expand(starts[found], counts[found], starts[match[found]], counts[match[found]])
+        if not any(offset):
+            keep = a < b
+            a, b = a[keep], b[keep]
+        first.append(order[a])
+        second.append(order[b])
+
+    i = np.concatenate(first)
+    j = np.concatenate(second)
+    delta = points[i] - points[j]
+    distances = np.einsum('ij,ij->i', delta, delta)
+    keep = distances <= radius * radius
+    i, j, distances = i[keep], j[keep], distances[keep]
+    return distances, np.minimum(i, j), np.maximum(i, j)
+
+
+def sort_pairs(distances, i, j):
+    """Order pair arrays by (squared distance, i, j)."""
+    order = np.lexsort((j, i, distances))
+    return distances[order], i[order], j[order]
+
+
+def _smallest(distances, i, j, k):
+    """The k smallest pairs by (squared distance, i, j), sorted."""
+    if len(distances) > k:
+        # Everything up to the k-th smallest distance, ties included, then sort that
+        cutoff = np.partition(distances, k - 1)[k - 1]
+        keep = distances <= cutoff
+        distances, i, j = distances[keep], i[keep], j[keep]
+    distances, i, j = sort_pairs(distances, i, j)
+    return distances[:k], i[:k], j[:k]
+
+
+def k_closest_pairs(points, k):
+    """The k closest pairs as sorted (squared distance, i, j) arrays.
+
+    The search radius starts from a density estimate and doubles until it
+    encloses at least k pairs, or every pair.
+    """
+    n = len(points)
+    k = min(k, n * (n - 1) // 2)
+    if k <= 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+
+    span = squared_span(points)
+    radius = estimate_radius(points, k)
+    while True:
+        distances, i, j = pairs_within(points, radius)
+        if len(distances) >= k or radius * radius >= span:
+            break
+        radius *= 2
+
+    return _smallest(distances, i, j, k)
+
+
+def closest_pairs(points, batch=1024):
+    """Yield (squared distance, i, j) for every pair, closest first.
+
+    Pairs are produced lazily in distance bands: each band doubles the
+    radius and only the pairs beyond the previous band are sorted and
+    yielded, so taking the first few costs little however many points
+    there are.
+    """
+    n = len(points)
+    if n < 2:
+        return
+
+    span = squared_span(points)
+    radius = estimate_radius(points, min(batch, n * (n - 1) // 2))
+    done = -1
+    while done < span:
+        distances, i, j = pairs_within(points, radius)
+        band = distances > done
+        distances, i, j = sort_pairs(distances[band], i[band], j[band])
+        yield from zip(distances.tolist(), i.tolist(), j.tolist())
+        done = radius * radius
+        radius *= 2
+
+
+def spanning_tree(points):
+    """Minimum spanning tree of the complete graph on points, by Prim's algorithm.
+
+    Edges are weighed by (squared distance, i, j), which makes every weight
+    distinct, so the tree is exactly the one Kruskal's algorithm picks from
+    the sorted pair list. Each step measures one row of distances with
+    NumPy and no edge list is built: O(n^2) time, O(n) memory. Returns
+    (squared distance, i, j) arrays in the order Kruskal would add them.
+    """
+    n, dims = points.shape
+    # Vertices outside the tree occupy the first remaining slots of these
+    # arrays; a vertex joining the tree is swapped to the end.
+    vertices = np.arange(n)
+    axes = [points[:, axis].copy() for axis in range(dims)]
+    best = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    source = np.zeros(n, dtype=np.int64)  # tree end of each best edge
+    edges = np.zeros((3, max(n - 1, 0)), dtype=np.int64)
+
+    slot = 0
+    for remaining in range(n - 1, 0, -1):
+        vertex = vertices[slot]
+        _swap_out(slot, remaining, vertices, best, source, *axes)
+        distances = sum((axes[axis][:remaining] - points[vertex, axis]) ** 2 for axis in range(dims))
+
+        outside = vertices[:remaining]
+        better = distances < best[:remaining]
+        tied = np.flatnonzero(distances == best[:remaining])
+        if len(tied):
+            # Same length: the edge with the smaller (low, high) endpoints wins
+            current = np.stack([np.minimum(source[tied], outside[tied]), np.maximum(source[tied], outside[tied])])
+            new = np.stack([np.minimum(vertex, outside[tied]), np.maximum(vertex, outside[tied])])
+            better[tied] = (new[0] < current[0]) | ((new[0] == current[0]) & (new[1] < current[1]))
+        best[:remaining][better] = distances[better]
+        source[:remaining][better] = vertex
+
+        # Next vertex: the outside one with the lightest edge, ties by (low, high)
+        slot = int(np.argmin(best[:remaining]))
+        lightest = np.flatnonzero(best[:remaining] == best[slot])
+        if len(lightest) > 1:
+            low = np.minimum(source[lightest], outside[lightest])
+            high = np.maximum(source[lightest], outside[lightest])
+            slot = int(lightest[np.lexsort((high, low))[0]])
+        step = n - 1 - remaining
+        edges[:, step] = best[slot], min(source[slot], vertices[slot]), max(source[slot], vertices[slot])
+
+    return sort_pairs(edges[0], edges[1], edges[2])
+
+
+def _swap_out(slot, last, *arrays):
+    """Swap index slot with index last in every array."""
+    for array in arrays:
+        array[slot], array[last] = array[last], array[slot]
+
+
+def tiles(points, tile=1024):
+    """Yield (squared distance, i, j) arrays for every pair i < j, one tile at a time.
+
+    Each tile pairs up to tile rows with up to tile columns, so at most
+    tile^2 distances are held at once.
+    """
+    n, dims = points.shape
+    for row in range(0, n, tile):
+        rows = np.arange(row, min(row + tile, n))
+        for column in range(row, n, tile):
+            columns = np.arange(column, min(column + tile, n))
+            distances = sum((points[rows, axis, None] - points[None, columns, axis]) ** 2
+                            for axis in range(dims))
+            i = np.repeat(rows, len(columns))
+            j = np.tile(columns, len(rows))
+            distances = distances.ravel()
+            if row == column:
+                upper = i < j
+                distances, i, j = distances[upper], i[upper], j[upper]
+            yield distances, i, j
+
+
+def _after(distances, i, j, last):
+    """Mask of the pairs ordered after last = (squared distance, i, j)."""
+    d, a, b = last
+    return (distances > d) | ((distances == d) & ((i > a) | ((i == a) & (j > b))))
+
+
+def tiled_k_closest(points, k, tile=1024, after=None):
+    """The k closest pairs by exhaustive search in bounded memory.
+
+    Every pair is measured, tile by tile, keeping a running top k, so peak
+    memory is O(k + tile^2) however many points there are. With after set
+    to a (squared distance, i, j) pair, only pairs ordered after it count.
+    """
+    empty = np.zeros(0, dtype=np.int64)
+    best = (empty, empty, empty)
+    if k <= 0:
+        return best
+    for distances, i, j in tiles(points, tile):
+        if after is not None:
+            keep = _after(distances, i, j, after)
+            distances, i, j = distances[keep], i[keep], j[keep]
+        best = _smallest(np.concatenate((best[0], distances)), np.concatenate((best[1], i)),
+                         np.concatenate((best[2], j)), k)
+    return best
+
+
+def tiled_pairs(points, batch=65536, tile=1024):
+    """Yield (squared distance, i, j) for every pair in exact order, in bounded memory.
+
+    Each pass over the tiles collects the next batch pairs after the last
+    one yielded, so memory stays O(batch + tile^2) at the cost of one
+    O(n^2) pass per batch. Consumers that stop early, like Kruskal once
+    everything is connected, only pay for the passes they use.
+    """
+    last = None
+    while True:
+        distances, i, j = tiled_k_closest(points, batch, tile, after=last)
+        if len(distances) == 0:
+            return
+        yield from zip(distances.tolist(), i.tolist(), j.tolist())
+        last = (int(distances[-1]), int(i[-1]), int(j[-1]))
+
+
+class PointGrid:
+    """A uniform spatial hash over points added one at a time.
+
+    The cell side tracks the point density: each time the number of points
+    doubles, the grid is rebuilt with cells holding about one point each,
+    so queries stay near constant time and rebuilds amortise to O(1).
+    """
+    __slots__ = ('points', 'cell', 'cells', 'low', 'high', 'rebuild_at')
+
+    def __init__(self):
+        self.points = []
+        self.cell = 1
+        self.cells = {}
+        self.low = None
+        self.high = None
+        self.rebuild_at = 2
+
+    def __len__(self):
+        return len(self.points)
+
+    def _key(self, point):
+        return tuple(c // self.cell for c in point)
+
+    def add(self, point):
+        """Add a point and return its index."""
+        index = len(self.points)
+        self.points.append(point)
+        if self.low is None:
+            self.low, self.high = list(point), list(point)
+        self.low = [min(a, b) for a, b in zip(self.low, point)]
+        self.high = [max(a, b) for a, b in zip(self.high, point)]
+
+        if len(self.points) >= self.rebuild_at:
+            self.rebuild_at *= 2
+            volume = 1
+            for low, high in zip(self.low, self.high):
+                volume *= high - low + 1
+            self.cell = max(1, int((volume / len(self.points)) ** (1 / len(point))))
+            self.cells = {}
+            for i, p in enumerate(self.points):
+                self.cells.setdefault(self._key(p), []).append(i)
+        else:
+            self.cells.setdefault(self._key(point), []).append(index)
+        return index
+
+    def _squared_distance(self, point, index):
+        return sum((a - b) ** 2 for a, b in zip(point, self.points[index]))
+
+    def within(self, point, squared_radius):
+        """Indices of every point at squared distance <= squared_radius, as (squared distance, index)."""
+        reach = isqrt(squared_radius) // self.cell + 1
+        centre = self._key(point)
+        if (2 * reach + 1) ** len(centre) > len(self.cells):
+            keys = [key for key in self.cells
+                    if all(abs(a - b) <= reach for a, b in zip(key, centre))]
+        else:
+            keys = [tuple(c + o for c, o in zip(centre, offset))
+                    for offset in product(range(-reach, reach + 1), repeat=len(centre))]
+        found = []
+        for key in keys:
+            for index in self.cells.get(key, ()):
+                distance = self._squared_distance(point, index)
+                if distance <= squared_radius:
+                    found.append((distance, index))
+        return found
+
+    def nearest(self, point):
+        """The closest point as (squared distance, index), ties to the lowest index; None if empty."""
+        if not self.points:
+            return None
+        centre = self._key(point)
+        dims = len(centre)
+        best = None
+        ring = 0
+        while True:
+            # Cells ring or more steps away hold only points further than (ring - 1) * cell
+            if best is not None and ring > 0 and best[0] <= ((ring - 1) * self.cell) ** 2:
+                return best
+            if (2 * ring + 1) ** dims > len(self.cells):
+                candidates = (index for indices in self.cells.values() for index in indices)
+            else:
+                candidates = (index
+                              for offset in product(range(-ring, ring + 1), repeat=dims)
+                              if max(map(abs, offset)) == ring
+                              for index in self.cells.get(tuple(c + o for c, o in zip(centre, offset)), ()))
+            for index in candidates:
+                candidate = (self._squared_distance(point, index), index)
+                if best is None or candidate < best:
+                    best = candidate
+            if (2 * ring + 1) ** dims > len(self.cells):
+                return best  # that was every point
+            ring += 1
@@ -0,0 +1,90 @@
+import random
+import unittest
+from spatial import (PointGrid, as_points, closest_pairs, k_closest_pairs, pairs_within, spanning_tree,
+                     tiled_k_closest, tiled_pairs)
+
+
+def brute_force(coords):
+    """Every pair as (squared distance, i, j), sorted."""
+    pairs = []
+    for i, p in enumerate(coords):
+        for j in range(i + 1, len(coords)):
+            pairs.append((sum((a - b) ** 2 for a, b in zip(p, coords[j])), i, j))
+    return sorted(pairs)
+
+
+class TestSpatial(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(8)
+        # A small cube, so plenty of pairs tie on distance
+        self.coords = [tuple(rng.randrange(40) for _ in range(3)) for _ in range(150)]
+        self.points = as_points(self.coords)
+        self.expected = brute_force(self.coords)
+    
+    def test_pairs_within(self):
+        """Exactly the pairs inside the radius are found."""
+        distances, i, j = pairs_within(self.points, 9)
+        found = sorted(zip(distances.tolist(), i.tolist(), j.tolist()))
+        self.assertEqual(found, [pair for pair in self.expected if pair[0] <= 81])
+    
+    def test_k_closest_pairs(self):
+        """The k closest pairs match a full sort, ties broken by index."""
+        for k in (1, 10, 500, len(self.expected) + 5):
+            distances, i, j = k_closest_pairs(self.points, k)
+            self.assertEqual(list(zip(distances.tolist(), i.tolist(), j.tolist())), self.expected[:k])
+    
+    def test_no_pairs_for_k_of_zero_or_less(self):
+        """k <= 0 asks for nothing, so every array comes back empty."""
+        for k in (0, -3):
+            for search in (k_closest_pairs, tiled_k_closest):
+                self.assertEqual([len(array) for array in search(self.points, k)], [0, 0, 0])
+    
+    def test_closest_pairs_streams_every_pair(self):
+        """The lazy stream yields every pair exactly once, in order."""
+        self.assertEqual(list(closest_pairs(self.points, batch=20)), self.expected)
+    
+    def test_tiled_search_is_exact(self):
+        """Tiled top-k and the tiled stream agree with a full sort, ties included."""
+        for k in (1, 37, 2000):
+            distances, i, j = tiled_k_closest(self.points, k, tile=16)
+            self.assertEqual(list(zip(distances.tolist(), i.tolist(), j.tolist())), self.expected[:k])
+        self.assertEqual(list(tiled_pairs(self.points, batch=500, tile=32)), self.expected)
+    
+    def test_spanning_tree_matches_kruskal(self):
+        """Prim's tree is the one Kruskal builds from the sorted pairs, in the same order."""
+        parent = list(range(len(self.coords)))
+        
+        def find(x):
+            while parent[x] != x:
+                x = parent[x]
+            return x
+        
+        kruskal = []
+        for distance, i, j in self.expected:
+            if find(i) != find(j):
+                parent[find(i)] = find(j)
+                kruskal.append((distance, i, j))
+        
+        distances, i, j = spanning_tree(self.points)
+        self.assertEqual(list(zip(distances.tolist(), i.tolist(), j.tolist())), kruskal)
+    
+    def test_point_grid_queries(self):
+        """Nearest and radius queries on an incrementally built grid match brute force."""
+        grid = PointGrid()
+        for index, point in enumerate(self.coords):
+            if index:
+                distances = [(sum((a - b) ** 2 for a, b in zip(point, other)), k)
+                             for k, other in enumerate(self.coords[:index])]
+                self.assertEqual(grid.nearest(point), min(distances))
+                self.assertEqual(sorted(grid.within(point, 60)), sorted(d for d in distances if d[0] <= 60))
+            self.assertEqual(grid.add(point), index)
+    
+    def test_degenerate_inputs(self):
+        """Single points and coincident points are handled."""
+        self.assertEqual(list(closest_pairs(as_points([(1, 2, 3)]))), [])
+        self.assertEqual(list(closest_pairs(as_points([(1, 1, 1)] * 3))), [(0, 0, 1), (0, 0, 2), (0, 1, 2)])
+        self.assertEqual(len(spanning_tree(as_points([(1, 2, 3)]))[0]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
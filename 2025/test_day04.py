@@ -1,8 +1,13 @@
 import unittest
-from day04 import solve_part1, solve_part2
+from day04 import solve_part1, solve_part2, solve_both
 
 
 class TestDay04(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Both main-input tests share one solve_both run
+        cls.main_answers = solve_both('day04-input.txt')
+    
     def test_part1_with_test_input(self):
         """Test part 1 with test input - should find 13 accessible rolls."""
         result = solve_part1('day04-test.txt')
@@ -13,15 +18,19 @@ class TestDay04(unittest.TestCase):
         result = solve_part2('day04-test.txt')
         self.assertEqual(result, 43)
     
+    def test_solve_both_with_test_input(self):
+        """solve_both gives both test answers from a single parse."""
+        self.assertEqual(solve_both('day04-test.txt'), (13, 43))
+    
     def test_part1_with_main_input(self):
         """Run part 1 with the main puzzle input."""
-        result = solve_part1('day04-input.txt')
+        result = self.main_answers[0]
         print(f"\nPart 1 answer: {result}")
         self.assertGreater(result, 0)
     
     def test_part2_with_main_input(self):
         """Run part 2 with the main puzzle input."""
-        result = solve_part2('day04-input.txt')
+        result = self.main_answers[1]
         print(f"Part 2 answer: {result}")
         self.assertGreater(result, 0)
 
@@ -0,0 +1,136 @@
+"""Array-backed disjoint-set forest.
+
+Parents and sizes live in two array('q') buffers, 8 bytes per element, so
+a few million elements cost tens of megabytes rather than the hundreds
+three Python lists of ints would. find() is iterative with path halving,
+so long chains can't hit the recursion limit. The number of components
+and a histogram of component sizes are updated on every merge, so the
+largest components are available without a pass over every element.
+
+union_many() merges a whole batch of pairs with NumPy, viewing the same
+buffers without copying them.
+"""
+from array import array
+from collections import Counter
+
+from lazy_import import lazy_import
+
+
+np = lazy_import('numpy')
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0..n-1, union by size."""
+    __slots__ = ('parent', 'size', 'components', 'size_counts')
+
+    def __init__(self, n):
+        self.parent = array('q', range(n))
+        self.size = array('q', [1]) * n
+        self.components = n
+        # How many components there are of each size
+        self.size_counts = Counter({1: n}) if n else Counter()
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x):
+        return self.size[self.find(x)]
+
+    def _merged(self, old_sizes, new_sizes, merges):
+        """Record that components of old_sizes were merged into ones of new_sizes."""
+        counts = self.size_counts
+        for size in old_sizes:
+            counts[size] -= 1
+            if not counts[size]:
+                del counts[size]
+        for size in new_sizes:
+            counts[size] += 1
+        self.components -= merges
+
+    def union(self, x, y):
+        """Union two sets. Returns True if they were in different sets."""
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+
+        size = self.size
+        if size[x] < size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self._merged((size[x], size[y]), (size[x] + size[y],), 1)
+        size[x] += size[y]
+        return True
+
+    def add(self):
+        """Add a new singleton element and return its index."""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        self.components += 1
+        self.size_counts[1] += 1
+        return len(self.parent) - 1
+
+    def union_many(self, first, second):
+        """Union first[k] with second[k] for every k; returns how many merges happened.
+
+        The result is the same as calling union() pair by pair, but the work
+        is done in NumPy: roots are hooked onto smaller roots and paths
+        compressed in rounds until no pair spans two sets.
+        """
+        first = np.asarray(first, dtype=np.int64)
+        second = np.asarray(second, dtype=np.int64)
+        if len(first) == 0:
+            return 0
+        parent = np.frombuffer(self.parent, dtype=np.int64)
+        size = np.frombuffer(self.size, dtype=np.int64)
+
+        def roots(x):
+            while True:
+                up = parent[x]
+                if np.array_equal(up, x):
+                    return x
+                parent[x] = parent[up]  # halve the paths walked
+                x = up
+
+        a, b = roots(first), roots(second)
+        spanning = a != b
+        involved = np.unique(np.concatenate((a[spanning], b[spanning])))
+        old_sizes = size[involved]
+
+        while spanning.any():
+            a, b = a[spanning], b[spanning]
+            # Hook the larger root under the smaller; conflicting writes are fine
+            parent[np.maximum(a, b)] = np.minimum(a, b)
+            a, b = roots(a), roots(b)
+            spanning = a != b
+
+        final = roots(involved)
+        moved = final != involved
+        np.add.at(size, final[moved], old_sizes[moved])
+
+        merges = int(moved.sum())
+        if merges:
+            self._merged(old_sizes.tolist(), size[np.unique(final)].tolist(), merges)
+        return merges
+
+    def top_sizes(self, k):
+        """The k largest component sizes, largest first."""
+        result = []
+        for size in sorted(self.size_counts, reverse=True):
+            result.extend([size] * min(self.size_counts[size], k - len(result)))
+            if len(result) == k:
+                break
+        return result
+
+    def largest(self):
+        """Size of the largest component."""
+        return max(self.size_counts, default=0)
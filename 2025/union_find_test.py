@@ -0,0 +1,63 @@
+import random
+import sys
+import unittest
+from union_find import UnionFind
+
+
+class TestUnionFind(unittest.TestCase):
+    def test_union_and_statistics(self):
+        """Merges update the component count and size histogram."""
+        uf = UnionFind(6)
+        self.assertTrue(uf.union(0, 1))
+        self.assertTrue(uf.union(1, 2))
+        self.assertFalse(uf.union(0, 2))
+        self.assertTrue(uf.union(3, 4))
+        self.assertEqual(uf.components, 3)
+        self.assertEqual(uf.top_sizes(2), [3, 2])
+        self.assertEqual(uf.top_sizes(10), [3, 2, 1])
+        self.assertEqual(uf.largest(), 3)
+        self.assertEqual(uf.component_size(4), 2)
+        self.assertTrue(uf.connected(0, 2))
+        self.assertFalse(uf.connected(2, 3))
+    
+    def test_long_chain_is_not_recursive(self):
+        """A chain longer than the recursion limit resolves."""
+        n = sys.getrecursionlimit() * 3
+        uf = UnionFind(n)
+        for i in range(n - 1):
+            uf.parent[i] = i + 1  # worst case: one long path
+        self.assertEqual(uf.find(0), n - 1)
+    
+    def test_union_many_matches_union(self):
+        """A batch union gives the same sets and statistics as pairwise unions."""
+        rng = random.Random(13)
+        n = 500
+        first = [rng.randrange(n) for _ in range(400)]
+        second = [rng.randrange(n) for _ in range(400)]
+        
+        one_by_one = UnionFind(n)
+        merges = sum(one_by_one.union(a, b) for a, b in zip(first[:150], second[:150]))
+        batched = UnionFind(n)
+        self.assertEqual(batched.union_many(first[:150], second[:150]), merges)
+        merges = sum(one_by_one.union(a, b) for a, b in zip(first[150:], second[150:]))
+        self.assertEqual(batched.union_many(first[150:], second[150:]), merges)
+        
+        self.assertEqual(batched.components, one_by_one.components)
+        self.assertEqual(batched.size_counts, one_by_one.size_counts)
+        for x in range(n):
+            self.assertEqual(batched.component_size(x), one_by_one.component_size(x))
+            self.assertEqual(batched.connected(x, 0), one_by_one.connected(x, 0))
+    
+    def test_add(self):
+        """New elements join as singletons and can be merged, even after a batch union."""
+        uf = UnionFind(2)
+        uf.union_many([0], [1])
+        new = uf.add()
+        self.assertEqual(new, 2)
+        self.assertEqual(uf.components, 2)
+        uf.union(new, 0)
+        self.assertEqual(uf.top_sizes(1), [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
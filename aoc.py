@@ -0,0 +1,300 @@
+"""Run every Advent of Code solution in the repository and report timings.
+
+Discovers each YYYY/dayNN.py module, runs it across a process pool (through
+solve_both where a day has it) and prints a per-day/per-part wall-time table.
+
+Usage:
+    python aoc.py                 # every year, every day
+    python aoc.py 2025            # one year
+    python aoc.py 2025 -d 8 9     # selected days
+    python aoc.py -j 1            # run serially
+    python aoc.py --separate      # time part 1 and part 2 on their own
+    python aoc.py 2025 --memory   # peak memory and top allocation sites
+    python aoc.py 2025 -d 12 --profile sample   # collapsed stacks + summary in profiles/
+"""
+import argparse
+import ast
+import contextlib
+import importlib.util
+import io
+import os
+import re
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from memtrace import format_report, format_size, trace_memory
+from profiler import MODES as PROFILE_MODES, profile_call
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+YEAR_PATTERN = re.compile(r'^\d{4}$')
+DAY_PATTERN = re.compile(r'^day(\d\d)(-\d+)?\.py$')
+
+
+class Task:
+    """One unit of work for the pool: one or both parts of a single day."""
+    __slots__ = ('year', 'day', 'name', 'path', 'part')
+
+    def __init__(self, year, day, name, path, part):
+        self.year = year
+        self.day = day
+        self.name = name
+        self.path = path
+        self.part = part
+
+    def key(self):
+        return (self.year, self.day, self.name, self.part)
+
+
+def find_entry_points(path, separate=False):
+    """Return the parts a module exposes, without importing it.
+
+    Modules with solve_both are run once for both parts (unless separate is
+    set), modules with solve_part1/solve_part2 are run part by part, modules
+    with a main() are run as a whole, and anything else is executed as a script.
+    """
+    with open(path, 'r') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+    if 'solve_both' in functions and not separate:
+        return ['solve_both']
+    parts = [part for part in ('solve_part1', 'solve_part2') if part in functions]
+    if parts:
+        return parts
+    if 'main' in functions:
+        return ['main']
+    return ['script']
+
+
+def discover(years=None, days=None, root=ROOT, separate=False):
+    """Find every YYYY/dayNN module and return the tasks needed to run it.
+
+    With separate set, solve_part1 and solve_part2 are run as their own
+    tasks instead of sharing work through solve_both.
+    """
+    tasks = []
+    for year in sorted(os.listdir(root)):
+        year_dir = os.path.join(root, year)
+        if not YEAR_PATTERN.match(year) or not os.path.isdir(year_dir):
+            continue
+        if years and year not in years:
+            continue
+
+        for filename in sorted(os.listdir(year_dir), key=lambda f: os.path.splitext(f)[0]):
+            match = DAY_PATTERN.match(filename)
+            if not match:
+                continue
+            day = int(match.group(1))
+            if days and day not in days:
+                continue
+
+            path = os.path.join(year_dir, filename)
+            name = filename[:-3]
+            for part in find_entry_points(path, separate):
+                tasks.append(Task(year, day, name, path, part))
+
+    return tasks
+
+
+# Modules already imported by this worker process, keyed by path
+_modules = {}
+
+
+def load_module(path):
+    """Import a solution module from its file path.
+
+    The module's directory is put on sys.path so sibling imports resolve,
+    and the module gets a unique name so day01 from different years can
+    live side by side in one process.
+    """
+    if path in _modules:
+        return _modules[path]
+
+    directory = os.path.dirname(path)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    year = os.path.basename(directory)
+    name = f"aoc_{year}_{os.path.basename(path)[:-3].replace('-', '_')}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    _modules[path] = module
+    return module
+
+
+def entry_point(path, part):
+    """Return a no-argument callable that runs one part of a module."""
+    if part == 'script':
+        def run_script():
+            runpy.run_path(path, run_name='__main__')
+        return run_script
+    return getattr(load_module(path), part)
+
+
+def profile_prefix(path, part, profile_dir):
+    """Where the profile reports for one task are written, minus the extension."""
+    year = os.path.basename(os.path.dirname(path))
+    name = os.path.basename(path)[:-3]
+    return os.path.join(os.path.abspath(profile_dir), f"{year}-{name}-{format_part(part)}")
+
+
+def run_task(path, part, memory=False, profile=None, profile_dir='profiles'):
+    """Run one part in the current process.
+
+    Returns (answer, seconds, error, memory report). The memory report is
+    None unless memory is set, in which case the part runs under
+    memtrace.trace_memory and the report comes back as a dict. With profile
+    set to 'cprofile' or 'sample' the part runs under that profiler and its
+    reports are written to profile_dir. Anything the solution prints is
+    captured so it doesn't interleave with the results table.
+    """
+    prefix = profile_prefix(path, part, profile_dir) if profile else None
+
+    # Older solutions open their input relative to the working directory
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(path))
+    output = io.StringIO()
+    report = None
+
+    try:
+        with contextlib.redirect_stdout(output):
+            func = entry_point(path, part)
+            with trace_memory() if memory else contextlib.nullcontext() as report:
+                start = time.perf_counter()
+                if profile:
+                    answer, _ = profile_call(func, prefix, profile)
+                else:
+                    answer = func()
+                elapsed = time.perf_counter() - start
+    except Exception as e:
+        return None, 0.0, f"{type(e).__name__}: {e}", None
+    finally:
+        os.chdir(cwd)
+
+    if answer is None:
+        # main() and scripts print their answers instead of returning them
+        lines = [line.strip() for line in output.getvalue().splitlines() if line.strip()]
+        answer = ' | '.join(lines)
+
+    return answer, elapsed, None, report.as_dict() if report else None
+
+
+def run_all(tasks, jobs=None, memory=False, profile=None, profile_dir='profiles'):
+    """Run tasks across a process pool and return {task.key(): result}."""
+    jobs = jobs or os.cpu_count() or 1
+    results = {}
+
+    if jobs == 1:
+        for task in tasks:
+            results[task.key()] = run_task(task.path, task.part, memory, profile, profile_dir)
+        return results
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_task, task.path, task.part, memory, profile, profile_dir): task
+                   for task in tasks}
+        for future in as_completed(futures):
+            results[futures[future].key()] = future.result()
+
+    return results
+
+
+def format_part(part):
+    """Short label for the Part column."""
+    if part == 'solve_both':
+        return 'both'
+    if part.startswith('solve_part'):
+        return part[len('solve_part'):]
+    return part
+
+
+def format_table(tasks, results, max_answer=40):
+    """Build the per-day/per-part results table, with peak memory when it was traced."""
+    show_memory = any(result[3] for result in results.values())
+    header = f"{'Year':<6}{'Day':<10}{'Part':<8}{'Answer':<{max_answer + 2}}{'Time':>10}"
+    if show_memory:
+        header += f"{'Peak':>12}"
+    lines = [header, '-' * len(header)]
+
+    for task in tasks:
+        answer, elapsed, error, report = results[task.key()]
+        if error:
+            text = f"ERROR {error}"
+        elif isinstance(answer, tuple):
+            text = ' | '.join(str(value) for value in answer if value is not None)
+        else:
+            text = str(answer)
+        if len(text) > max_answer:
+            text = text[:max_answer - 3] + '...'
+        time_text = '-' if error else f"{elapsed:.3f}s"
+        line = (f"{task.year:<6}{task.name:<10}{format_part(task.part):<8}"
+                f"{text:<{max_answer + 2}}{time_text:>10}")
+        if show_memory:
+            line += f"{format_size(report['peak_bytes']) if report else '-':>12}"
+        lines.append(line)
+
+    return '\n'.join(lines)
+
+
+def format_memory_details(tasks, results):
+    """Top allocation sites for every task that was traced."""
+    sections = []
+    for task in tasks:
+        report = results[task.key()][3]
+        if report:
+            sections.append(f"{task.year} {task.name} {format_part(task.part)}: {format_report(report)}")
+    return '\n\n'.join(sections)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run Advent of Code solutions and time them.")
+    parser.add_argument('years', nargs='*', help="years to run (default: all)")
+    parser.add_argument('-d', '--days', nargs='+', type=int, help="days to run (default: all)")
+    parser.add_argument('--separate', action='store_true',
+                        help="run part 1 and part 2 separately instead of solve_both")
+    parser.add_argument('--memory', action='store_true',
+                        help="trace allocations and report peak memory and top allocation sites")
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help="profile each task with cProfile or the stack sampler")
+    parser.add_argument('--profile-dir', default='profiles',
+                        help="where profile reports are written (default: profiles)")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="worker processes (default: number of CPUs)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tasks = discover(args.years, args.days, separate=args.separate)
+    if not tasks:
+        print("No solutions found.")
+        return 1
+
+    jobs = args.jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    results = run_all(tasks, jobs, memory=args.memory, profile=args.profile,
+                      profile_dir=args.profile_dir)
+    wall = time.perf_counter() - start
+
+    print(format_table(tasks, results))
+    if args.memory:
+        print()
+        print(format_memory_details(tasks, results))
+    total = sum(result[1] for result in results.values() if not result[2])
+    print(f"\nWall time: {wall:.3f}s (sum of parts {total:.3f}s, {jobs} worker{'s' if jobs != 1 else ''})")
+    if args.memory:
+        print("Times include tracemalloc overhead.")
+    if args.profile:
+        print(f"Times include profiler overhead; reports written to {os.path.abspath(args.profile_dir)}")
+
+    return 1 if any(result[2] for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
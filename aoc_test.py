@@ -0,0 +1,74 @@
+import os
+import unittest
+from aoc import ROOT, discover, find_entry_points, run_all, run_task, format_table
+
+
+class TestRunner(unittest.TestCase):
+    def test_find_entry_points(self):
+        """Each style of solution module maps to the right entry points."""
+        self.assertEqual(find_entry_points(os.path.join(ROOT, '2025', 'day08.py')), ['solve_both'])
+        self.assertEqual(find_entry_points(os.path.join(ROOT, '2025', 'day08.py'), separate=True),
+                         ['solve_part1', 'solve_part2'])
+        self.assertEqual(find_entry_points(os.path.join(ROOT, '2025', 'day12.py'), separate=True),
+                         ['solve_part1'])
+        self.assertEqual(find_entry_points(os.path.join(ROOT, '2022', 'day01.py')), ['main'])
+        self.assertEqual(find_entry_points(os.path.join(ROOT, '2024', 'day02-2.py')), ['script'])
+    
+    def test_discover_skips_tests(self):
+        """Test modules and input files are never picked up as solutions."""
+        tasks = discover(['2025'])
+        names = {task.name for task in tasks}
+        self.assertIn('day08', names)
+        self.assertFalse(any('test' in name for name in names))
+    
+    def test_discover_filters_days(self):
+        """Only the requested days are returned, in day order."""
+        tasks = discover(['2025'], [1, 3])
+        self.assertEqual([(task.name, task.part) for task in tasks],
+                         [('day01', 'solve_both'), ('day03', 'solve_both')])
+        tasks = discover(['2025'], [1, 3], separate=True)
+        self.assertEqual([(task.name, task.part) for task in tasks], [
+            ('day01', 'solve_part1'), ('day01', 'solve_part2'),
+            ('day03', 'solve_part1'), ('day03', 'solve_part2'),
+        ])
+    
+    def test_run_task_returns_answer(self):
+        """A solve_partN task returns the function's answer."""
+        answer, elapsed, error, _ = run_task(os.path.join(ROOT, '2025', 'day01.py'), 'solve_part1')
+        self.assertIsNone(error)
+        self.assertGreater(answer, 0)
+        self.assertGreaterEqual(elapsed, 0)
+    
+    def test_solve_both_matches_parts(self):
+        """solve_both gives the same answers as running each part."""
+        path = os.path.join(ROOT, '2025', 'day01.py')
+        both, _, error, _ = run_task(path, 'solve_both')
+        self.assertIsNone(error)
+        self.assertEqual(both, (run_task(path, 'solve_part1')[0], run_task(path, 'solve_part2')[0]))
+    
+    def test_run_task_captures_printed_answers(self):
+        """main() and script modules report what they print."""
+        answer, _, error, _ = run_task(os.path.join(ROOT, '2024', 'day02-2.py'), 'script')
+        self.assertIsNone(error)
+        self.assertTrue(answer.isdigit())
+    
+    def test_run_task_traces_memory(self):
+        """With memory set the result carries a peak-memory report."""
+        answer, _, error, report = run_task(os.path.join(ROOT, '2025', 'day01.py'), 'solve_both', memory=True)
+        self.assertIsNone(error)
+        self.assertGreater(report['peak_bytes'], 0)
+        self.assertTrue(report['top_sites'])
+    
+    def test_run_all_in_pool(self):
+        """Running in a process pool gives the same answers as running serially."""
+        tasks = discover(['2022'], [2, 5])
+        serial = run_all(tasks, jobs=1)
+        pooled = run_all(tasks, jobs=2)
+        for task in tasks:
+            self.assertEqual(serial[task.key()][0], pooled[task.key()][0])
+        table = format_table(tasks, pooled)
+        self.assertIn('day05', table)
+
+
+if __name__ == '__main__':
+    unittest.main()
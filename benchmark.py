@@ -0,0 +1,191 @@
+"""Benchmark the 2025 solvers and compare against a stored baseline.
+
+Each day is run through solve_both (or part by part with --separate) with
+warmup, timed over several repeats (min/median/p95) and run once more under
+tracemalloc to record peak memory. Results can be saved as a JSON baseline
+and later runs compared against it.
+
+Usage:
+    python benchmark.py --save baseline.json
+    python benchmark.py --compare baseline.json --threshold 1.2
+    python benchmark.py -d 8 9 --repeat 3 --warmup 0
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from aoc import discover, format_part, load_module
+from memtrace import trace_memory
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of values using linear interpolation."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure_time(func, args=(), repeat=5, warmup=1):
+    """Time func(*args) and return min/median/p95/mean in seconds."""
+    for _ in range(warmup):
+        func(*args)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'p95': percentile(times, 95),
+        'mean': statistics.fmean(times),
+        'runs': repeat,
+    }
+
+
+def measure_memory(func, args=()):
+    """Run func(*args) once under tracemalloc and return peak bytes allocated."""
+    with trace_memory(top=0) as report:
+        func(*args)
+    return report.peak_bytes
+
+
+def benchmark(days=None, repeat=5, warmup=1, memory=True, input_template=None, separate=False):
+    """Benchmark every 2025 day and return {"dayNN both": stats}.
+
+    Days are timed through solve_both unless separate is set, in which case
+    each part is timed on its own as "dayNN partN". input_template, if
+    given, is formatted with the day number to pick the input file, e.g.
+    'day{day:02d}-test.txt'.
+    """
+    results = {}
+    cwd = os.getcwd()
+    try:
+        for task in discover(['2025'], days, separate=separate):
+            if not task.part.startswith('solve_'):
+                continue
+            os.chdir(os.path.dirname(task.path))
+            func = getattr(load_module(task.path), task.part)
+            args = (input_template.format(day=task.day),) if input_template else ()
+
+            stats = measure_time(func, args, repeat, warmup)
+            if memory:
+                stats['peak_bytes'] = measure_memory(func, args)
+            label = format_part(task.part)
+            results[f"{task.name} {label if label == 'both' else 'part' + label}"] = stats
+    finally:
+        os.chdir(cwd)
+
+    return results
+
+
+def save_baseline(path, results):
+    """Write results to a JSON baseline along with where they were measured."""
+    data = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """Read the results stored in a JSON baseline."""
+    with open(path, 'r') as f:
+        return json.load(f)['results']
+
+
+def compare(baseline, current, threshold=1.1, min_seconds=0.001):
+    """Compare current results against a baseline.
+
+    A part regresses when its median time exceeds the baseline median by
+    more than threshold (1.1 = 10% slower). Parts whose medians are both
+    under min_seconds are too noisy to judge and never regress.
+    Returns a list of (name, base_median, current_median, ratio, regressed).
+    """
+    rows = []
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]['median']
+        now = stats['median']
+        ratio = now / base if base > 0 else float('inf')
+        regressed = ratio > threshold and max(base, now) >= min_seconds
+        rows.append((name, base, now, ratio, regressed))
+    return rows
+
+
+def format_results(results):
+    """Build a table of benchmark results."""
+    header = f"{'Part':<14}{'Min':>11}{'Median':>11}{'P95':>11}{'Peak memory':>14}"
+    lines = [header, '-' * len(header)]
+    for name, stats in results.items():
+        peak = stats.get('peak_bytes')
+        peak_text = f"{peak / 1024:.0f} KiB" if peak is not None else '-'
+        lines.append(f"{name:<14}{stats['min']:>10.4f}s{stats['median']:>10.4f}s"
+                     f"{stats['p95']:>10.4f}s{peak_text:>14}")
+    return '\n'.join(lines)
+
+
+def format_comparison(rows):
+    """Build a table comparing current medians against the baseline."""
+    header = f"{'Part':<14}{'Baseline':>11}{'Current':>11}{'Ratio':>9}"
+    lines = [header, '-' * len(header)]
+    for name, base, now, ratio, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        lines.append(f"{name:<14}{base:>10.4f}s{now:>10.4f}s{ratio:>8.2f}x{flag}")
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the 2025 solvers.")
+    parser.add_argument('-d', '--days', nargs='+', type=int, help="days to benchmark (default: all)")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per part")
+    parser.add_argument('--warmup', type=int, default=1, help="untimed runs before timing")
+    parser.add_argument('--separate', action='store_true',
+                        help="time part 1 and part 2 separately instead of solve_both")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc run")
+    parser.add_argument('--input', dest='input_template',
+                        help="input file template, e.g. 'day{day:02d}-test.txt'")
+    parser.add_argument('--save', metavar='PATH', help="write results to a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare against a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=1.1,
+                        help="slowdown ratio that counts as a regression (default: 1.1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = benchmark(args.days, args.repeat, args.warmup, not args.no_memory,
+                        args.input_template, args.separate)
+    print(format_results(results))
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        rows = compare(load_baseline(args.compare), results, args.threshold)
+        print()
+        print(format_comparison(rows))
+        if any(row[-1] for row in rows):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from benchmark import percentile, measure_time, measure_memory, benchmark, compare, save_baseline, load_baseline
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_percentile(self):
+        """Percentiles interpolate between the sorted values."""
+        self.assertEqual(percentile([3, 1, 2], 50), 2)
+        self.assertEqual(percentile([1, 2, 3, 4, 5], 100), 5)
+        self.assertAlmostEqual(percentile([0, 10], 95), 9.5)
+        self.assertEqual(percentile([7], 95), 7)
+    
+    def test_measure_time(self):
+        """Timing stats are ordered and count the timed runs only."""
+        calls = []
+        stats = measure_time(lambda: calls.append(1), repeat=4, warmup=2)
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(stats['runs'], 4)
+        self.assertLessEqual(stats['min'], stats['median'])
+        self.assertLessEqual(stats['median'], stats['p95'])
+    
+    def test_measure_memory(self):
+        """Peak memory covers allocations made inside the call."""
+        peak = measure_memory(lambda: bytearray(1_000_000))
+        self.assertGreaterEqual(peak, 1_000_000)
+    
+    def test_benchmark_with_test_input(self):
+        """Benchmarking day01 on its test input times solve_both by default."""
+        results = benchmark([1], repeat=2, warmup=0, input_template='day{day:02d}-test.txt')
+        self.assertEqual(sorted(results), ['day01 both'])
+        self.assertIn('peak_bytes', results['day01 both'])
+    
+    def test_benchmark_separate_parts(self):
+        """With separate set there is one entry per part."""
+        results = benchmark([1], repeat=2, warmup=0, input_template='day{day:02d}-test.txt', separate=True)
+        self.assertEqual(sorted(results), ['day01 part1', 'day01 part2'])
+    
+    def test_compare_flags_regressions(self):
+        """Only parts slower than the threshold are flagged."""
+        baseline = {'day01 part1': {'median': 0.010}, 'day01 part2': {'median': 0.010}}
+        current = {'day01 part1': {'median': 0.011}, 'day01 part2': {'median': 0.020}}
+        rows = {row[0]: row[-1] for row in compare(baseline, current, threshold=1.2)}
+        self.assertFalse(rows['day01 part1'])
+        self.assertTrue(rows['day01 part2'])
+    
+    def test_compare_ignores_noise(self):
+        """Sub-millisecond parts are too noisy to count as regressions."""
+        rows = compare({'a': {'median': 0.0001}}, {'a': {'median': 0.0005}}, threshold=1.1)
+        self.assertFalse(rows[0][-1])
+    
+    def test_baseline_round_trip(self):
+        """Saved baselines load back to the same results."""
+        results = {'day01 part1': {'min': 1.0, 'median': 1.5, 'p95': 2.0, 'mean': 1.5, 'runs': 3}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'baseline.json')
+            save_baseline(path, results)
+            self.assertEqual(load_baseline(path), results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,263 @@
+"""Generate synthetic 2025 puzzle inputs at arbitrary sizes.
+
+Every generator emits a valid input in that day's format, deterministically
+for a given size and seed, so scaling runs are repeatable.
+
+Usage:
+    python generate.py 8 --size 20000 -o 2025/day08-large.txt
+    python generate.py 9 --size 5000 --seed 7 > /tmp/day09.txt
+"""
+import argparse
+import random
+import string
+import sys
+
+
+def generate_day01(size, rng):
+    """size dial rotations such as L68 / R48."""
+    lines = [f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size)]
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day02(size, rng):
+    """size comma-separated ID ranges, all on one line."""
+    parts = []
+    for _ in range(size):
+        digits = rng.randint(1, 10)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        end = start + rng.randint(0, 200_000)
+        parts.append(f"{start}-{end}")
+    return ','.join(parts)
+
+
+def generate_day03(size, rng, bank_length=100):
+    """size battery banks of digits 1-9."""
+    lines = [''.join(rng.choice('123456789') for _ in range(bank_length)) for _ in range(size)]
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day04(size, rng, density=0.6):
+    """A size x size grid of paper rolls (@) and empty floor (.)."""
+    lines = [''.join('@' if rng.random() < density else '.' for _ in range(size)) for _ in range(size)]
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day05(size, rng, id_limit=10 ** 15):
+    """size fresh ID ranges, a blank line, then size ingredient IDs."""
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, id_limit)
+        ranges.append(f"{start}-{start + rng.randint(0, id_limit // 100)}")
+    ids = [str(rng.randint(1, id_limit)) for _ in range(size)]
+    return '\n'.join(ranges) + '\n\n' + '\n'.join(ids) + '\n'
+
+
+def generate_day06(size, rng, rows=4):
+    """A worksheet of size problems, each a column of rows numbers and an operator."""
+    number_lines = [[] for _ in range(rows)]
+    operator_line = []
+    for _ in range(size):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(rows)]
+        width = max(len(n) for n in numbers)
+        right_align = rng.random() < 0.5
+        for line, number in zip(number_lines, numbers):
+            line.append(number.rjust(width) if right_align else number.ljust(width))
+        operator_line.append(rng.choice('+*').ljust(width))
+    lines = [' '.join(line) for line in number_lines] + [' '.join(operator_line)]
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day07(size, rng, density=0.3):
+    """A size x size tachyon manifold with S on the top row and splitters (^) on alternate rows."""
+    width = size if size % 2 == 1 else size + 1
+    lines = ['.' * (width // 2) + 'S' + '.' * (width // 2)]
+    for row in range(1, size):
+        if row % 2 == 0:
+            lines.append(''.join('^' if rng.random() < density else '.' for _ in range(width)))
+        else:
+            lines.append('.' * width)
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day08(size, rng, limit=100_000):
+    """size junction boxes as x,y,z coordinates."""
+    lines = [f"{rng.randrange(limit)},{rng.randrange(limit)},{rng.randrange(limit)}" for _ in range(size)]
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day09(size, rng, limit=100_000):
+    """A rectilinear polygon of about size red tiles, listed in order around the boundary.
+
+    The polygon is x-monotone: a random top skyline above y = 0 and a random
+    bottom skyline below it, so consecutive tiles always share a row or
+    column and the boundary never crosses itself.
+    """
+    segments = max(2, size // 4)
+    xs = sorted(rng.sample(range(limit), segments + 1))
+    tops = [rng.randint(1, limit // 2)]
+    bottoms = [-rng.randint(1, limit // 2)]
+    while len(tops) < segments:
+        top = rng.randint(1, limit // 2)
+        bottom = -rng.randint(1, limit // 2)
+        if top != tops[-1] and bottom != bottoms[-1]:
+            tops.append(top)
+            bottoms.append(bottom)
+
+    points = [(xs[0], bottoms[0]), (xs[0], tops[0])]
+    for i in range(segments):
+        points.append((xs[i + 1], tops[i]))
+        if i + 1 < segments:
+            points.append((xs[i + 1], tops[i + 1]))
+    for i in range(segments - 1, -1, -1):
+        points.append((xs[i + 1], bottoms[i]))
+        if i > 0:
+            points.append((xs[i], bottoms[i]))
+
+    offset = limit // 2
+    return '\n'.join(f"{x},{y + offset}" for x, y in points) + '\n'
+
+
+def generate_day10(size, rng, max_lights=10):
+    """size machines, each with a reachable light pattern and joltage targets."""
+    lines = []
+    for _ in range(size):
+        n_lights = rng.randint(4, max_lights)
+        n_buttons = rng.randint(n_lights - 2, n_lights + 3)
+        buttons = [sorted(rng.sample(range(n_lights), rng.randint(1, n_lights - 1)))
+                   for _ in range(n_buttons)]
+
+        # Targets are built from real presses so every machine is solvable
+        lights = [0] * n_lights
+        joltage = [0] * n_lights
+        for button in buttons:
+            toggles = rng.randint(0, 1)
+            presses = rng.randint(0, 30)
+            for i in button:
+                lights[i] ^= toggles
+                joltage[i] += presses
+
+        pattern = ''.join('#' if on else '.' for on in lights)
+        schematics = ' '.join(f"({','.join(map(str, button))})" for button in buttons)
+        lines.append(f"[{pattern}] {schematics} {{{','.join(map(str, joltage))}}}")
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day11(size, rng, max_outputs=3):
+    """A DAG of size devices including you, svr, dac, fft and out.
+
+    Devices are laid out in a random topological order and only connect
+    forwards, so every device has a route onwards and there are no cycles.
+    """
+    reserved = {'you', 'svr', 'dac', 'fft', 'out'}
+    names = set()
+    while len(names) < max(size, 5) - len(reserved):
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(3))
+        if name not in reserved:
+            names.add(name)
+
+    middle = sorted(names)
+    rng.shuffle(middle)
+    middle.insert(len(middle) // 4, 'you')
+    middle.insert(len(middle) // 3, 'fft')
+    middle.insert(2 * len(middle) // 3, 'dac')
+    order = ['svr'] + middle + ['out']
+
+    lines = []
+    for i, name in enumerate(order[:-1]):
+        window = order[i + 1:i + 1 + max(4, len(order) // 10)]
+        outputs = rng.sample(window, min(len(window), rng.randint(1, max_outputs)))
+        lines.append(f"{name}: {' '.join(outputs)}")
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
+
+
+def _is_connected(cells):
+    """Whether cells of a 3x3 mask (numbered r * 3 + c) form one edge-connected piece."""
+    start = next(iter(cells))
+    seen = {start}
+    stack = [start]
+    while stack:
+        r, c = divmod(stack.pop(), 3)
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            cell = nr * 3 + nc
+            if 0 <= nr < 3 and 0 <= nc < 3 and cell in cells and cell not in seen:
+                seen.add(cell)
+                stack.append(cell)
+    return len(seen) == len(cells)
+
+
+def generate_day12(size, rng, n_shapes=6):
+    """n_shapes 3x3 present shapes followed by size regions to fill."""
+    blocks = []
+    for idx in range(n_shapes):
+        # Redraw until the shape is in one piece
+        cells = set(rng.sample(range(9), rng.randint(5, 7)))
+        while not _is_connected(cells):
+            cells = set(rng.sample(range(9), rng.randint(5, 7)))
+        rows = [''.join('#' if r * 3 + c in cells else '.' for c in range(3)) for r in range(3)]
+        blocks.append(f"{idx}:\n" + '\n'.join(rows) + '\n')
+
+    regions = []
+    for _ in range(size):
+        width = rng.randint(35, 50)
+        height = rng.randint(35, 50)
+        # Aim for somewhere between loosely and over-packed
+        budget = int(width * height * rng.uniform(0.5, 1.05)) // 7
+        counts = [0] * n_shapes
+        for _ in range(budget):
+            counts[rng.randrange(n_shapes)] += 1
+        regions.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+
+    return '\n'.join(blocks) + '\n' + '\n'.join(regions) + '\n'
+
+
+GENERATORS = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+}
+
+
+def generate_input(day, size, seed=0):
+    """Return the text of a synthetic input for the given day."""
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def write_input(day, size, path, seed=0):
+    """Write a synthetic input for the given day to path."""
+    with open(path, 'w') as f:
+        f.write(generate_input(day, size, seed))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic 2025 puzzle inputs.")
+    parser.add_argument('day', type=int, choices=sorted(GENERATORS), help="puzzle day")
+    parser.add_argument('--size', type=int, default=1000,
+                        help="lines, ranges, points, grid side, etc. depending on the day")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('-o', '--output', help="output file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.output:
+        write_input(args.day, args.size, args.output, args.seed)
+    else:
+        sys.stdout.write(generate_input(args.day, args.size, args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from aoc import ROOT, load_module
+from generate import GENERATORS, _is_connected, generate_input, write_input
+
+
+def load_day(day):
+    return load_module(os.path.join(ROOT, '2025', f'day{day:02d}.py'))
+
+
+class TestGenerate(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def write(self, day, size, seed=0):
+        path = os.path.join(self.tmp.name, f'day{day:02d}.txt')
+        write_input(day, size, path, seed)
+        return path
+    
+    def test_deterministic(self):
+        """The same day, size and seed always give the same input."""
+        for day in GENERATORS:
+            self.assertEqual(generate_input(day, 20, seed=3), generate_input(day, 20, seed=3))
+        self.assertNotEqual(generate_input(8, 20, seed=1), generate_input(8, 20, seed=2))
+    
+    def test_unknown_day(self):
+        """Days without a generator are rejected."""
+        with self.assertRaises(ValueError):
+            generate_input(25, 10)
+    
+    def test_inputs_parse(self):
+        """Every generated input is accepted by that day's parser."""
+        for day in GENERATORS:
+            module = load_day(day)
+            if hasattr(module, 'parse_input'):
+                self.assertTrue(module.parse_input(self.write(day, 30)))
+    
+    def test_sizes(self):
+        """size controls the number of records in the generated input."""
+        self.assertEqual(len(load_day(8).parse_input(self.write(8, 123))), 123)
+        self.assertEqual(len(load_day(4).parse_input(self.write(4, 17))), 17)
+        ranges, ids = load_day(5).parse_input(self.write(5, 40))
+        self.assertEqual((len(ranges), len(ids)), (40, 40))
+    
+    def test_day09_polygon_is_rectilinear(self):
+        """Consecutive red tiles share a row or column, and no tile repeats."""
+        tiles = load_day(9).parse_input(self.write(9, 200))
+        self.assertEqual(len(tiles), len(set(tiles)))
+        for (x1, y1), (x2, y2) in zip(tiles, tiles[1:] + tiles[:1]):
+            self.assertTrue((x1 == x2) != (y1 == y2))
+    
+    def test_day10_machines_are_solvable(self):
+        """Every generated machine has a light and joltage solution."""
+        day10 = load_day(10)
+        for target, buttons, joltage in day10.parse_input(self.write(10, 20)):
+            self.assertIsNotNone(day10.solve_machine(target, buttons))
+    
+    def test_day11_has_routes(self):
+        """The generated graph has paths from you and svr to out."""
+        path = self.write(11, 60)
+        day11 = load_day(11)
+        self.assertGreater(day11.solve_part1(path), 0)
+        self.assertGreaterEqual(day11.solve_part2(path), 0)
+    
+    def test_day12_shapes_are_connected(self):
+        """Every generated present is one edge-connected piece."""
+        self.assertFalse(_is_connected({0, 2, 4, 6, 8}))
+        for seed in range(20):
+            blocks = generate_input(12, 1, seed=seed).split('\n\n')[:-1]
+            for block in blocks:
+                rows = block.split('\n')[1:4]
+                self.assertTrue(_is_connected({r * 3 + c for r in range(3) for c in range(3) if rows[r][c] == '#'}))
+    
+    def test_small_inputs_solve(self):
+        """The cheaper days solve their generated inputs."""
+        for day in (1, 3, 4, 5, 6, 7, 8, 9):
+            module = load_day(day)
+            path = self.write(day, 40)
+            self.assertGreaterEqual(module.solve_part1(path), 0)
+            self.assertGreaterEqual(module.solve_part2(path), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
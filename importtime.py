@@ -0,0 +1,154 @@
+"""Report how much of a cold run is interpreter startup versus imports.
+
+Each solution module is imported in a fresh interpreter under
+`python -X importtime`, and the per-module self/cumulative times it prints
+are split into what the interpreter loads before any user code (site,
+encodings, ...) and what importing the day pulls in. The heaviest imports
+are listed by their own time, so an eager numpy or scipy stands out.
+
+Usage:
+    python importtime.py 2025
+    python importtime.py 2025 -d 10 12 --top 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from aoc import discover
+
+
+class ImportRecord:
+    """One line of -X importtime output."""
+    __slots__ = ('name', 'self_us', 'cumulative_us', 'depth')
+
+    def __init__(self, name, self_us, cumulative_us, depth):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+
+def parse_importtime(output):
+    """Parse -X importtime stderr into ImportRecords, in the order printed.
+
+    Nested imports are printed before the import that triggered them,
+    indented two spaces per level.
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        records.append(ImportRecord(name.strip(), int(fields[0]), int(fields[1]), depth))
+    return records
+
+
+def split_records(records, module):
+    """Split records into (startup, module subtree) for an import of module.
+
+    Returns (interpreter startup imports, the module's own record, every
+    import nested under it). The module record is None if it never appears.
+    """
+    for index, record in enumerate(records):
+        if record.depth == 0 and record.name == module:
+            start = index
+            while start > 0 and records[start - 1].depth > 0:
+                start -= 1
+            return records[:start], record, records[start:index]
+    return records, None, []
+
+
+def measure_imports(path):
+    """Import the module at path in a fresh interpreter and return its import profile.
+
+    Returns a dict with startup_us (imports done before user code),
+    import_us (cumulative time of importing the module), and records, the
+    ImportRecords nested under the module's import.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    module = os.path.basename(path)[:-3]
+    # __import__ rather than importlib.import_module, which -X importtime doesn't time
+    command = [sys.executable, '-X', 'importtime', '-c', f"__import__({module!r})"]
+    result = subprocess.run(command, cwd=directory, capture_output=True, text=True)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(f"importing {module} failed: {error[-1] if error else result.returncode}")
+
+    startup, own, nested = split_records(parse_importtime(result.stderr), module)
+    return {
+        'startup_us': sum(record.cumulative_us for record in startup if record.depth == 0),
+        'import_us': own.cumulative_us if own else 0,
+        'records': nested + ([own] if own else []),
+    }
+
+
+def measure_startup(repeat=5):
+    """Best wall time, in microseconds, of starting and stopping a bare interpreter."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e6
+
+
+def heaviest(records, top=3):
+    """The top imports by their own time, excluding the module itself."""
+    children = [record for record in records if record.depth > 0]
+    return sorted(children, key=lambda record: record.self_us, reverse=True)[:top]
+
+
+def import_report(tasks):
+    """Measure each distinct module among tasks; returns [(task, profile)]."""
+    rows = []
+    seen = set()
+    for task in tasks:
+        if task.part == 'script' or task.path in seen:
+            continue  # importing a script runs it
+        seen.add(task.path)
+        rows.append((task, measure_imports(task.path)))
+    return rows
+
+
+def format_report(rows, interpreter_us, top=3):
+    """Build a table of startup and import time per module.
+
+    A module is import-bound when importing it takes longer than starting
+    a bare interpreter (interpreter_us); Startup is the share of that spent
+    on the interpreter's own imports.
+    """
+    header = f"{'Year':<6}{'Module':<12}{'Startup':>10}{'Imports':>10}  {'Bound':<9}Heaviest imports (own time)"
+    lines = [f"Interpreter startup: {interpreter_us / 1000:.1f}ms", '', header, '-' * len(header)]
+    for task, profile in rows:
+        startup_ms = profile['startup_us'] / 1000
+        import_ms = profile['import_us'] / 1000
+        bound = 'import' if profile['import_us'] > interpreter_us else 'startup'
+        heavy = ', '.join(f"{record.name} {record.self_us / 1000:.1f}ms"
+                          for record in heaviest(profile['records'], top))
+        lines.append(f"{task.year:<6}{task.name:<12}{startup_ms:>8.1f}ms{import_ms:>8.1f}ms  {bound:<9}{heavy}")
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Report interpreter startup and import time per solution module.")
+    parser.add_argument('years', nargs='*', help="years to include (default: all)")
+    parser.add_argument('-d', '--days', nargs='+', type=int, help="days to include (default: all)")
+    parser.add_argument('--top', type=int, default=3, help="heaviest imports to list per module")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tasks = discover(args.years or None, args.days)
+    print(format_report(import_report(tasks), measure_startup(), args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
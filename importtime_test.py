@@ -0,0 +1,42 @@
+import os
+import unittest
+from aoc import ROOT
+from importtime import heaviest, measure_imports, parse_importtime, split_records
+
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | site
+import time:        50 |         50 |     mmap
+import time:       200 |        250 |   puzzle_input
+import time:       400 |        400 |   parse_cache
+import time:       900 |       1550 | day01
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    def test_parse_importtime(self):
+        """Each line becomes a record with its nesting depth; the header is skipped."""
+        records = parse_importtime(SAMPLE)
+        self.assertEqual([(r.name, r.self_us, r.cumulative_us, r.depth) for r in records][:3],
+                         [('_io', 120, 120, 1), ('site', 300, 420, 0), ('mmap', 50, 50, 2)])
+    
+    def test_split_records(self):
+        """Imports nested under the module are separated from interpreter startup."""
+        startup, own, nested = split_records(parse_importtime(SAMPLE), 'day01')
+        self.assertEqual([r.name for r in startup], ['_io', 'site'])
+        self.assertEqual(own.cumulative_us, 1550)
+        self.assertEqual([r.name for r in nested], ['mmap', 'puzzle_input', 'parse_cache'])
+        self.assertEqual([r.name for r in heaviest(nested, 2)], ['parse_cache', 'puzzle_input'])
+    
+    def test_numpy_is_not_imported_eagerly(self):
+        """Importing a grid day defers numpy until the grid is first used."""
+        profile = measure_imports(os.path.join(ROOT, '2025', 'day04.py'))
+        names = {record.name for record in profile['records']}
+        self.assertIn('grid', names)
+        self.assertNotIn('numpy', names)
+        self.assertGreater(profile['import_us'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
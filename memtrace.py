@@ -0,0 +1,131 @@
+"""Peak-memory instrumentation for solutions, built on tracemalloc.
+
+trace_memory() is a context manager that records the peak bytes allocated
+inside its block, plus the top allocation sites and live block count close
+to that peak. Tests can assert against it directly:
+
+    with trace_memory() as report:
+        solve_both('day08-test.txt')
+    assert report.peak_bytes < 1_000_000
+
+tracemalloc only keeps a running peak total, not what was alive at the
+peak, so a background thread snapshots the traces whenever traced memory
+grows past the last snapshot; the sites reported are from the largest one.
+"""
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+
+class MemoryReport:
+    """What trace_memory() measured; filled in when the block exits."""
+    __slots__ = ('peak_bytes', 'snapshot_bytes', 'blocks', 'top_sites')
+
+    def __init__(self):
+        self.peak_bytes = 0
+        self.snapshot_bytes = 0
+        self.blocks = 0
+        self.top_sites = []  # (location, size in bytes, block count)
+
+    def as_dict(self):
+        return {
+            'peak_bytes': self.peak_bytes,
+            'snapshot_bytes': self.snapshot_bytes,
+            'blocks': self.blocks,
+            'top_sites': list(self.top_sites),
+        }
+
+
+class _PeakSampler(threading.Thread):
+    """Snapshot the traces whenever traced memory grows by more than growth."""
+
+    def __init__(self, interval, growth):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_bytes = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def sample(self):
+        with self._lock:
+            current, _ = tracemalloc.get_traced_memory()
+            if self.snapshot is None or current > self.snapshot_bytes * self.growth:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_bytes = current
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        self.sample()
+
+
+def _site_statistics(snapshot, top):
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    stats = snapshot.statistics('lineno')
+    blocks = sum(stat.count for stat in stats)
+    sites = [(f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size, stat.count)
+             for stat in stats[:top]]
+    return blocks, sites
+
+
+@contextmanager
+def trace_memory(top=10, interval=0.01, growth=1.1):
+    """Trace allocations inside the block and yield a MemoryReport.
+
+    peak_bytes is exact. top_sites and blocks come from the snapshot taken
+    closest to the peak; pass top=0 to skip snapshots and only measure the peak.
+    """
+    report = MemoryReport()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    sampler = None
+    if top:
+        sampler = _PeakSampler(interval, growth)
+        sampler.start()
+
+    try:
+        yield report
+    finally:
+        if sampler:
+            sampler.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        report.peak_bytes = max(0, peak - baseline)
+        if sampler and sampler.snapshot is not None:
+            report.snapshot_bytes = max(0, sampler.snapshot_bytes - baseline)
+            report.blocks, report.top_sites = _site_statistics(sampler.snapshot, top)
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def format_size(size):
+    """Human-readable byte count."""
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_report(report):
+    """Describe a MemoryReport (or its as_dict() form) as text."""
+    if isinstance(report, MemoryReport):
+        report = report.as_dict()
+    lines = [f"peak {format_size(report['peak_bytes'])}, "
+             f"{report['blocks']} blocks live near peak ({format_size(report['snapshot_bytes'])})"]
+    for location, size, count in report['top_sites']:
+        lines.append(f"  {format_size(size):>10}  {count:>9} blocks  {location}")
+    return '\n'.join(lines)
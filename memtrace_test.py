@@ -0,0 +1,55 @@
+import os
+import tracemalloc
+import unittest
+from aoc import ROOT, load_module
+from memtrace import trace_memory, format_report
+
+
+def allocate(n):
+    return [bytearray(1000) for _ in range(n)]
+
+
+class TestTraceMemory(unittest.TestCase):
+    def test_peak_covers_block_allocations(self):
+        """Peak includes memory freed before the block exits."""
+        with trace_memory() as report:
+            data = allocate(2000)
+            del data
+        self.assertGreaterEqual(report.peak_bytes, 2_000_000)
+    
+    def test_top_site_is_the_allocating_line(self):
+        """The biggest allocation site points at the line that allocated."""
+        with trace_memory(interval=0.001) as report:
+            data = allocate(5000)
+        location, size, count = report.top_sites[0]
+        self.assertIn('memtrace_test.py', location)
+        self.assertGreaterEqual(count, 5000)
+        self.assertGreaterEqual(report.blocks, 5000)
+        self.assertIn('blocks', format_report(report))
+        del data
+    
+    def test_peak_only(self):
+        """top=0 measures the peak without taking snapshots."""
+        with trace_memory(top=0) as report:
+            allocate(100)
+        self.assertGreater(report.peak_bytes, 100_000)
+        self.assertEqual(report.top_sites, [])
+    
+    def test_stops_tracing(self):
+        """Tracing is switched off again unless it was already on."""
+        with trace_memory():
+            pass
+        self.assertFalse(tracemalloc.is_tracing())
+    
+    def test_day08_memory_budget(self):
+        """day08 on the test input stays well under a megabyte."""
+        day08 = load_module(os.path.join(ROOT, '2025', 'day08.py'))
+        # Warm up first so the one-off lazy numpy import isn't counted
+        day08.solve_both('day08-test.txt', num_connections=10)
+        with trace_memory() as report:
+            day08.solve_both('day08-test.txt', num_connections=10)
+        self.assertLess(report.peak_bytes, 1_000_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Profile a solution under cProfile or a lightweight stack sampler.
+
+Both modes write a collapsed-stack file, one "frame;frame;frame count" line
+per distinct stack, that flamegraph.pl, inferno and speedscope read
+directly. cProfile mode also writes the raw .prof file and a pstats
+summary sorted by own time, so hot functions like day12's try_fit_presents
+or day08's connect_closest show up at the top.
+
+The sampler uses SIGPROF, so it only works on Unix and only samples the
+main thread, but its overhead is small enough for the slowest days.
+"""
+import cProfile
+import io
+import os
+import pstats
+import signal
+import sys
+from collections import Counter, defaultdict
+
+
+MODES = ('cprofile', 'sample')
+
+
+def frame_label(filename, lineno, name):
+    """Label a function as file:function:line."""
+    if filename == '~':
+        return name  # built-ins have no file
+    return f"{os.path.basename(filename)}:{name}:{lineno}"
+
+
+class StackSampler:
+    """Count the Python call stacks seen on every SIGPROF tick.
+
+    Stacks are recorded from root_frame (exclusive) down to the running
+    frame, so the caller's own frames don't appear in the output.
+    """
+
+    def __init__(self, interval=0.001, root_frame=None):
+        if not hasattr(signal, 'setitimer'):
+            raise RuntimeError("stack sampling needs signal.setitimer, which this platform lacks")
+        self.interval = interval
+        self.root_frame = root_frame
+        self.counts = Counter()
+        self._previous_handler = None
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None and frame is not self.root_frame:
+            code = frame.f_code
+            stack.append(frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        if stack:
+            self.counts[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def collapse_pstats(stats, min_weight=1):
+    """Turn cProfile results into collapsed stacks weighted in microseconds.
+
+    cProfile only records caller/callee edges, not whole stacks, so each
+    function's time is split between its callers in proportion to the
+    cumulative time spent through each edge. Recursive edges are cut.
+    """
+    entries = stats.stats
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, caller_stats in callers.items():
+            callees[caller].append((func, caller_stats[3]))
+
+    counts = Counter()
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    pending = [(root, (), 1.0) for root in roots]
+
+    while pending:
+        func, path, share = pending.pop()
+        own_time, cumulative = entries[func][2], entries[func][3]
+        path = path + (func,)
+        weight = int(own_time * share * 1e6)
+        if weight >= min_weight:
+            counts[';'.join(frame_label(*f) for f in path)] += weight
+
+        for callee, edge_time in callees[func]:
+            callee_cumulative = entries[callee][3]
+            if callee in path or callee_cumulative <= 0:
+                continue
+            callee_share = share * edge_time / callee_cumulative
+            if callee_cumulative * callee_share * 1e6 >= min_weight:
+                pending.append((callee, path, callee_share))
+
+    return counts
+
+
+def write_collapsed(counts, path):
+    """Write collapsed stacks, heaviest first."""
+    with open(path, 'w') as f:
+        for stack, count in counts.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+def pstats_summary(stats, sort='tottime', limit=40):
+    """Return the pstats table sorted by sort, limited to limit rows."""
+    output = io.StringIO()
+    stats.stream = output
+    stats.sort_stats(sort).print_stats(limit)
+    return output.getvalue()
+
+
+def sampled_summary(counts, limit=40):
+    """Own and total sample counts per function, in the style of a pstats table."""
+    own = Counter()
+    total = Counter()
+    for stack, count in counts.items():
+        frames = stack.split(';')
+        own[frames[-1]] += count
+        for label in set(frames):
+            total[label] += count
+
+    samples = sum(counts.values())
+    lines = [f"{samples} samples", '', f"{'own':>8}{'own%':>8}{'total':>8}{'total%':>8}  function"]
+    for label, count in own.most_common(limit):
+        lines.append(f"{count:>8}{100 * count / samples:>7.1f}%{total[label]:>8}"
+                     f"{100 * total[label] / samples:>7.1f}%  {label}")
+    return '\n'.join(lines) + '\n'
+
+
+def profile_call(func, output_prefix, mode='cprofile', interval=0.001):
+    """Run func() under the chosen profiler and write its reports.
+
+    Writes output_prefix + '.collapsed' and '.txt' (plus '.prof' for
+    cProfile) and returns (func's result, list of paths written).
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown profile mode {mode!r}, expected one of {MODES}")
+    os.makedirs(os.path.dirname(output_prefix) or '.', exist_ok=True)
+    paths = []
+
+    if mode == 'cprofile':
+        profile = cProfile.Profile()
+        result = profile.runcall(func)
+        profile.dump_stats(output_prefix + '.prof')
+        paths.append(output_prefix + '.prof')
+        stats = pstats.Stats(profile)
+        counts = collapse_pstats(stats)
+        summary = pstats_summary(stats)
+    else:
+        with StackSampler(interval, root_frame=sys._getframe()) as sampler:
+            result = func()
+        counts = sampler.counts
+        summary = sampled_summary(counts)
+
+    write_collapsed(counts, output_prefix + '.collapsed')
+    with open(output_prefix + '.txt', 'w') as f:
+        f.write(summary)
+    paths += [output_prefix + '.collapsed', output_prefix + '.txt']
+
+    return result, paths
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from aoc import ROOT, run_task
+from profiler import profile_call, sampled_summary
+
+
+def busy(n):
+    total = 0
+    for i in range(n):
+        total += inner(i)
+    return total
+
+
+def inner(i):
+    return sum(range(i % 50))
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.prefix = os.path.join(self.tmp.name, 'busy')
+    
+    def read(self, path):
+        with open(path, 'r') as f:
+            return f.read()
+    
+    def test_cprofile_reports(self):
+        """cProfile mode writes .prof, a pstats summary and collapsed stacks."""
+        result, paths = profile_call(lambda: busy(20000), self.prefix, 'cprofile')
+        self.assertEqual(result, busy(20000))
+        self.assertEqual(sorted(os.path.splitext(p)[1] for p in paths), ['.collapsed', '.prof', '.txt'])
+        self.assertIn('inner', self.read(self.prefix + '.txt'))
+        collapsed = self.read(self.prefix + '.collapsed')
+        self.assertIn('profiler_test.py:busy:', collapsed)
+        self.assertIn(';profiler_test.py:inner:', collapsed)
+    
+    def test_collapsed_lines_are_well_formed(self):
+        """Every collapsed line is a stack followed by a positive count."""
+        profile_call(lambda: busy(20000), self.prefix, 'cprofile')
+        for line in self.read(self.prefix + '.collapsed').splitlines():
+            stack, count = line.rsplit(' ', 1)
+            self.assertTrue(stack)
+            self.assertGreater(int(count), 0)
+    
+    def test_sampler_reports(self):
+        """The sampler attributes samples to the functions that ran."""
+        result, paths = profile_call(lambda: busy(300000), self.prefix, 'sample', interval=0.0005)
+        self.assertEqual(result, busy(300000))
+        collapsed = self.read(self.prefix + '.collapsed')
+        self.assertIn('profiler_test.py:busy:', collapsed)
+        self.assertNotIn('profile_call', collapsed)
+        self.assertIn('samples', self.read(self.prefix + '.txt'))
+    
+    def test_sampled_summary(self):
+        """Own and total counts are attributed per function."""
+        summary = sampled_summary({'a;b': 3, 'a': 1})
+        self.assertIn('4 samples', summary)
+        self.assertIn('75.0%  b', summary)
+    
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            profile_call(lambda: None, self.prefix, 'perf')
+    
+    def test_runner_profiles_a_day(self):
+        """aoc.run_task writes the reports for the profiled day."""
+        answer, _, error, _ = run_task(os.path.join(ROOT, '2025', 'day07.py'), 'solve_both',
+                                       profile='cprofile', profile_dir=self.tmp.name)
+        self.assertIsNone(error)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, '2025-day07-both.collapsed')))
+        self.assertIn('trace_beams', self.read(os.path.join(self.tmp.name, '2025-day07-both.txt')))
+
+
+if __name__ == '__main__':
+    unittest.main()